@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # L'ordre compte : le cache doit être invalidé avant de re-matérialiser
+        from . import cache, images, materialize, metrics, search, signals, stats, tags  # noqa: F401 - enregistre les receivers
+        signals.connect()
+        images.connect()
+        stats.connect()
+        search.connect()
+        tags.connect()
+        metrics.connect()
@@ -0,0 +1,99 @@
+"""
+Rétention des messages : archivage des messages lus anciens.
+
+Les messages lus plus vieux que ``MESSAGE_RETENTION_DAYS`` sont déplacés de
+``api_message`` vers ``api_message_archive`` par lots, chacun dans sa propre
+courte transaction (copie puis suppression), pour ne jamais verrouiller la
+table vive longtemps. Les archives restent consultables et restaurables par
+l'endpoint d'administration ``/api/archived-messages/``.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from . import stats
+from .models import ArchivedMessage, Message
+from .signals import batch_changes, notify
+
+
+FIELDS = ('name', 'email', 'subject', 'message', 'created_at')
+
+
+def cutoff(days=None):
+    days = settings.MESSAGE_RETENTION_DAYS if days is None else days
+    return timezone.now() - timedelta(days=days)
+
+
+def archivable(before):
+    return Message.objects.filter(read=True, created_at__lt=before)
+
+
+def archive_chunk(before, chunk_size):
+    """Archive au plus ``chunk_size`` messages ; retourne le nombre déplacé."""
+    with transaction.atomic():
+        rows = list(
+            archivable(before).select_for_update().order_by('created_at', 'id').values('id', *FIELDS)[:chunk_size]
+        )
+        if not rows:
+            return 0
+        ids = [row.pop('id') for row in rows]
+        ArchivedMessage.objects.bulk_create(
+            [ArchivedMessage(original_id=pk, **row) for pk, row in zip(ids, rows)],
+            ignore_conflicts=True,  # Déjà copié par une exécution interrompue
+        )
+        # DELETE direct, sans le collecteur : pas de cascade à suivre, et un
+        # signal post_delete par ligne coûterait une mise à jour des compteurs par message
+        table = connection.ops.quote_name(Message._meta.db_table)
+        column = connection.ops.quote_name(Message._meta.pk.column)
+        # Nombre de paramètres par requête borné par la base (999 sur les vieux SQLite)
+        step = connection.ops.bulk_batch_size([Message._meta.pk], ids)
+        with connection.cursor() as cursor:
+            for start in range(0, len(ids), step):
+                batch = ids[start:start + step]
+                cursor.execute(f'DELETE FROM {table} WHERE {column} IN ({", ".join(["%s"] * len(batch))})', batch)
+        # Aucun signal n'a été émis : compteurs et invalidation du cache appliqués ici
+        stats.apply(messages=-len(ids))
+        notify(Message)
+    return len(ids)
+
+
+def archive(days=None, chunk_size=500, pause=0.0, dry_run=False):
+    """Archive tous les messages éligibles, lot par lot ; retourne le nombre déplacé."""
+    before = cutoff(days)
+    if dry_run:
+        return archivable(before).count()
+    total = 0
+    with batch_changes():
+        while True:
+            moved = archive_chunk(before, chunk_size)
+            total += moved
+            if moved < chunk_size:
+                break
+            if pause:
+                time.sleep(pause)  # Laisse passer les autres écrivains (SQLite)
+    return total
+
+
+def restore(archived_messages):
+    """Remet des messages archivés dans ``api_message`` (lus) ; retourne les messages recréés."""
+    archived_messages = list(archived_messages)
+    if not archived_messages:
+        return []
+    with transaction.atomic():
+        created = Message.objects.bulk_create([
+            Message(read=True, **{field: getattr(archived, field) for field in FIELDS})
+            for archived in archived_messages
+        ])
+        # auto_now_add a remplacé la date d'origine
+        if all(message.pk is not None for message in created):
+            for message, archived in zip(created, archived_messages):
+                message.created_at = archived.created_at
+            Message.objects.bulk_update(created, ['created_at'])
+        ArchivedMessage.objects.filter(pk__in=[archived.pk for archived in archived_messages]).delete()
+        stats.apply(messages=len(created))
+        notify(Message)
+    return created
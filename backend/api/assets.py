@@ -0,0 +1,170 @@
+"""
+Stockage adressé par contenu des images et du CV.
+
+Les data URIs envoyés par le frontend sont décodés une seule fois, écrits sur
+disque sous leur empreinte SHA-256 et remplacés en base par une courte
+référence (``/api/assets/<sha256>.<ext>``) servie par la vue ``asset``.
+"""
+
+import base64
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from urllib.parse import unquote_to_bytes
+
+from django.conf import settings
+
+
+ASSET_URL_PREFIX = '/api/assets/'
+
+ASSET_NAME_RE = re.compile(r'^(?P<digest>[0-9a-f]{64})(?P<ext>\.[a-z0-9]+)?$')
+DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+VARIANT_RE = re.compile(r'^\d+\.[a-z0-9]+$')
+
+DATA_URI_RE = re.compile(
+    r'^data:(?P<mime>[\w.+-]+/[\w.+-]+)?(?P<params>(?:;[^;,]*)*?)(?P<base64>;base64)?,',
+    re.IGNORECASE,
+)
+
+# Types acceptés : images matricielles et PDF. Tout le reste (HTML, SVG...) serait
+# servi depuis l'origine de l'API et pourrait y exécuter du script
+EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'application/pdf': '.pdf',
+}
+
+CONTENT_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.pdf': 'application/pdf',
+}
+
+
+def is_data_uri(value):
+    return isinstance(value, str) and value[:5].lower() == 'data:'
+
+
+def is_asset_ref(value):
+    return isinstance(value, str) and value.startswith(ASSET_URL_PREFIX)
+
+
+def parse_data_uri(value):
+    """Retourne ``(mime, contenu)`` ; lève ``ValueError`` si le data URI est invalide."""
+    match = DATA_URI_RE.match(value)
+    if not match:
+        raise ValueError('Invalid data URI')
+    mime = (match.group('mime') or 'text/plain').lower()
+    payload = value[match.end():]
+    if match.group('base64'):
+        try:
+            # Strict : tout caractère hors alphabet base64 est refusé, seuls les retours à la ligne sont tolérés
+            content = base64.b64decode(re.sub(r'\s+', '', payload), validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise ValueError('Invalid base64 payload') from exc
+    else:
+        content = unquote_to_bytes(payload)
+    return mime, content
+
+
+def asset_root():
+    return Path(settings.ASSETS_ROOT)
+
+
+def asset_path(name):
+    match = ASSET_NAME_RE.match(name)
+    if not match:
+        raise ValueError(f'Invalid asset name: {name}')
+    return asset_root() / match.group('digest')[:2] / name
+
+
+def variant_path(digest, variant):
+    """Chemin d'une déclinaison (``<largeur>.<ext>``) de l'asset ``digest``."""
+    if not DIGEST_RE.match(digest) or not VARIANT_RE.match(variant):
+        raise ValueError(f'Invalid asset variant: {digest}/{variant}')
+    return asset_root() / digest[:2] / digest / variant
+
+
+def asset_name(ref):
+    """Nom de fichier de l'asset référencé par ``ref``, ou ``None``."""
+    if not is_asset_ref(ref):
+        return None
+    name = ref[len(ASSET_URL_PREFIX):]
+    return name if ASSET_NAME_RE.match(name) else None
+
+
+def asset_digest(ref):
+    name = asset_name(ref)
+    return ASSET_NAME_RE.match(name).group('digest') if name else None
+
+
+def extension_for(mime):
+    """Extension du type ``mime`` ; lève ``ValueError`` s'il n'est pas accepté."""
+    try:
+        return EXTENSIONS[mime]
+    except KeyError:
+        raise ValueError(f'Unsupported asset type: {mime}') from None
+
+
+def write_atomic(path, content):
+    """Écrit ``content`` dans ``path`` via un fichier temporaire renommé."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def store_bytes(content, mime):
+    """Écrit ``content`` dans le magasin (une seule fois) et retourne son nom."""
+    name = hashlib.sha256(content).hexdigest() + extension_for(mime)
+    path = asset_path(name)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, content)
+    return name
+
+
+def store_data_uri(value):
+    """Stocke un data URI et retourne la référence à enregistrer en base ; lève ``ValueError`` si invalide ou non accepté."""
+    mime, content = parse_data_uri(value)
+    return ASSET_URL_PREFIX + store_bytes(content, mime)
+
+
+def content_type(name):
+    """Type servi pour ``name`` ; ``None`` si son extension n'est pas acceptée."""
+    return CONTENT_TYPES.get(os.path.splitext(name)[1])
+
+
+def to_data_uri(ref):
+    """Reconstruit le data URI d'origine (mode de compatibilité)."""
+    name = asset_name(ref)
+    if not name:
+        return ref
+    try:
+        content = asset_path(name).read_bytes()
+    except FileNotFoundError:
+        return ref
+    return f"data:{content_type(name) or 'application/octet-stream'};base64," + base64.b64encode(content).decode('ascii')
+
+
+def public_url(ref, request=None):
+    """URL absolue d'un asset, préfixée par ``API_PUBLIC_URL`` si configuré."""
+    base = getattr(settings, 'API_PUBLIC_URL', '')
+    if base:
+        return base.rstrip('/') + ref
+    if request is not None:
+        return request.build_absolute_uri(ref)
+    return ref
@@ -0,0 +1,119 @@
+"""
+Lectures asynchrones pour le déploiement ASGI (``portfolio/asgi.py``).
+
+Avec ``ASYNC_READS=True``, les routes du routeur sont enveloppées par
+``async_urls`` : un ``GET``/``HEAD`` public est servi par ``alist`` /
+``aretrieve`` du viewset (ORM asynchrone, mêmes serializers, cache, ETag et
+fieldsets partiels que ``list``/``retrieve``) sans occuper de thread pendant
+l'attente de la base. Les écritures, les vues protégées, l'API navigable et
+les actions sans variante asynchrone passent par la vue DRF synchrone
+habituelle.
+"""
+
+import asyncio
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.http import Http404
+from django.urls import URLPattern
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+
+READ_METHODS = ('GET', 'HEAD')
+
+
+class AsyncReadMixin:
+    """``alist``/``aretrieve`` asynchrones pour les ``ModelViewSet``."""
+
+    async_actions = ('list', 'retrieve')
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer([obj async for obj in queryset], many=True).data)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return Response(self.get_serializer(await self.aget_object()).data)
+
+    async def aget_object(self, queryset=None):
+        if queryset is None:
+            queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            return await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (ObjectDoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+
+
+def is_public(viewset):
+    return all(permission is AllowAny for permission in viewset.permission_classes)
+
+
+async def dispatch(view, request, *args, **kwargs):
+    """
+    Équivalent asynchrone de ``APIView.dispatch`` pour une lecture publique ;
+    ``None`` si la requête doit passer par la vue synchrone.
+    """
+    self = view.cls(**view.initkwargs)
+    self.action_map = dict(view.actions, head=view.actions['get'])
+    self.args, self.kwargs = args, kwargs
+    self.request = request
+    request = self.initialize_request(request, *args, **kwargs)
+    self.request = request
+    self.headers = self.default_response_headers
+    try:
+        # ``initial()`` sans authentification, permissions ni limitation :
+        # vue publique (AllowAny) et lectures jamais limitées
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+        request.accepted_renderer, request.accepted_media_type = self.perform_content_negotiation(request)
+        if request.accepted_renderer.format != 'json':
+            return None  # API navigable : rendu synchrone
+        request.version, request.versioning_scheme = self.determine_version(request, *args, **kwargs)
+        response = await getattr(self, 'a' + self.action)(request, *args, **kwargs)
+    except Exception as exc:
+        response = self.handle_exception(exc)
+    self.response = self.finalize_response(request, response, *args, **kwargs)
+    return self.response
+
+
+def as_async_view(view):
+    """Vue asynchrone pour ``view`` (vue de routeur), ou ``view`` si rien à gagner."""
+    viewset = getattr(view, 'cls', None)
+    action = (getattr(view, 'actions', None) or {}).get('get')
+    if action not in getattr(viewset, 'async_actions', ()) or not is_public(viewset):
+        return view
+    sync_view = sync_to_async(view)
+
+    async def async_view(request, *args, **kwargs):
+        response = None
+        if request.method in READ_METHODS:
+            response = await dispatch(view, request, *args, **kwargs)
+        if response is None:
+            response = await sync_view(request, *args, **kwargs)
+        return response
+
+    async_view.cls, async_view.actions, async_view.initkwargs = viewset, view.actions, view.initkwargs
+    async_view.csrf_exempt = True
+    return async_view
+
+
+def call_view(match, request):
+    """
+    Appelle depuis du code synchrone la vue résolue ``match`` (lots,
+    matérialisation, préchauffage) : en mode ASGI elle peut être asynchrone.
+    """
+    if asyncio.iscoroutinefunction(match.func):
+        return async_to_sync(match.func)(request, *match.args, **match.kwargs)
+    return match.func(request, *match.args, **match.kwargs)
+
+
+def async_urls(urlpatterns):
+    """Copie de ``urlpatterns`` (ex. ``router.urls``) avec les lectures asynchrones."""
+    return [
+        URLPattern(pattern.pattern, as_async_view(pattern.callback), pattern.default_args, pattern.name)
+        if isinstance(pattern, URLPattern) else pattern
+        for pattern in urlpatterns
+    ]
@@ -0,0 +1,105 @@
+"""
+Exécution groupée d'opérations sur les viewsets du routeur (``/api/batch/``).
+
+Chaque opération (``{"method", "resource", "id", "data"}``) est rejouée comme
+une sous-requête vers la route du viewset : mêmes serializers, permissions et
+limitation. Toutes les opérations s'exécutent dans un seul ``atomic()`` et
+sous ``batch_changes()``, donc une seule invalidation de cache par modèle
+touché.
+
+Par défaut (``"atomic": true``) la première opération en échec annule tout le
+lot et les suivantes ne sont pas exécutées ; avec ``"atomic": false`` chaque
+opération a son propre savepoint et seules celles en échec sont annulées.
+"""
+
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.urls import Resolver404, resolve
+
+from .async_views import call_view
+from .signals import batch_changes
+
+
+METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')
+
+RESOURCES = ('profile', 'projects', 'education', 'certifications', 'messages', 'stats')
+
+# En-têtes repris de la requête du lot (authentification, IP pour la limitation)
+FORWARDED_META = ('HTTP_AUTHORIZATION', 'HTTP_COOKIE', 'HTTP_X_FORWARDED_FOR', 'REMOTE_ADDR', 'HTTP_HOST')
+
+
+class BatchError(ValueError):
+    pass
+
+
+def parse_operation(index, operation):
+    if not isinstance(operation, dict):
+        raise BatchError(f'operations[{index}]: expected an object')
+    method = str(operation.get('method', '')).upper()
+    if method not in METHODS:
+        raise BatchError(f'operations[{index}].method: expected one of {", ".join(METHODS)}')
+    resource = operation.get('resource')
+    if resource not in RESOURCES:
+        raise BatchError(f'operations[{index}].resource: expected one of {", ".join(RESOURCES)}')
+    pk = operation.get('id')
+    if method in ('PUT', 'PATCH', 'DELETE') and pk in (None, ''):
+        raise BatchError(f'operations[{index}].id: required for {method}')
+    path = f'/api/{resource}/' + (f'{pk}/' if pk not in (None, '') else '')
+    return method, path, operation.get('data')
+
+
+def subrequest(request, method, path, data):
+    """Requête équivalente à ``method path`` pour le même client."""
+    from django.test import RequestFactory
+
+    body = json.dumps(data) if data is not None else ''
+    sub = RequestFactory().generic(method, path, body, content_type='application/json')
+    for key in FORWARDED_META:
+        if key in request.META:
+            sub.META[key] = request.META[key]
+    # Déjà authentifié (et vérifié CSRF) par la requête du lot
+    sub.user = request.user
+    sub._dont_enforce_csrf_checks = True
+    # Écritures annulables par le rollback du lot : pas de file d'attente des messages
+    sub.batched = True
+    return sub
+
+
+def dispatch(request, method, path, data):
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return {'status': 404, 'data': {'error': 'Not found'}}
+    sub = subrequest(request, method, path, data)
+    # Route du motif (et non chemin) : un seul seau de limitation pour tous les objets
+    sub.resolver_match = match
+    response = call_view(match, sub)
+    return {'status': response.status_code, 'data': getattr(response, 'data', None)}
+
+
+def run(request, operations, atomic=True):
+    """Exécute ``operations`` ; retourne ``(validé, résultats)``."""
+    if not isinstance(operations, list) or not operations:
+        raise BatchError('operations: expected a non-empty list')
+    if len(operations) > settings.BATCH_MAX_OPERATIONS:
+        raise BatchError(f'operations: at most {settings.BATCH_MAX_OPERATIONS} per batch')
+    parsed = [parse_operation(index, operation) for index, operation in enumerate(operations)]
+
+    results = []
+    failed = False
+    with transaction.atomic(), batch_changes():
+        for method, path, data in parsed:
+            if failed and atomic:
+                results.append({'status': None, 'data': None, 'skipped': True})
+                continue
+            with transaction.atomic():
+                result = dispatch(request, method, path, data)
+                if result['status'] >= 400:
+                    failed = True
+                    transaction.set_rollback(True)
+            results.append(result)
+        if failed and atomic:
+            transaction.set_rollback(True)
+    return not (failed and atomic), results
@@ -0,0 +1,176 @@
+"""
+Cache des réponses de lecture publiques.
+
+Les clés combinent le chemin, les paramètres de requête et un compteur de
+génération par modèle. Chaque modification d'un modèle incrémente son compteur
+(via ``signals.content_changed``) : les anciennes entrées ne sont plus jamais
+lues et expirent d'elles-mêmes. Le backend est l'alias ``api`` de ``CACHES``
+(mémoire locale, fichiers ou store partagé).
+"""
+
+import asyncio
+import functools
+import hashlib
+import time
+
+from django.core.cache import caches
+from django.dispatch import receiver
+from rest_framework.response import Response
+
+from .signals import content_changed
+
+
+CACHE_ALIAS = 'api'
+GENERATION_KEY = 'api:gen:{}'
+HITS_KEY = 'api:stats:hits'
+MISSES_KEY = 'api:stats:misses'
+
+
+def get_cache():
+    return caches[CACHE_ALIAS]
+
+
+def generation_key(model):
+    return GENERATION_KEY.format(model._meta.label_lower)
+
+
+def get_generations(models):
+    """Compteurs de génération courants de ``models`` (une seule lecture)."""
+    cache = get_cache()
+    keys = [generation_key(model) for model in models]
+    values = cache.get_many(keys)
+    for key in keys:
+        if key not in values:
+            # Compteur absent (premier démarrage ou éviction) : partir d'une
+            # valeur jamais utilisée pour ne pas retomber sur d'anciennes entrées.
+            cache.add(key, time.time_ns(), timeout=None)
+            values[key] = cache.get(key)
+    return tuple(values[key] for key in keys)
+
+
+def bump_generation(model):
+    cache = get_cache()
+    key = generation_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+@receiver(content_changed)
+def invalidate(sender, **kwargs):
+    bump_generation(sender)
+
+
+def record(hit):
+    cache = get_cache()
+    key = HITS_KEY if hit else MISSES_KEY
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def get_stats():
+    values = get_cache().get_many([HITS_KEY, MISSES_KEY])
+    hits, misses = values.get(HITS_KEY, 0), values.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hitRate': round(hits / total, 4) if total else None,
+        'backend': type(get_cache()).__name__,
+    }
+
+
+def response_key(request, models):
+    generations = get_generations(models)
+    params = sorted(request.GET.lists())
+    raw = f'{generations}|{request.get_host()}|{request.path}|{params}'
+    return 'api:resp:' + hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def cached(request, models, render):
+    """Réponse en cache pour ``request``, sinon ``render()`` (mise en cache si 200)."""
+    cache = get_cache()
+    key = response_key(request, models)
+    data = cache.get(key)
+    if data is not None:
+        record(hit=True)
+        response = Response(data)
+        response['X-Cache'] = 'HIT'
+        return response
+    record(hit=False)
+    response = render()
+    if response.status_code == 200:
+        cache.set(key, response.data)
+    response['X-Cache'] = 'MISS'
+    return response
+
+
+async def acached(request, models, render):
+    """Variante de ``cached`` pour un ``render`` asynchrone."""
+    cache = get_cache()
+    key = response_key(request, models)
+    data = cache.get(key)
+    if data is not None:
+        record(hit=True)
+        response = Response(data)
+        response['X-Cache'] = 'HIT'
+        return response
+    record(hit=False)
+    response = await render()
+    if response.status_code == 200:
+        cache.set(key, response.data)
+    response['X-Cache'] = 'MISS'
+    return response
+
+
+def cache_response(method):
+    """
+    Met en cache les réponses 200 de ``method`` (list/retrieve d'un viewset
+    déclarant ``cache_models``, ou leurs variantes ``async``). Ajoute
+    l'en-tête ``X-Cache: HIT|MISS``.
+    """
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, request, *args, **kwargs):
+            return await acached(request, self.cache_models, lambda: method(self, request, *args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        return cached(request, self.cache_models, lambda: method(self, request, *args, **kwargs))
+    return wrapper
+
+
+def cache_view(*models):
+    """Équivalent de ``cache_response`` pour une vue fonction (sous ``@api_view``)."""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            return cached(request, models, lambda: view(request, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+class CachedResponseMixin:
+    """Cache de ``list``/``retrieve`` pour les ``ModelViewSet`` publics."""
+
+    cache_models = ()
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @cache_response
+    async def alist(self, request, *args, **kwargs):
+        return await super().alist(request, *args, **kwargs)
+
+    @cache_response
+    async def aretrieve(self, request, *args, **kwargs):
+        return await super().aretrieve(request, *args, **kwargs)
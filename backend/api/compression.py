@@ -0,0 +1,118 @@
+"""
+Compression négociée (brotli / gzip) des réponses JSON.
+
+``CompressionMiddleware`` compresse les réponses 200 de plus de
+``COMPRESSION_MIN_SIZE`` octets selon ``Accept-Encoding``. Les corps
+compressés sont gardés dans le cache ``compressed`` sous l'empreinte du corps
+en clair : une lecture répétée du même contenu ne recompresse rien. Les
+réponses déjà compressées ou en flux (fichiers matérialisés, assets) passent
+telles quelles.
+"""
+
+import gzip
+import hashlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+from .materialize import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+
+CACHE_ALIAS = 'compressed'
+
+# Seul le JSON de l'API est compressé : pas de page HTML (admin) portant un
+# jeton CSRF exposé à BREACH
+COMPRESSIBLE = _lazy_re_compile(r'^application/(.+\+)?json\b')
+
+
+def compress(content, encoding):
+    if encoding == 'br':
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    # mtime=0 : même entrée, mêmes octets
+    return gzip.compress(content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def negotiate(request):
+    """Encodage préféré accepté par le client, ou ``None``."""
+    accepted = accepted_encodings(request)
+    if 'br' in accepted and brotli is not None:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def cache_key(response, encoding):
+    # Empreinte du contenu, pas l'ETag : un ETag de liste (max(updated_at), nombre de
+    # lignes) ne change pas quand seules des déclinaisons d'images apparaissent
+    digest = hashlib.sha1(response.content)
+    # Content-Type haché avec le corps : ses espaces sont refusés dans une clé memcached
+    digest.update(response.get('Content-Type', '').encode('latin-1'))
+    return f'{encoding}:{digest.hexdigest()}'
+
+
+def compressed_content(response, encoding):
+    cache = caches[CACHE_ALIAS]
+    key = cache_key(response, encoding)
+    content = cache.get(key)
+    if content is None:
+        content = compress(response.content, encoding)
+        cache.set(key, content)
+    return content
+
+
+class CompressionMiddleware:
+    """Compresse les réponses JSON selon ``Accept-Encoding``."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.COMPRESS_RESPONSES:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if (
+            response.status_code != 200
+            or response.streaming
+            or response.has_header('Content-Encoding')
+            or not COMPRESSIBLE.match(response.get('Content-Type', ''))
+            or 'no-transform' in response.get('Cache-Control', '')
+        ):
+            return response
+        # Vary même sous le seuil : un cache partagé ne doit pas mélanger les variantes
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        encoding = negotiate(request)
+        if encoding is None:
+            return response
+
+        response.content = compressed_content(response, encoding)
+        response['Content-Length'] = str(len(response.content))
+        response['Content-Encoding'] = encoding
+        # Octets différents de la version identité : l'ETag fort devient faible
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
@@ -0,0 +1,135 @@
+"""
+GET conditionnels (ETag / Last-Modified / 304).
+
+Le validateur d'une ressource ou d'une collection est ``(max(updated_at),
+nombre de lignes)``, obtenu par une seule requête d'agrégat puis mémorisé dans
+le cache ``api`` sous la génération courante du modèle. Une requête
+``If-None-Match``/``If-Modified-Since`` à jour reçoit un 304 avant toute
+sérialisation.
+"""
+
+import asyncio
+import functools
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .cache import get_cache, response_key
+
+
+AGGREGATES = {'last_modified': Max('updated_at'), 'count': Count('pk')}
+
+
+def collection_validator(queryset):
+    result = queryset.order_by().aggregate(**AGGREGATES)
+    return result['last_modified'], result['count']
+
+
+async def acollection_validator(queryset):
+    result = await queryset.order_by().aaggregate(**AGGREGATES)
+    return result['last_modified'], result['count']
+
+
+def make_etag(request, last_modified, count):
+    params = sorted(request.GET.lists())
+    raw = f'{request.get_host()}|{request.path}|{params}|{last_modified.isoformat() if last_modified else ""}|{count}'
+    return 'W/"%s"' % hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def evaluate(request, validator):
+    """``(etag, timestamp, réponse 304 ou None)`` pour le validateur courant."""
+    last_modified, count = validator
+    etag = make_etag(request, last_modified, count)
+    # Une suppression ne change pas max(updated_at) : Last-Modified n'est
+    # fiable que pour un objet unique, l'ETag couvre les collections.
+    timestamp = int(last_modified.timestamp()) if last_modified and count <= 1 else None
+    not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+    return etag, timestamp, not_modified
+
+
+def add_validators(response, etag, timestamp):
+    if response.status_code == 200:
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+    return response
+
+
+def conditional_response(method):
+    """
+    Répond 304 si le client possède déjà la version courante ; sinon ajoute
+    ``ETag`` (et ``Last-Modified`` pour un objet unique) à la réponse 200.
+    Accepte aussi les variantes ``async`` (``alist``/``aretrieve``).
+    """
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, request, *args, **kwargs):
+            cache = get_cache()
+            key = response_key(request, self.cache_models) + ':validator'
+            validator = cache.get(key)
+            if validator is None:
+                validator = await self.aget_validator(request, kwargs.get('pk'))
+                cache.set(key, validator)
+            etag, timestamp, not_modified = evaluate(request, validator)
+            if not_modified is not None:
+                return not_modified
+            return add_validators(await method(self, request, *args, **kwargs), etag, timestamp)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        cache = get_cache()
+        key = response_key(request, self.cache_models) + ':validator'
+        validator = cache.get(key)
+        if validator is None:
+            validator = self.get_validator(request, kwargs.get('pk'))
+            cache.set(key, validator)
+        etag, timestamp, not_modified = evaluate(request, validator)
+        if not_modified is not None:
+            return not_modified
+        return add_validators(method(self, request, *args, **kwargs), etag, timestamp)
+    return wrapper
+
+
+class ConditionalGetMixin:
+    """GET conditionnels pour ``list``/``retrieve`` des ``ModelViewSet``."""
+
+    def get_validator_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def object_validator_queryset(self, pk):
+        try:
+            return self.get_validator_queryset().filter(pk=pk)
+        except (TypeError, ValueError, ValidationError):
+            # Comme ``get_object_or_404`` de DRF : une clé mal formée est un 404
+            raise Http404
+
+    def get_validator(self, request, pk=None):
+        queryset = self.get_validator_queryset() if pk is None else self.object_validator_queryset(pk)
+        return collection_validator(queryset)
+
+    async def aget_validator(self, request, pk=None):
+        queryset = self.get_validator_queryset() if pk is None else self.object_validator_queryset(pk)
+        return await acollection_validator(queryset)
+
+    @conditional_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @conditional_response
+    async def alist(self, request, *args, **kwargs):
+        return await super().alist(request, *args, **kwargs)
+
+    @conditional_response
+    async def aretrieve(self, request, *args, **kwargs):
+        return await super().aretrieve(request, *args, **kwargs)
@@ -0,0 +1,36 @@
+"""
+Export du contenu au format ``db.json``.
+
+Chaque modèle est parcouru avec ``.iterator(chunk_size=...)`` et chaque ligne
+est sérialisée puis encodée individuellement : la mémoire reste constante quelle
+que soit la taille des tables ou des images.
+"""
+
+import json
+
+from .importer import COLLECTIONS
+
+
+def iter_export(collections=None, include_assets=False, chunk_size=100):
+    """Produit le document JSON par morceaux (``str``)."""
+    context = {'inline_assets': include_assets, 'raw_assets': True}
+    yield '{'
+    first = True
+    for name, collection in COLLECTIONS.items():
+        if collections and name not in collections:
+            continue
+        yield ('' if first else ',') + '\n  ' + json.dumps(name) + ': '
+        first = False
+        queryset = collection.model.objects.order_by('pk')
+        if not collection.natural_key:
+            obj = queryset.first()
+            data = collection.serializer_class(obj, context=context).data if obj else None
+            yield json.dumps(data, ensure_ascii=False)
+            continue
+        yield '['
+        separator = '\n    '
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            yield separator + json.dumps(collection.serializer_class(obj, context=context).data, ensure_ascii=False)
+            separator = ',\n    '
+        yield '\n  ]'
+    yield '\n}\n'
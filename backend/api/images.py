@@ -0,0 +1,190 @@
+"""
+Déclinaisons responsive des images (plusieurs largeurs, WebP et JPEG).
+
+À l'enregistrement d'un projet, d'une certification ou du profil, les images
+du magasin d'assets sont déclinées hors du thread de la requête, dans un pool
+de workers. Les fichiers sont rangés à côté de l'original
+(``<sha256>/<largeur>.<ext>``) ; un ``manifest.json`` écrit en dernier liste
+les largeurs disponibles et sert de témoin de fin de traitement.
+"""
+
+import io
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from . import assets
+from .models import Certification, Profile, Project
+
+
+# Champs image par modèle
+IMAGE_FIELDS = {
+    Project: ('image',),
+    Certification: ('image',),
+    Profile: ('avatar',),
+}
+
+RASTER_TYPES = {'image/jpeg', 'image/png', 'image/gif', 'image/webp'}
+
+# format -> (extension, format Pillow, options d'encodage)
+FORMATS = {
+    'webp': ('webp', 'WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('jpg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+MANIFEST = 'manifest.json'
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+_manifests = {}
+
+
+def derivatives_dir(digest):
+    return assets.asset_root() / digest[:2] / digest
+
+
+def source_name(ref):
+    """Nom de l'asset source si ``ref`` est une image matricielle du magasin."""
+    name = assets.asset_name(ref)
+    if name and assets.content_type(name) in RASTER_TYPES:
+        return name
+    return None
+
+
+def get_manifest(digest):
+    """Largeurs disponibles par format, ou ``None`` si pas (encore) générées."""
+    manifest = _manifests.get(digest)
+    if manifest is None:
+        try:
+            manifest = json.loads((derivatives_dir(digest) / MANIFEST).read_text())
+        except FileNotFoundError:
+            return None
+        _manifests[digest] = manifest
+    return manifest
+
+
+def encode(image, fmt, options):
+    if fmt == 'JPEG' and image.mode != 'RGB':
+        from PIL import Image
+
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        rgba = image.convert('RGBA')
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        image = background
+    buffer = io.BytesIO()
+    image.save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def generate(ref, force=False):
+    """Génère les déclinaisons de ``ref`` ; retourne le manifest (ou ``None``)."""
+    from PIL import Image, ImageOps
+
+    name = source_name(ref)
+    if name is None:
+        return None
+    digest = assets.asset_digest(ref)
+    if not force and get_manifest(digest) is not None:
+        return get_manifest(digest)
+
+    with Image.open(assets.asset_path(name)) as source:
+        source = ImageOps.exif_transpose(source)
+        if source.mode not in ('RGB', 'RGBA'):
+            source = source.convert('RGBA' if 'transparency' in source.info or source.mode in ('LA', 'PA') else 'RGB')
+        widths = [width for width in settings.IMAGE_DERIVATIVE_WIDTHS if width < source.width]
+        if not widths:
+            widths = [source.width]
+
+        directory = derivatives_dir(digest)
+        directory.mkdir(parents=True, exist_ok=True)
+        manifest = {key: [] for key in FORMATS}
+        for width in widths:
+            height = max(1, round(source.height * width / source.width))
+            resized = source.resize((width, height), Image.LANCZOS) if width != source.width else source
+            for key, (extension, fmt, options) in FORMATS.items():
+                assets.write_atomic(directory / f'{width}.{extension}', encode(resized, fmt, options))
+                manifest[key].append(width)
+
+    assets.write_atomic(directory / MANIFEST, json.dumps(manifest).encode('utf-8'))
+    _manifests[digest] = manifest
+    return manifest
+
+
+def srcset(ref, request=None):
+    """Attributs ``srcset`` par format pour l'image ``ref``, ou ``None``."""
+    digest = assets.asset_digest(ref) if source_name(ref) else None
+    manifest = get_manifest(digest) if digest else None
+    if not manifest:
+        return None
+    result = {}
+    for key, widths in manifest.items():
+        extension = FORMATS[key][0]
+        result[key] = ', '.join(
+            f'{assets.public_url(f"{assets.ASSET_URL_PREFIX}{digest}/{width}.{extension}", request)} {width}w'
+            for width in widths
+        )
+    return result
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.IMAGE_WORKERS, thread_name_prefix='images')
+        return _executor
+
+
+def mark_changed(model, refs):
+    """
+    Le srcset exposé pour ``refs`` a changé : avance ``updated_at`` des lignes
+    qui les affichent (leur ETag change, pas de 304 périmé) et invalide le cache.
+    """
+    from .signals import notify
+
+    condition = Q()
+    for field in IMAGE_FIELDS[model]:
+        condition |= Q(**{f'{field}__in': refs})
+    # ``update`` : ni post_save ni nouvelle déclinaison planifiée
+    model.objects.filter(condition).update(updated_at=timezone.now())
+    notify(model)
+
+
+def process(model, refs):
+    try:
+        generated = []
+        for ref in refs:
+            # Dans le pool : une exception resterait dans un Future jamais lu
+            try:
+                if generate(ref) is not None:
+                    generated.append(ref)
+            except Exception:
+                logger.exception('Image derivatives failed for %s', ref)
+        if generated:
+            mark_changed(model, generated)
+    finally:
+        close_old_connections()
+
+
+def schedule(model, refs):
+    refs = [ref for ref in refs if source_name(ref) and get_manifest(assets.asset_digest(ref)) is None]
+    if refs:
+        get_executor().submit(process, model, refs)
+
+
+def on_image_saved(sender, instance, **kwargs):
+    refs = [getattr(instance, field, None) for field in IMAGE_FIELDS[sender]]
+    transaction.on_commit(lambda: schedule(sender, refs))
+
+
+def connect():
+    for model in IMAGE_FIELDS:
+        post_save.connect(on_image_saved, sender=model, dispatch_uid=f'image_derivatives_{model.__name__}')
@@ -0,0 +1,278 @@
+"""
+Import du contenu au format ``db.json``.
+
+Le fichier est lu de façon incrémentale (un élément de collection à la fois),
+chaque élément est validé par le serializer de l'API, puis les lignes sont
+insérées ou mises à jour par lots (``bulk_create``/``bulk_update``) dans une
+seule transaction. L'import est idempotent : une ligne est retrouvée par sa
+clé naturelle et n'est réécrite que si son contenu a changé. Un élément dont la
+clé naturelle a déjà été vue dans le fichier est compté en doublon et ignoré.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from . import images, search, stats, tags
+from .models import Certification, Education, Message, Profile, Project, Stats
+from .serializers import (
+    CertificationSerializer, EducationSerializer, MessageImportSerializer, ProfileSerializer, ProjectSerializer,
+    StatsSerializer,
+)
+from .signals import batch_changes, notify
+
+
+@dataclass(frozen=True)
+class Collection:
+    model: type
+    serializer_class: type
+    # Clé naturelle ; vide pour un singleton (profil, stats)
+    natural_key: tuple = ()
+
+
+COLLECTIONS = {
+    'profile': Collection(Profile, ProfileSerializer),
+    'projects': Collection(Project, ProjectSerializer, ('title',)),
+    'education': Collection(Education, EducationSerializer, ('school', 'degree', 'field')),
+    'certifications': Collection(Certification, CertificationSerializer, ('title', 'issuer')),
+    'messages': Collection(Message, MessageImportSerializer, ('email', 'subject', 'created_at')),
+    'stats': Collection(Stats, StatsSerializer),
+}
+
+
+@dataclass
+class CollectionReport:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+    pruned: int = 0
+    seconds: float = 0.0
+    errors: list = field(default_factory=list)
+
+
+class StreamDecoder:
+    """Décodeur JSON incrémental pour un objet ``{collection: [éléments] | objet}``."""
+
+    def __init__(self, fp, chunk_size=65536):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        data = self.fp.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f'Expected {char!r} at offset {self.pos}')
+        self.pos += 1
+
+    def decode(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # Un nombre en fin de tampon peut être tronqué
+            if end == len(self.buffer) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def __iter__(self):
+        """Produit ``(collection, élément)`` ; un objet isolé est produit tel quel."""
+        self.expect('{')
+        while self.peek() != '}':
+            key = self.decode()
+            self.expect(':')
+            if self.peek() == '[':
+                self.pos += 1
+                while self.peek() != ']':
+                    yield key, self.decode()
+                    if self.peek() == ',':
+                        self.pos += 1
+                self.pos += 1
+            else:
+                yield key, self.decode()
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+
+
+def content_hash(values):
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def restore_created_at(model, created, values, batch_size=None):
+    """
+    Rétablit les ``created_at`` de la source que ``auto_now_add`` a remplacés
+    dans ``bulk_create`` (base qui renvoie les clés primaires uniquement).
+    """
+    if all(obj.pk is not None for obj in created):
+        for obj, value in zip(created, values):
+            obj.created_at = value
+        model.objects.bulk_update(created, ['created_at'], batch_size=batch_size)
+
+
+class Importer:
+    def __init__(self, batch_size=500, prune=False):
+        self.batch_size = batch_size
+        self.prune = prune
+        self.reports = {}
+        self.seen = {}
+        self.keys = {}
+        self.touched = set()
+
+    def run(self, fp, collections=None, dry_run=False):
+        """Importe ``fp`` ; retourne ``{collection: CollectionReport}``."""
+        batches = {}
+        with transaction.atomic(), batch_changes():
+            for name, item in StreamDecoder(fp):
+                if name not in COLLECTIONS or (collections and name not in collections):
+                    continue
+                batch = batches.setdefault(name, [])
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self.flush(name, batch)
+                    batches[name] = []
+            for name, batch in batches.items():
+                if batch:
+                    self.flush(name, batch)
+            if self.prune:
+                for name in self.seen:
+                    self.prune_collection(name)
+            if self.touched:
+                # bulk_create/bulk_update ne déclenchent pas les signaux : compteurs, index et tags
+                stats.rebuild()
+                indexed = [model for model in search.SEARCH_MODELS if model in self.touched]
+                if indexed:
+                    search.reindex(*indexed)
+                tagged = [model for model in tags.TAG_MODELS if model in self.touched]
+                if tagged:
+                    tags.rebuild(*tagged)
+            notify(*self.touched)
+            if dry_run:
+                transaction.set_rollback(True)
+        return self.reports
+
+    def flush(self, name, items):
+        collection = COLLECTIONS[name]
+        report = self.reports.setdefault(name, CollectionReport())
+        started = time.perf_counter()
+        model = collection.model
+
+        rows = {}
+        keys = self.keys.setdefault(name, set())
+        for item in items:
+            serializer = collection.serializer_class(data=item, context={'inline_assets': False})
+            if not serializer.is_valid():
+                report.invalid += 1
+                report.errors.append(serializer.errors)
+                continue
+            data = dict(serializer.validated_data)
+            if 'created_at' in collection.natural_key and data.get('created_at') is None:
+                data['created_at'] = timezone.now()
+            key = tuple(data.get(key) for key in collection.natural_key)
+            if key in keys:
+                # Même clé naturelle plus haut dans le fichier : la première occurrence est gardée
+                report.duplicates += 1
+                report.errors.append({'duplicate': dict(zip(collection.natural_key, key))})
+                continue
+            keys.add(key)
+            rows[key] = data
+
+        existing = self.find_existing(collection, rows)
+        to_create, to_update, update_fields = [], [], set()
+        for key, data in rows.items():
+            obj = existing.get(key)
+            if obj is None:
+                to_create.append(model(**data))
+                continue
+            self.seen.setdefault(name, set()).add(obj.pk)
+            if content_hash({attr: getattr(obj, attr) for attr in data}) == content_hash(data):
+                report.unchanged += 1
+                continue
+            for attr, value in data.items():
+                setattr(obj, attr, value)
+            update_fields.update(data)
+            to_update.append(obj)
+
+        if to_update and hasattr(model, 'updated_at'):
+            # bulk_update ne déclenche pas auto_now : les validateurs ETag en dépendent
+            now = timezone.now()
+            for obj in to_update:
+                obj.updated_at = now
+            update_fields.add('updated_at')
+
+        if to_create:
+            created_at = [obj.created_at for obj in to_create] if 'created_at' in collection.natural_key else None
+            created = model.objects.bulk_create(to_create, batch_size=self.batch_size)
+            if created_at:
+                restore_created_at(model, created, created_at, self.batch_size)
+            self.seen.setdefault(name, set()).update(obj.pk for obj in created if obj.pk is not None)
+            report.created += len(to_create)
+        if to_update:
+            model.objects.bulk_update(to_update, sorted(update_fields), batch_size=self.batch_size)
+            report.updated += len(to_update)
+        if to_create or to_update:
+            self.touched.add(model)
+            self.schedule_images(model, to_create + to_update)
+
+        report.seconds += time.perf_counter() - started
+
+    def find_existing(self, collection, rows):
+        model = collection.model
+        if not rows:
+            return {}
+        if not collection.natural_key:
+            obj = model.objects.order_by('pk').first()
+            return {(): obj} if obj else {}
+        condition = Q()
+        for key in rows:
+            condition |= Q(**dict(zip(collection.natural_key, key)))
+        existing = {}
+        for obj in model.objects.filter(condition).order_by('pk'):
+            existing.setdefault(tuple(getattr(obj, key) for key in collection.natural_key), obj)
+        return existing
+
+    def schedule_images(self, model, objects):
+        fields = images.IMAGE_FIELDS.get(model)
+        if fields:
+            refs = {getattr(obj, field) for obj in objects for field in fields}
+            transaction.on_commit(lambda: images.schedule(model, refs))
+
+    def prune_collection(self, name):
+        collection = COLLECTIONS[name]
+        deleted, _ = collection.model.objects.exclude(pk__in=self.seen[name]).delete()
+        self.reports[name].pruned = deleted
+        if deleted:
+            self.touched.add(collection.model)
@@ -0,0 +1,299 @@
+"""
+Ingestion différée (write-behind) des messages du formulaire de contact.
+
+``POST /api/messages/`` valide le message, l'écrit dans un fichier du spool
+(``var/spool/messages/pending/``, écriture atomique + fsync) et répond 202
+sans toucher la base. Un thread de fond par processus vide le spool par lots
+(``bulk_create``) ; un fichier est réservé par renommage dans
+``claimed/<pid>/`` et supprimé seulement après le commit, si bien qu'un arrêt
+brutal ne perd rien : au démarrage, ``replay()`` remet en attente les fichiers
+réservés par un processus disparu. Un message déjà inséré (même email, sujet
+et ``created_at``) n'est pas dupliqué au rejeu. Seuls les champs du formulaire
+sont mis en file ; ``read`` et ``created_at`` sont fixés par le serveur.
+
+Un lot refusé par la base (et non une base indisponible) est réessayé message
+par message : les fichiers illisibles ou refusés vont dans ``dead/`` au lieu
+d'être rejoués à chaque cycle.
+
+Quand la file dépasse ``MESSAGE_QUEUE_MAX`` fichiers, ``enqueue`` lève
+``QueueFull`` (la vue répond 503).
+"""
+
+import atexit
+import itertools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, InterfaceError, OperationalError, close_old_connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import stats
+from .models import Message
+from .signals import notify
+
+
+# Champs saisis par le client ; les autres sont fixés à la mise en file
+FORM_FIELDS = ('name', 'email', 'subject', 'message')
+FIELDS = (*FORM_FIELDS, 'read', 'created_at')
+
+# Erreurs d'une base indisponible : le lot est rejoué, pas écarté
+TRANSIENT_ERRORS = (OperationalError, InterfaceError)
+
+# Durée de validité du comptage des fichiers en attente
+DEPTH_TTL = 1.0
+
+
+class QueueFull(Exception):
+    pass
+
+
+_lock = threading.Lock()
+_sequence = itertools.count()
+_depth = {'count': None, 'checked': 0.0}
+_flusher = None
+_wakeup = threading.Event()
+_stopping = threading.Event()
+
+
+def spool_root():
+    return Path(settings.MESSAGE_SPOOL_DIR)
+
+
+def pending_dir():
+    return spool_root() / 'pending'
+
+
+def claimed_dir(pid=None):
+    return spool_root() / 'claimed' / str(pid or os.getpid())
+
+
+def dead_dir():
+    return spool_root() / 'dead'
+
+
+def write_durable(path, content):
+    """Écrit ``content`` puis le rend visible dans ``path`` par un renommage atomique."""
+    tmp = spool_root() / 'tmp' / path.name
+    tmp.parent.mkdir(parents=True, exist_ok=True)
+    with open(tmp, 'wb') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(tmp, path)
+
+
+def pending_files():
+    try:
+        return sorted(entry.name for entry in os.scandir(pending_dir()) if entry.name.endswith('.json'))
+    except FileNotFoundError:
+        return []
+
+
+def depth():
+    """Nombre (approché à ``DEPTH_TTL`` près) de messages en attente."""
+    now = time.monotonic()
+    with _lock:
+        if _depth['count'] is None or now - _depth['checked'] > DEPTH_TTL:
+            _depth['count'], _depth['checked'] = len(pending_files()), now
+        return _depth['count']
+
+
+def enqueue(data):
+    """
+    Met en file le message validé ``data`` ; retourne les valeurs enregistrées
+    (avec ``created_at``). Lève ``QueueFull`` si la file est pleine.
+    """
+    if depth() >= settings.MESSAGE_QUEUE_MAX:
+        raise QueueFull()
+    values = {field: data[field] for field in FORM_FIELDS if field in data}
+    values.update(read=False, created_at=timezone.now())
+    name = f'{time.time_ns():020d}-{os.getpid()}-{next(_sequence):06d}.json'
+    # isoformat() complet : DjangoJSONEncoder tronque aux millisecondes
+    content = dict(values, created_at=values['created_at'].isoformat())
+    write_durable(pending_dir() / name, json.dumps(content, cls=DjangoJSONEncoder).encode('utf-8'))
+    with _lock:
+        _depth['count'] = (_depth['count'] or 0) + 1
+    ensure_flusher()
+    if depth() >= settings.MESSAGE_FLUSH_BATCH:
+        _wakeup.set()
+    return values
+
+
+def claim(limit):
+    """Réserve jusqu'à ``limit`` fichiers en attente pour ce processus."""
+    target = claimed_dir()
+    target.mkdir(parents=True, exist_ok=True)
+    claimed = []
+    for name in pending_files():
+        try:
+            os.rename(pending_dir() / name, target / name)
+        except FileNotFoundError:
+            continue  # Réservé par un autre processus
+        claimed.append(target / name)
+        if len(claimed) >= limit:
+            break
+    return claimed
+
+
+def load(path):
+    values = json.loads(path.read_bytes())
+    values['created_at'] = parse_datetime(values['created_at'])
+    return Message(**{field: values[field] for field in FIELDS if field in values})
+
+
+def insert(messages):
+    """Insère ``messages`` en ignorant ceux déjà présents ; retourne les messages insérés."""
+    existing = set(
+        Message.objects.filter(created_at__in={message.created_at for message in messages})
+        .values_list('email', 'subject', 'created_at')
+    )
+    messages = [message for message in messages if (message.email, message.subject, message.created_at) not in existing]
+    if not messages:
+        return []
+    created_at = [message.created_at for message in messages]
+    created = Message.objects.bulk_create(messages)
+    # auto_now_add a remplacé la date d'accusé de réception ; basculer
+    # auto_now_add comme l'import ne serait pas sûr depuis ce thread.
+    if all(message.pk is not None for message in created):
+        for message, value in zip(created, created_at):
+            message.created_at = value
+        Message.objects.bulk_update(created, ['created_at'])
+    return created
+
+
+def dead_letter(path):
+    """Écarte ``path`` (illisible ou refusé par la base) dans ``dead/``."""
+    dead_dir().mkdir(parents=True, exist_ok=True)
+    os.replace(path, dead_dir() / path.name)
+
+
+def commit(messages):
+    """Insère ``messages`` dans une transaction ; retourne les messages insérés."""
+    with transaction.atomic():
+        created = insert(messages)
+        if created:
+            unread = sum(not message.read for message in created)
+            # bulk_create ne déclenche pas les signaux des compteurs
+            stats.apply(messages=len(created), unread_messages=unread)
+            notify(Message)
+    return created
+
+
+def flush(limit=None):
+    """Vide le spool par lots ; retourne le nombre de messages insérés."""
+    batch_size = settings.MESSAGE_FLUSH_BATCH
+    total = 0
+    while limit is None or total < limit:
+        paths = claim(batch_size)
+        if not paths:
+            break
+        loaded = []
+        for path in paths:
+            try:
+                loaded.append((path, load(path)))
+            except (ValueError, KeyError, TypeError):
+                dead_letter(path)
+        try:
+            created = commit([message for path, message in loaded])
+        except TRANSIENT_ERRORS:
+            raise
+        except DatabaseError:
+            # Lot refusé : isoler les messages fautifs plutôt que de tout rejouer sans fin
+            created = []
+            for path, _ in loaded:
+                try:
+                    # Relu : le bulk_create annulé a remplacé created_at (auto_now_add)
+                    created += commit([load(path)])
+                except TRANSIENT_ERRORS:
+                    raise
+                except DatabaseError:
+                    dead_letter(path)
+        for path in paths:
+            if path.exists():
+                path.unlink()
+        with _lock:
+            _depth['count'] = max(0, (_depth['count'] or 0) - len(paths))
+        total += len(created)
+    return total
+
+
+def replay():
+    """Remet en attente les fichiers réservés par des processus disparus."""
+    root = spool_root() / 'claimed'
+    if not root.exists():
+        return 0
+    restored = 0
+    for directory in root.iterdir():
+        if not directory.name.isdigit() or (int(directory.name) != os.getpid() and alive(int(directory.name))):
+            continue
+        for path in directory.glob('*.json'):
+            pending_dir().mkdir(parents=True, exist_ok=True)
+            os.replace(path, pending_dir() / path.name)
+            restored += 1
+    return restored
+
+
+def alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def run():
+    while not _stopping.is_set():
+        _wakeup.wait(settings.MESSAGE_FLUSH_INTERVAL)
+        _wakeup.clear()
+        try:
+            flush()
+        except Exception:
+            # La base peut être momentanément indisponible : les fichiers
+            # réservés sont remis en attente et retentés au prochain cycle.
+            replay()
+        finally:
+            close_old_connections()
+
+
+def ensure_flusher():
+    global _flusher
+    with _lock:
+        if _flusher is None or not _flusher.is_alive():
+            _stopping.clear()
+            _flusher = threading.Thread(target=run, name='message-flusher', daemon=True)
+            _flusher.start()
+
+
+def start():
+    """Au démarrage du processus : rejouer le spool et lancer le flusher."""
+    if not settings.MESSAGES_WRITE_BEHIND:
+        return
+    replay()
+    ensure_flusher()
+    if pending_files():
+        _wakeup.set()
+
+
+def stop(timeout=10):
+    """Arrête le flusher après un dernier vidage."""
+    if _flusher is None:
+        return
+    _stopping.set()
+    _wakeup.set()
+    _flusher.join(timeout)
+    try:
+        flush()
+    except Exception:
+        replay()  # Rejoué au prochain démarrage
+
+
+atexit.register(stop)
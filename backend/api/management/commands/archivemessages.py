@@ -0,0 +1,25 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api import archive
+
+
+class Command(BaseCommand):
+    help = 'Archive les messages lus plus anciens que la durée de rétention (à planifier, ex. cron quotidien)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.MESSAGE_RETENTION_DAYS, help='Âge minimal en jours')
+        parser.add_argument('--chunk-size', type=int, default=500, help='Messages par transaction')
+        parser.add_argument('--pause', type=float, default=0.05, help='Pause entre deux lots (secondes)')
+        parser.add_argument('--dry-run', action='store_true', help='Compter sans rien déplacer')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        self.stdout.write(f'[*] Messages lus de plus de {options["days"]} jours')
+        moved = archive.archive(
+            days=options['days'], chunk_size=options['chunk_size'], pause=options['pause'], dry_run=options['dry_run'],
+        )
+        verb = 'à archiver' if options['dry_run'] else 'archivé(s)'
+        self.stdout.write(self.style.SUCCESS(f'[+] {moved} message(s) {verb} en {time.perf_counter() - started:.2f}s'))
@@ -0,0 +1,187 @@
+import asyncio
+import io
+import queue
+import statistics
+import sys
+import threading
+import time
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings
+from django.urls import include, path
+
+from api.async_views import async_urls
+from portfolio import urls
+
+
+# URLconf du mode ASGI (comme avec ASYNC_READS=True), pour comparer les deux
+# modes dans le même processus
+urlpatterns = [path('api/', include(async_urls(urls.router.urls))), *urls.urlpatterns]
+
+DEFAULT_PATHS = ['/api/profile/', '/api/projects/', '/api/projects/?technology=react', '/api/stats/', '/api/education/']
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))] if values else 0.0
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare le débit des lectures en WSGI (workers synchrones) et en ASGI '
+        '(vues asynchrones), avec une latence réseau simulée vers la base'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=400, help='Requêtes par mode')
+        parser.add_argument('--concurrency', type=int, default=50, help='Clients simultanés')
+        parser.add_argument('--workers', type=int, default=3, help='Workers gunicorn synchrones simulés (WSGI)')
+        parser.add_argument('--latency', type=float, default=20.0, help='Aller-retour simulé par requête SQL (ms)')
+        parser.add_argument('--cached', action='store_true', help='Laisser le cache de réponses servir les lectures')
+        parser.add_argument('--path', action='append', dest='paths', help='Chemin à lire (répétable)')
+
+    def handle(self, *args, **options):
+        self.options = options
+        paths = options['paths'] or DEFAULT_PATHS
+        self.stdout.write(
+            f"[*] {options['requests']} requêtes, {options['concurrency']} clients, "
+            f"latence base {options['latency']:g} ms, chemins : {', '.join(paths)}"
+        )
+        delay = options['latency'] / 1000
+
+        def slow_execute(execute, sql, params, many, context):
+            time.sleep(delay)  # Aller-retour vers une base distante
+            return execute(sql, params, many, context)
+
+        def install(sender, connection, **kwargs):
+            # Signal émis à chaque reconnexion d'un même DatabaseWrapper
+            if slow_execute not in connection.execute_wrappers:
+                connection.execute_wrappers.append(slow_execute)
+
+        connection_created.connect(install, weak=False)
+        connections.close_all()
+        results = {}
+        try:
+            with override_settings(ALLOWED_HOSTS=['*'], MATERIALIZE_RESPONSES=False):
+                results['wsgi'] = self.run_wsgi(paths)
+                with override_settings(ROOT_URLCONF=__name__):
+                    results['asgi'] = asyncio.run(self.run_asgi(paths))
+        finally:
+            connection_created.disconnect(install)
+            connections.close_all()
+
+        for mode, (elapsed, latencies, errors) in results.items():
+            self.stdout.write(
+                f'  {mode.upper():4}  {len(latencies) / elapsed:8.1f} req/s   '
+                f'p50 {percentile(latencies, 50) * 1000:7.1f} ms   p95 {percentile(latencies, 95) * 1000:7.1f} ms   '
+                f'p99 {percentile(latencies, 99) * 1000:7.1f} ms   max {max(latencies) * 1000:7.1f} ms   '
+                f'moy {statistics.mean(latencies) * 1000:7.1f} ms   erreurs {errors}'
+            )
+        wsgi, asgi = (len(results[mode][1]) / results[mode][0] for mode in ('wsgi', 'asgi'))
+        self.stdout.write(self.style.SUCCESS(f'[+] ASGI / WSGI : x{asgi / wsgi:.2f} en débit'))
+
+    def target(self, mode, paths, i):
+        url = paths[i % len(paths)]
+        if not self.options['cached']:
+            # Paramètre unique : ni le cache de réponses ni celui des validateurs ne répond
+            url += ('&' if '?' in url else '?') + f'bench={mode}-{i}'
+        path_info, _, query = url.partition('?')
+        return path_info, query
+
+    def run_wsgi(self, paths):
+        """``--workers`` threads servent une file FIFO, comme des workers synchrones derrière leur backlog."""
+        handler = WSGIHandler()
+        jobs = queue.Queue()
+        counter = iter(range(self.options['requests']))
+        lock = threading.Lock()
+        latencies, errors = [], [0]
+
+        def worker():
+            for environ, status, done in iter(jobs.get, None):
+                body = handler(environ, lambda s, headers, exc_info=None: status.append(s))
+                b''.join(body)
+                body.close()
+                done.set()
+
+        def client():
+            while True:
+                with lock:
+                    i = next(counter, None)
+                if i is None:
+                    return
+                path_info, query = self.target('wsgi', paths, i)
+                environ = {
+                    'REQUEST_METHOD': 'GET', 'PATH_INFO': path_info, 'QUERY_STRING': query, 'SCRIPT_NAME': '',
+                    'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'HTTP_HOST': 'localhost',
+                    'REMOTE_ADDR': '127.0.0.1', 'SERVER_PROTOCOL': 'HTTP/1.1',
+                    'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr, 'wsgi.url_scheme': 'http',
+                }
+                status, done = [], threading.Event()
+                started = time.perf_counter()
+                jobs.put((environ, status, done))
+                done.wait()
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed)
+                    errors[0] += not status[0].startswith('200')
+
+        workers = [threading.Thread(target=worker) for _ in range(self.options['workers'])]
+        clients = [threading.Thread(target=client) for _ in range(self.options['concurrency'])]
+        started = time.perf_counter()
+        for thread in workers + clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        for thread in workers:
+            jobs.put(None)
+        for thread in workers:
+            thread.join()
+        return elapsed, latencies, errors[0]
+
+    async def run_asgi(self, paths):
+        """Clients en tâches asyncio sur un seul processus ASGI."""
+        handler = ASGIHandler()
+        counter = iter(range(self.options['requests']))
+        latencies, errors = [], [0]
+
+        async def request(i):
+            path_info, query = self.target('asgi', paths, i)
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+                'scheme': 'http', 'path': path_info, 'raw_path': path_info.encode(), 'root_path': '',
+                'query_string': query.encode(), 'headers': [(b'host', b'localhost')],
+                'client': ('127.0.0.1', 0), 'server': ('localhost', 80),
+            }
+            messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+            disconnected = asyncio.Event()
+            status = []
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                await disconnected.wait()
+                return {'type': 'http.disconnect'}
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    status.append(message['status'])
+
+            await handler(scope, receive, send)
+            disconnected.set()
+            return status[0]
+
+        async def client():
+            for i in counter:
+                started = time.perf_counter()
+                status = await request(i)
+                latencies.append(time.perf_counter() - started)
+                errors[0] += status != 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(self.options['concurrency'])))
+        return time.perf_counter() - started, latencies, errors[0]
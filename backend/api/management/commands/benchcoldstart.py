@@ -0,0 +1,129 @@
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from importlib.util import find_spec
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+PROFILES = {
+    'full': 'portfolio.settings',
+    'api': 'portfolio.settings_api',
+}
+
+# Serveur minimal si gunicorn n'est pas installé : charge portfolio.wsgi comme gunicorn
+WSGIREF_SERVER = '''
+import sys
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+class Handler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+from portfolio.wsgi import application
+make_server('127.0.0.1', int(sys.argv[1]), application, handler_class=Handler).serve_forever()
+'''
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def fetch(url):
+    """Statut de ``url``, ou ``None`` si le serveur n'écoute pas encore."""
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (ConnectionError, urllib.error.URLError, socket.timeout):
+        return None
+
+
+class Command(BaseCommand):
+    help = 'Mesure le démarrage à froid : du lancement du processus au premier 200, par profil de settings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Démarrages par profil')
+        parser.add_argument('--profile', choices=PROFILES, action='append', dest='profiles', help='Profil (répétable ; tous par défaut)')
+        parser.add_argument('--server', choices=('auto', 'gunicorn', 'wsgiref'), default='auto', help='Serveur lancé')
+        parser.add_argument('--path', default='/api/profile/', help='Chemin attendu en 200')
+        parser.add_argument('--timeout', type=float, default=60.0, help='Abandon après ce délai (secondes)')
+
+    def handle(self, *args, **options):
+        server = options['server']
+        if server == 'auto':
+            server = 'gunicorn' if find_spec('gunicorn') else 'wsgiref'
+        elif server == 'gunicorn' and not find_spec('gunicorn'):
+            raise CommandError('gunicorn non installé')
+        self.stdout.write(f"[*] {options['runs']} démarrage(s) par profil ({server}), jusqu'au premier 200 sur {options['path']}")
+
+        for profile in options['profiles'] or list(PROFILES):
+            startups, firsts, seconds = [], [], []
+            for _ in range(options['runs']):
+                startup, first, second = self.start_once(server, PROFILES[profile], options)
+                startups.append(startup)
+                firsts.append(first)
+                seconds.append(second)
+            self.stdout.write(
+                f'  {profile:4}  démarrage -> 200 : médiane {statistics.median(startups) * 1000:7.1f} ms '
+                f'(min {min(startups) * 1000:.1f}, max {max(startups) * 1000:.1f})   '
+                f'1re requête {statistics.median(firsts) * 1000:6.1f} ms   '
+                f'2e requête {statistics.median(seconds) * 1000:6.1f} ms'
+            )
+
+    def command(self, server, port):
+        if server == 'gunicorn':
+            return [
+                sys.executable, '-m', 'gunicorn', '-c', str(settings.BASE_DIR / 'gunicorn.conf.py'),
+                '--bind', f'127.0.0.1:{port}', '--workers', '1', 'portfolio.wsgi:application',
+            ]
+        return [sys.executable, '-c', WSGIREF_SERVER, str(port)]
+
+    def start_once(self, server, settings_module, options):
+        """``(lancement -> premier 200, durée de cette requête, durée de la suivante)`` en secondes."""
+        port = free_port()
+        url = f"http://127.0.0.1:{port}{options['path']}"
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module, PYTHONDONTWRITEBYTECODE='')
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            self.command(server, port), cwd=settings.BASE_DIR, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        try:
+            while True:
+                if process.poll() is not None:
+                    raise CommandError(f'{settings_module} : le serveur s\'est arrêté\n{process.stderr.read().decode()}')
+                if time.perf_counter() - started > options['timeout']:
+                    raise CommandError(f'{settings_module} : pas de réponse après {options["timeout"]:g}s')
+                request_started = time.perf_counter()
+                status = fetch(url)
+                if status is None:
+                    time.sleep(0.005)
+                    continue
+                if status != 200:
+                    raise CommandError(f'{settings_module} : {options["path"]} a répondu {status}')
+                first = time.perf_counter() - request_started
+                startup = time.perf_counter() - started
+                break
+            request_started = time.perf_counter()
+            fetch(url)
+            second = time.perf_counter() - request_started
+        finally:
+            process.send_signal(signal.SIGTERM)
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        return startup, first, second
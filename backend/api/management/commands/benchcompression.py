@@ -0,0 +1,66 @@
+import statistics
+import time
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings
+
+from api import compression
+
+
+DEFAULT_PATHS = ['/api/profile/', '/api/projects/', '/api/stats/', '/api/education/', '/api/certifications/']
+
+
+class Command(BaseCommand):
+    help = (
+        'Mesure la compression des réponses : octets transférés et temps CPU '
+        'par requête, sans compression, compressée à froid et depuis le cache'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50, help='Requêtes par chemin et par mode')
+        parser.add_argument('--path', action='append', dest='paths', help='Chemin à lire (répétable)')
+
+    def handle(self, *args, **options):
+        encodings = ['gzip'] + (['br'] if compression.brotli is not None else [])
+        self.stdout.write(
+            f"[*] {options['requests']} requêtes par mode, encodages : {', '.join(encodings)}"
+            + ('' if compression.brotli is not None else ' (brotli non installé)')
+        )
+        client = Client()
+        with override_settings(ALLOWED_HOSTS=['*'], MATERIALIZE_RESPONSES=False, COMPRESS_RESPONSES=True):
+            for path in options['paths'] or DEFAULT_PATHS:
+                self.stdout.write(path)
+                # Réponse servie par le cache de lectures : seul le coût de la compression varie
+                client.get(path)
+                raw, identity = self.measure(client, path, None, options['requests'])
+                self.report('identity', raw, raw, identity)
+                for encoding in encodings:
+                    size, cold = self.measure(client, path, encoding, options['requests'], cold=True)
+                    if size == raw:
+                        self.stdout.write(f'  {encoding:8}  non appliqué (corps sous COMPRESSION_MIN_SIZE)')
+                        continue
+                    size, cached = self.measure(client, path, encoding, options['requests'])
+                    self.report(encoding, raw, size, cold, cached)
+
+    def measure(self, client, path, encoding, requests, cold=False):
+        """``(octets du corps, temps CPU médian par requête en secondes)``."""
+        headers = {'HTTP_ACCEPT_ENCODING': encoding} if encoding else {}
+        timings = []
+        for _ in range(requests):
+            if cold:
+                caches[compression.CACHE_ALIAS].clear()
+            started = time.process_time()
+            response = client.get(path, **headers)
+            timings.append(time.process_time() - started)
+        return len(response.content), statistics.median(timings)
+
+    def report(self, label, raw, size, cpu, cached=None):
+        line = (
+            f'  {label:8}  {size:9,d} octets ({size / raw:6.1%})   '
+            f'CPU {cpu * 1000:7.2f} ms/requête'
+        )
+        if cached is not None:
+            line += f'   depuis le cache {cached * 1000:6.2f} ms'
+        self.stdout.write(line)
@@ -0,0 +1,265 @@
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from api import seeding
+from api.async_views import is_public
+from api.models import Certification, Education, Message, Profile, Project
+from portfolio.urls import router
+
+
+# Écarts sous ce seuil (ms) ignorés : bruit de mesure sur les endpoints rapides
+NOISE_MS = 0.5
+
+
+def endpoints():
+    """``{nom: (méthode, chemin, admin, corps)}`` pour la base semée."""
+    pks = {
+        'profile': Profile.objects.values_list('pk', flat=True).first(),
+        'project': Project.objects.values_list('pk', flat=True).first(),
+        'education': Education.objects.values_list('pk', flat=True).first(),
+        'certification': Certification.objects.values_list('pk', flat=True).first(),
+        'message': Message.objects.values_list('pk', flat=True).first(),
+    }
+    result = {'root': ('GET', '/', False, None)}
+    for prefix, viewset, basename in router.registry:
+        admin = not is_public(viewset)
+        result[f'{basename}-list'] = ('GET', f'/api/{prefix}/', admin, None)
+        if pks.get(basename):
+            result[f'{basename}-detail'] = ('GET', f'/api/{prefix}/{pks[basename]}/', admin, None)
+    project = Project.objects.order_by('pk').first()
+    result.update({
+        'project-filter': ('GET', f'/api/projects/?category={project.category}&technology={project.technologies[0]}', False, None),
+        'project-fields': ('GET', '/api/projects/?fields=id,title,category', False, None),
+        'project-inline': ('GET', '/api/projects/?inline=true', False, None),
+        'project-stream': ('GET', '/api/projects/?stream=true', False, None),
+        'message-unread': ('GET', '/api/messages/?read=false', True, None),
+        'portfolio': ('GET', '/api/portfolio/', False, None),
+        'search': ('GET', '/api/search/?q=react', False, None),
+        'tags': ('GET', '/api/tags/', False, None),
+        'cache-stats': ('GET', '/api/cache/stats/', False, None),
+        'throttle-stats': ('GET', '/api/throttle/stats/', False, None),
+        'export': ('GET', '/api/export/', True, None),
+        'message-create': ('POST', '/api/messages/', False, {
+            'name': 'Benchmark', 'email': 'bench@example.com', 'subject': 'Benchmark', 'message': 'Bonjour',
+        }),
+    })
+    if project.image.startswith('/'):
+        result['asset'] = ('GET', project.image, False, None)
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark de tous les endpoints sur une base SQLite jetable semée : latences '
+        'p50/p95/p99, requêtes/s, pic mémoire et octets ; export JSON et comparaison '
+        'à une référence'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=100)
+        parser.add_argument('--certifications', type=int, default=20)
+        parser.add_argument('--education', type=int, default=10)
+        parser.add_argument('--messages', type=int, default=5000)
+        parser.add_argument('--image-size', type=int, default=200_000, help='Octets par image (db.json : ~220 Ko)')
+        parser.add_argument('--inline-images', action='store_true', help='Images en data URIs base64, comme db.json')
+        parser.add_argument('--requests', type=int, default=50, help='Requêtes mesurées par endpoint')
+        parser.add_argument('--warmup', type=int, default=3, help='Requêtes non mesurées avant chaque endpoint')
+        parser.add_argument('--cold', action='store_true', help='Vider le cache de réponses avant chaque requête')
+        parser.add_argument('--accept-encoding', default='', help='En-tête Accept-Encoding envoyé (ex. gzip)')
+        parser.add_argument('--only', action='append', help='Endpoint à mesurer (répétable)')
+        parser.add_argument('--output', help='Fichier JSON des résultats')
+        parser.add_argument('--baseline', help='Résultats JSON de référence à comparer')
+        parser.add_argument('--threshold', type=float, default=0.25, help='Régression au-delà de cet écart relatif')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 2:
+            raise CommandError('--requests doit être au moins 2')
+        if connection.vendor != 'sqlite':
+            raise CommandError('La base jetable est SQLite : lancer avec USE_POSTGRESQL=False')
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+
+        with tempfile.TemporaryDirectory(prefix='benchmark-') as tmp:
+            tmp = Path(tmp)
+            isolated = override_settings(
+                ALLOWED_HOSTS=['*'],
+                ASSETS_ROOT=tmp / 'assets',
+                MATERIALIZE_RESPONSES=False,
+                MESSAGE_SPOOL_DIR=tmp / 'spool',
+                THROTTLE_ENABLED=False,
+                CACHES={
+                    **settings.CACHES,
+                    'api': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'benchmark'},
+                },
+            )
+            with isolated:
+                old_name, old_test = connection.settings_dict['NAME'], connection.settings_dict.get('TEST', {})
+                connection.settings_dict['TEST'] = {**old_test, 'NAME': str(tmp / 'benchmark.sqlite3')}
+                try:
+                    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+                    try:
+                        results = self.run(options)
+                    finally:
+                        connection.creation.destroy_test_db(old_name, verbosity=0)
+                finally:
+                    connection.settings_dict['TEST'] = old_test
+
+        self.report(results)
+        if options['output']:
+            Path(options['output']).parent.mkdir(parents=True, exist_ok=True)
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f"[+] Résultats : {options['output']}")
+        if baseline is not None:
+            regressions = self.compare(results, baseline, options['threshold'])
+            if regressions:
+                raise CommandError(f"{len(regressions)} régression(s) : {', '.join(regressions)}")
+            self.stdout.write(self.style.SUCCESS('[+] Aucune régression'))
+
+    def run(self, options):
+        started = time.perf_counter()
+        volumes = seeding.seed(
+            projects=options['projects'], certifications=options['certifications'],
+            education=options['education'], messages=options['messages'],
+            image_size=options['image_size'], inline_images=options['inline_images'],
+        )
+        self.stdout.write(f'[*] Base semée en {time.perf_counter() - started:.1f}s : {volumes}')
+        admin = User.objects.create_superuser('benchmark', 'benchmark@example.com', 'benchmark')
+        clients = {False: Client(), True: Client()}
+        clients[True].force_login(admin)
+        headers = {'HTTP_ACCEPT_ENCODING': options['accept_encoding']} if options['accept_encoding'] else {}
+
+        selected = endpoints()
+        if options['only']:
+            unknown = set(options['only']) - set(selected)
+            if unknown:
+                raise CommandError(f"Endpoint inconnu : {', '.join(sorted(unknown))} (disponibles : {', '.join(selected)})")
+            selected = {name: selected[name] for name in options['only']}
+
+        results = {}
+        for name, (method, path, admin, data) in selected.items():
+            client = clients[admin]
+
+            def request():
+                if method == 'GET':
+                    response = client.get(path, **headers)
+                else:
+                    response = client.generic(method, path, json.dumps(data), 'application/json', **headers)
+                size = sum(len(chunk) for chunk in response.streaming_content) if response.streaming else len(response.content)
+                response.close()
+                return response.status_code, size
+
+            for _ in range(options['warmup']):
+                request()
+            latencies = []
+            for _ in range(options['requests']):
+                if options['cold']:
+                    caches['api'].clear()
+                request_started = time.perf_counter()
+                request()
+                latencies.append(time.perf_counter() - request_started)
+
+            # Requête supplémentaire pour la mémoire et le SQL (tracemalloc ralentit tout)
+            if options['cold']:
+                caches['api'].clear()
+            tracemalloc.start()
+            with CaptureQueriesContext(connection) as queries:
+                status, size = request()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+            results[name] = {
+                'method': method,
+                'path': path,
+                'status': status,
+                'p50_ms': round(cuts[49] * 1000, 3),
+                'p95_ms': round(cuts[94] * 1000, 3),
+                'p99_ms': round(cuts[98] * 1000, 3),
+                'mean_ms': round(statistics.mean(latencies) * 1000, 3),
+                'rps': round(len(latencies) / sum(latencies), 1),
+                'peak_kb': round(peak / 1024, 1),
+                'bytes': size,
+                'queries': len(queries),
+            }
+        return {
+            'meta': {
+                'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'volumes': volumes,
+                'requests': options['requests'],
+                # Conditions à égaliser pour comparer deux runs
+                'options': {key: options[key] for key in ('image_size', 'inline_images', 'cold', 'accept_encoding')},
+            },
+            'endpoints': results,
+        }
+
+    def report(self, results):
+        self.stdout.write(
+            f"{'endpoint':22} {'statut':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'req/s':>8} {'pic Ko':>9} {'octets':>11} {'SQL':>4}"
+        )
+        for name, row in results['endpoints'].items():
+            self.stdout.write(
+                f"{name:22} {row['status']:>6} {row['p50_ms']:8.2f} {row['p95_ms']:8.2f} {row['p99_ms']:8.2f} "
+                f"{row['rps']:8.1f} {row['peak_kb']:9,.0f} {row['bytes']:11,d} {row['queries']:4d}"
+            )
+
+    def compare(self, results, baseline, threshold):
+        """Affiche les écarts à ``baseline`` ; retourne les endpoints en régression."""
+        self.stdout.write(f"[*] Comparaison à {baseline['meta'].get('commit') or baseline['meta']['created']} (seuil {threshold:.0%})")
+        if baseline['meta'].get('options') != results['meta']['options'] or baseline['meta'].get('volumes') != results['meta']['volumes']:
+            self.stdout.write(self.style.WARNING('  Options ou volumes différents de la référence : écarts peu comparables'))
+        regressions = []
+        for name, row in results['endpoints'].items():
+            base = baseline['endpoints'].get(name)
+            if base is None:
+                continue
+            problems = []
+            if row['status'] != base['status']:
+                problems.append(f"statut {base['status']} -> {row['status']}")
+            if row['p95_ms'] > base['p95_ms'] * (1 + threshold) and row['p95_ms'] - base['p95_ms'] > NOISE_MS:
+                problems.append(f"p95 {base['p95_ms']:.2f} -> {row['p95_ms']:.2f} ms")
+            if row['peak_kb'] > base['peak_kb'] * (1 + threshold):
+                problems.append(f"mémoire {base['peak_kb']:,.0f} -> {row['peak_kb']:,.0f} Ko")
+            if row['bytes'] > base['bytes'] * (1 + threshold):
+                problems.append(f"octets {base['bytes']:,d} -> {row['bytes']:,d}")
+            if row['queries'] > base['queries']:
+                problems.append(f"SQL {base['queries']} -> {row['queries']}")
+            if problems:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(f"  {name:22} {' ; '.join(problems)}"))
+            else:
+                change = (row['p95_ms'] - base['p95_ms']) / base['p95_ms'] if base['p95_ms'] else 0
+                self.stdout.write(f"  {name:22} p95 {change:+.0%}")
+        return regressions
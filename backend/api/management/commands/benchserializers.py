@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from api.projection import get_projection
+from api.serializers import CertificationSerializer, EducationSerializer, ProfileSerializer, ProjectSerializer
+
+
+SERIALIZERS = {
+    'profile': ProfileSerializer,
+    'projects': ProjectSerializer,
+    'education': EducationSerializer,
+    'certifications': CertificationSerializer,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare le débit (lignes/s) de la sérialisation DRF et de la projection '
+        '.values() (FAST_READS), requête SQL comprise, et vérifie que le JSON est identique'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help=f"Serializers à mesurer ({', '.join(SERIALIZERS)} ; tous par défaut)")
+        parser.add_argument('--rounds', type=int, default=20, help='Lectures complètes de la table par mode')
+
+    def handle(self, *args, **options):
+        unknown = set(options['names']) - set(SERIALIZERS)
+        if unknown:
+            raise CommandError(f"Inconnu : {', '.join(sorted(unknown))}")
+        request = Request(RequestFactory().get('/api/'))
+        renderer = JSONRenderer()
+        for name in options['names'] or SERIALIZERS:
+            serializer_class = SERIALIZERS[name]
+            queryset = serializer_class.Meta.model.objects.all()
+            projection = get_projection(serializer_class(context={'request': request}))
+            if projection is None:
+                raise CommandError(f'{name} : pas de projection (FAST_READS désactivé ?)')
+
+            def drf():
+                return serializer_class(queryset.all(), many=True, context={'request': request}).data
+
+            def projected():
+                return [projection.represent(row) for row in projection.project(queryset.all())]
+
+            if renderer.render(drf()) != renderer.render(projected()):
+                raise CommandError(f'{name} : JSON différent entre les deux chemins')
+            results = {label: self.measure(read, options['rounds']) for label, read in (('drf', drf), ('values', projected))}
+            rows = results['drf'][0]
+            self.stdout.write(f'{name} ({rows} lignes)')
+            for label, (count, elapsed) in results.items():
+                self.stdout.write(f'  {label:6}  {count * options["rounds"] / elapsed:12,.0f} lignes/s')
+            self.stdout.write(self.style.SUCCESS(f"  x{results['drf'][1] / results['values'][1]:.2f}"))
+
+    def measure(self, read, rounds):
+        """``(lignes par lecture, durée totale)``."""
+        started = time.perf_counter()
+        for _ in range(rounds):
+            count = len(read())
+        return count, time.perf_counter() - started
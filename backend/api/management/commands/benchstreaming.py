@@ -0,0 +1,63 @@
+import gc
+import time
+import tracemalloc
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings
+
+from api.cache import CACHE_ALIAS
+
+
+DEFAULT_PATHS = ['/api/projects/?inline=true', '/api/certifications/?inline=true', '/api/messages/?page_size=500']
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare la mémoire de pointe (tracemalloc) et la durée d\'une liste '
+        'rendue en entier et de la même liste en flux (?stream=true)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Mesures par chemin et par mode (meilleure retenue)')
+        parser.add_argument('--path', action='append', dest='paths', help='Chemin à lire (répétable)')
+
+    def handle(self, *args, **options):
+        client = Client()
+        admin = User.objects.filter(is_superuser=True).first()
+        if admin is not None:
+            client.force_login(admin)  # Pour les listes de messages
+        self.stdout.write(f"[*] {options['runs']} mesure(s) par mode, cache de réponses vidé avant chacune")
+        with override_settings(ALLOWED_HOSTS=['*'], MATERIALIZE_RESPONSES=False):
+            for path in options['paths'] or DEFAULT_PATHS:
+                stream_path = path + ('&' if '?' in path else '?') + 'stream=true'
+                buffered = [self.measure(client, path) for _ in range(options['runs'])]
+                streamed = [self.measure(client, stream_path) for _ in range(options['runs'])]
+                self.stdout.write(path)
+                for label, results in (('rendu', buffered), ('flux', streamed)):
+                    status, size, peak, elapsed = min(results, key=lambda result: result[2])
+                    if status != 200:
+                        self.stderr.write(f'  {label:6}  statut {status}')
+                        continue
+                    self.stdout.write(
+                        f'  {label:6}  {size:11,d} octets   pic mémoire {peak / 1024:10,.0f} Ko '
+                        f'({peak / max(size, 1):5.2f}x le corps)   {min(r[3] for r in results) * 1000:7.1f} ms'
+                    )
+
+    def measure(self, client, path):
+        """``(statut, octets, pic mémoire, durée)`` d'une requête, corps lu puis jeté."""
+        caches[CACHE_ALIAS].clear()
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        response = client.get(path)
+        size = 0
+        for chunk in response.streaming_content if response.streaming else [response.content]:
+            size += len(chunk)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        response.close()
+        return response.status_code, size, peak, elapsed
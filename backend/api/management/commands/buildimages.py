@@ -0,0 +1,48 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api import images
+from api.signals import batch_changes
+
+
+class Command(BaseCommand):
+    help = 'Génère les déclinaisons responsive (WebP/JPEG) des images existantes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=settings.IMAGE_WORKERS, help='Nombre de workers parallèles')
+        parser.add_argument('--force', action='store_true', help='Régénérer même si les déclinaisons existent')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        refs = {}
+        for model, fields in images.IMAGE_FIELDS.items():
+            for field in fields:
+                for ref in model.objects.values_list(field, flat=True).distinct().iterator():
+                    if images.source_name(ref):
+                        refs.setdefault(ref, set()).add(model)
+        self.stdout.write(f'[*] {len(refs)} images à traiter avec {options["workers"]} workers')
+
+        def run(ref):
+            try:
+                return ref, images.generate(ref, force=options['force']), None
+            except Exception as exc:
+                return ref, None, exc
+
+        changed = {}
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            for ref, manifest, error in executor.map(run, refs):
+                if error is not None:
+                    self.stdout.write(self.style.ERROR(f'  [!] {ref}: {error}'))
+                    continue
+                widths = ', '.join(str(width) for width in manifest['webp'])
+                self.stdout.write(f'  [+] {ref}: {widths}')
+                for model in refs[ref]:
+                    changed.setdefault(model, []).append(ref)
+
+        with batch_changes():
+            for model, generated in changed.items():
+                images.mark_changed(model, generated)
+        self.stdout.write(self.style.SUCCESS(f'[+] Terminé en {time.perf_counter() - started:.2f}s'))
@@ -0,0 +1,38 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.exporter import iter_export
+from api.importer import COLLECTIONS
+
+
+class Command(BaseCommand):
+    help = 'Exporte le contenu au format db.json, en flux (mémoire constante)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-o', '--output', default='-', help='Fichier de sortie (défaut: sortie standard)')
+        parser.add_argument(
+            '--collections', default='',
+            help=f"Collections à exporter, séparées par des virgules ({', '.join(COLLECTIONS)})",
+        )
+        parser.add_argument(
+            '--include-assets', action='store_true',
+            help='Inclure les images et le CV en data URI (sinon références /api/assets/)',
+        )
+        parser.add_argument('--chunk-size', type=int, default=100, help='Lignes lues par requête')
+
+    def handle(self, *args, **options):
+        collections = [name.strip() for name in options['collections'].split(',') if name.strip()]
+        unknown = [name for name in collections if name not in COLLECTIONS]
+        if unknown:
+            raise CommandError(f"Collection inconnue: {', '.join(unknown)}")
+
+        chunks = iter_export(collections, options['include_assets'], options['chunk_size'])
+        if options['output'] == '-':
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            return
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        self.stderr.write(self.style.SUCCESS(f"[+] Export écrit dans {options['output']}"))
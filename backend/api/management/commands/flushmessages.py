@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api import ingest
+
+
+class Command(BaseCommand):
+    help = 'Insère en base les messages en attente dans le spool (rejoue aussi ceux des processus arrêtés)'
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        restored = ingest.replay()
+        if restored:
+            self.stdout.write(f'[*] {restored} message(s) réservé(s) par un processus arrêté remis en attente')
+        self.stdout.write(f'[*] {len(ingest.pending_files())} message(s) en attente')
+        inserted = ingest.flush()
+        self.stdout.write(self.style.SUCCESS(
+            f'[+] {inserted} message(s) inséré(s) en {time.perf_counter() - started:.2f}s'
+        ))
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.importer import COLLECTIONS, Importer
+
+
+class Command(BaseCommand):
+    help = 'Importe (upsert idempotent) le contenu de db.json'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'source', nargs='?', default=str(settings.BASE_DIR.parent / 'db.json'),
+            help='Fichier au format db.json (défaut: ../db.json)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Taille des lots bulk_create/bulk_update')
+        parser.add_argument(
+            '--collections', default='',
+            help=f"Collections à importer, séparées par des virgules ({', '.join(COLLECTIONS)})",
+        )
+        parser.add_argument('--prune', action='store_true', help='Supprimer les lignes absentes de la source')
+        parser.add_argument('--dry-run', action='store_true', help='Tout valider puis annuler la transaction')
+
+    def handle(self, *args, **options):
+        collections = [name.strip() for name in options['collections'].split(',') if name.strip()]
+        unknown = [name for name in collections if name not in COLLECTIONS]
+        if unknown:
+            raise CommandError(f"Collection inconnue: {', '.join(unknown)}")
+
+        self.stdout.write(f"[*] Lecture du fichier: {options['source']}")
+        importer = Importer(batch_size=options['batch_size'], prune=options['prune'])
+        try:
+            with open(options['source'], 'r', encoding='utf-8') as f:
+                reports = importer.run(f, collections=collections, dry_run=options['dry_run'])
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'Import impossible: {exc}')
+
+        self.stdout.write('\n' + '=' * 82)
+        self.stdout.write(
+            f"{'Collection':<16}{'créés':>8}{'modifiés':>10}{'inchangés':>11}{'invalides':>11}{'doublons':>10}"
+            f"{'supprimés':>11}{'temps':>9}"
+        )
+        self.stdout.write('=' * 82)
+        for name, report in reports.items():
+            self.stdout.write(
+                f'{name:<16}{report.created:>8}{report.updated:>10}{report.unchanged:>11}'
+                f'{report.invalid:>11}{report.duplicates:>10}{report.pruned:>11}{report.seconds:>8.3f}s'
+            )
+            if options['verbosity'] > 1:
+                for errors in report.errors:
+                    self.stdout.write(self.style.WARNING(f'  [!] {errors}'))
+        self.stdout.write('=' * 82)
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('[*] Dry run : transaction annulée'))
+        else:
+            self.stdout.write(self.style.SUCCESS('[+] Importation terminée'))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.materialize import ENDPOINTS, materialize
+
+
+class Command(BaseCommand):
+    help = 'Rend les endpoints publics en fichiers JSON (avec variantes gzip/brotli)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help=f"Endpoints à rendre ({', '.join(ENDPOINTS)}) ; tous par défaut")
+
+    def handle(self, *args, **options):
+        names = options['names'] or list(ENDPOINTS)
+        unknown = [name for name in names if name not in ENDPOINTS]
+        if unknown:
+            raise CommandError(f"Endpoint inconnu: {', '.join(unknown)}")
+        written = materialize(names)
+        for name in names:
+            if name in written:
+                sizes = ', '.join(f'{suffix}={size}' for suffix, size in written[name].items())
+                self.stdout.write(self.style.SUCCESS(f'[+] {name}: {sizes}'))
+            else:
+                self.stdout.write(self.style.WARNING(f'[!] {name}: pas de réponse 200, fichier supprimé'))
@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api import search
+from api.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = "Reconstruit l'index de recherche plein texte (projets, certifications, formations)"
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        search.reindex()
+        self.stdout.write(
+            f'[*] Moteur : {search.engine() or "icontains"}, {SearchDocument.objects.count()} documents'
+        )
+        self.stdout.write(self.style.SUCCESS(f'[+] Terminé en {time.perf_counter() - started:.2f}s'))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api import stats
+from api.models import StatsAggregate
+from api.serializers import StatsAggregateSerializer
+from api.signals import notify
+
+
+class Command(BaseCommand):
+    help = 'Recalcule les statistiques agrégées (compteurs et histogramme des technologies)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Signaler la dérive sans corriger (code de sortie 1)')
+
+    def handle(self, *args, **options):
+        current = StatsAggregate.objects.filter(pk=stats.AGGREGATE_PK).first()
+        before = StatsAggregateSerializer(current).data if current else None
+        if options['check']:
+            with transaction.atomic():
+                after = StatsAggregateSerializer(stats.rebuild()).data
+                transaction.set_rollback(True)
+        else:
+            after = StatsAggregateSerializer(stats.rebuild()).data
+            notify(*stats.STATS_MODELS)
+
+        drift = {key: (before.get(key) if before else None, value) for key, value in after.items()
+                 if not before or before[key] != value}
+        for key, (old, new) in drift.items():
+            self.stdout.write(f'  [~] {key}: {old} -> {new}')
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('[+] Aucune dérive'))
+        elif options['check']:
+            raise SystemExit(1)
+        else:
+            self.stdout.write(self.style.SUCCESS(f'[+] {len(drift)} compteur(s) corrigé(s)'))
@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api import tags
+from api.models import CertificationSkill, ProjectTechnology, Tag
+from api.signals import batch_changes, notify
+
+
+class Command(BaseCommand):
+    help = 'Resynchronise les tags (technologies, compétences) et leurs compteurs avec les listes JSON'
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        with batch_changes():
+            tags.rebuild()
+            notify(*tags.TAG_MODELS)
+        self.stdout.write(
+            f'[*] {Tag.objects.count()} tags, {ProjectTechnology.objects.count()} liaisons projet, '
+            f'{CertificationSkill.objects.count()} liaisons certification'
+        )
+        self.stdout.write(self.style.SUCCESS(f'[+] Terminé en {time.perf_counter() - started:.2f}s'))
@@ -0,0 +1,191 @@
+"""
+Réponses publiques matérialisées sur disque.
+
+Chaque endpoint public est rendu en JSON dans ``MATERIALIZED_ROOT`` avec ses
+variantes gzip et brotli. ``MaterializedResponseMiddleware`` les sert
+directement (``FileResponse``, donc sendfile sous gunicorn) sans passer par
+DRF ni l'ORM ; si un fichier manque, la requête suit le chemin normal. Les
+fichiers sont régénérés après chaque modification des modèles concernés.
+"""
+
+import gzip
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.dispatch import receiver
+from django.http import FileResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from .assets import write_atomic
+from .async_views import call_view
+from .models import Certification, Education, Profile, Project
+from .signals import content_changed
+from .stats import STATS_MODELS
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+
+# name -> (path, models)
+ENDPOINTS = {
+    'profile': ('/api/profile/', (Profile,)),
+    'projects': ('/api/projects/', (Project,)),
+    'education': ('/api/education/', (Education,)),
+    'certifications': ('/api/certifications/', (Certification,)),
+    'stats': ('/api/stats/', STATS_MODELS),
+}
+
+PATHS = {path: name for name, (path, models) in ENDPOINTS.items()}
+
+# Content-Encoding -> suffixe, par ordre de préférence
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def materialized_root():
+    return Path(settings.MATERIALIZED_ROOT)
+
+
+def file_path(name, suffix=''):
+    return materialized_root() / f'{name}.json{suffix}'
+
+
+def render_endpoint(name):
+    """Rend l'endpoint ``name`` via sa vue, comme pour une requête réelle."""
+    from django.test import RequestFactory
+    from django.urls import resolve
+
+    path = ENDPOINTS[name][0]
+    base = urlsplit(settings.API_PUBLIC_URL or 'http://localhost')
+    request = RequestFactory().get(
+        path,
+        HTTP_HOST=base.netloc,
+        secure=base.scheme == 'https',
+    )
+    response = call_view(resolve(path), request)
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code != 200:
+        return None
+    return response.content
+
+
+def materialize(names=None):
+    """Régénère les fichiers de ``names`` (tous par défaut) ; retourne les tailles écrites."""
+    root = materialized_root()
+    root.mkdir(parents=True, exist_ok=True)
+    written = {}
+    for name in names or ENDPOINTS:
+        content = render_endpoint(name)
+        if content is None:
+            discard([name])
+            continue
+        variants = {'': content, '.gz': gzip.compress(content, compresslevel=9)}
+        if brotli is not None:
+            variants['.br'] = brotli.compress(content, quality=11)
+        else:
+            file_path(name, '.br').unlink(missing_ok=True)
+        # Variantes compressées d'abord : le fichier brut sert de témoin de présence
+        for suffix in sorted(variants, key=lambda suffix: suffix == ''):
+            write_atomic(file_path(name, suffix), variants[suffix])
+        written[name] = {suffix or '.json': len(data) for suffix, data in variants.items()}
+    return written
+
+
+def discard(names):
+    for name in names:
+        for suffix in ('', '.gz', '.br'):
+            file_path(name, suffix).unlink(missing_ok=True)
+
+
+def names_for(model):
+    return [name for name, (path, models) in ENDPOINTS.items() if model in models]
+
+
+@receiver(content_changed)
+def refresh(sender, **kwargs):
+    if not settings.MATERIALIZE_RESPONSES:
+        return
+    names = names_for(sender)
+    if names:
+        discard(names)
+        materialize(names)
+
+
+def accepted_encodings(request):
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    accepted = set()
+    for part in header.split(','):
+        token, _, params = part.strip().partition(';')
+        if params.replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(token.strip().lower())
+    return accepted
+
+
+class MaterializedResponseMiddleware:
+    """Sert les réponses matérialisées des endpoints publics (GET sans paramètres)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.MATERIALIZE_RESPONSES:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.serve(request) or self.get_response(request)
+
+    async def __acall__(self, request):
+        return self.serve(request) or await self.get_response(request)
+
+    def serve(self, request):
+        """Réponse matérialisée pour ``request``, ou ``None`` (chemin normal)."""
+        name = PATHS.get(request.path)
+        if name is None or request.method not in ('GET', 'HEAD') or request.META.get('QUERY_STRING'):
+            return None
+        try:
+            stat = file_path(name).stat()
+        except FileNotFoundError:
+            return None
+
+        etag = '"%x-%x"' % (stat.st_mtime_ns, stat.st_size)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified['ETag'] = etag
+            return not_modified
+
+        accepted = accepted_encodings(request)
+        for encoding, suffix in ENCODINGS:
+            if encoding in accepted:
+                try:
+                    f = open(file_path(name, suffix), 'rb')
+                    break
+                except FileNotFoundError:
+                    continue
+        else:
+            encoding = None
+            try:
+                f = open(file_path(name), 'rb')
+            except FileNotFoundError:
+                return None
+
+        response = FileResponse(f, content_type='application/json')
+        if 'Content-Disposition' in response:
+            del response['Content-Disposition']
+        if encoding:
+            response['Content-Encoding'] = encoding
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(stat.st_mtime)
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
@@ -0,0 +1,184 @@
+"""
+Instrumentation par requête : en-tête ``Server-Timing`` et métriques Prometheus.
+
+``MetricsMiddleware`` mesure pour chaque requête le nombre et la durée des
+requêtes SQL, le temps de sérialisation (``.data`` des serializers, projections
+``.values()``), le temps de rendu et la taille de la réponse. Les durées sont
+renvoyées dans ``Server-Timing`` (onglet réseau du navigateur) et agrégées par
+route dans des histogrammes exposés sur ``/metrics``.
+
+Sous gunicorn, ``PROMETHEUS_MULTIPROC_DIR`` (fixé par ``gunicorn.conf.py``
+avant tout import) fait écrire chaque worker dans des fichiers partagés :
+``/metrics`` agrège alors tous les workers, quel que soit celui qui répond.
+Le corps des réponses en flux est produit après le middleware : ses requêtes
+SQL et sa sérialisation n'y sont pas comptées.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db.backends.signals import connection_created
+from django.urls import Resolver404, resolve
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+
+
+SECONDS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+REQUESTS = Counter('api_requests_total', 'Requests handled', ('route', 'method', 'status'))
+DURATION = Histogram('api_request_duration_seconds', 'Time spent in Django per request', ('route', 'method'), buckets=SECONDS)
+QUERIES = Histogram('api_db_queries', 'SQL queries per request', ('route',), buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100))
+DB = Histogram('api_db_duration_seconds', 'SQL time per request', ('route',), buckets=SECONDS)
+SERIALIZE = Histogram('api_serialize_duration_seconds', 'Serialization time per request', ('route',), buckets=SECONDS)
+RENDER = Histogram('api_render_duration_seconds', 'Response rendering time per request', ('route',), buckets=SECONDS)
+SIZE = Histogram('api_response_size_bytes', 'Response body size', ('route',), buckets=tuple(256 * 4 ** n for n in range(9)))
+
+# Mesures de la requête en cours ; copiées par ``sync_to_async`` vers ses threads
+_current = ContextVar('api_request_timings', default=None)
+
+
+class Timings:
+    __slots__ = ('queries', 'db', 'serialize', 'render')
+
+    def __init__(self):
+        self.queries = 0
+        self.db = self.serialize = self.render = 0.0
+
+
+@contextmanager
+def timer(name):
+    """Ajoute la durée du bloc, hors SQL, à la mesure ``name`` de la requête en cours."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started, db = time.perf_counter(), timings.db
+    try:
+        yield
+    finally:
+        # Une liste non paginée est lue pendant la sérialisation : ce temps reste dans ``db``
+        elapsed = time.perf_counter() - started - (timings.db - db)
+        setattr(timings, name, getattr(timings, name) + elapsed)
+
+
+def record_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries += 1
+        timings.db += time.perf_counter() - started
+
+
+def on_connection_created(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def connect():
+    connection_created.connect(on_connection_created, dispatch_uid='metrics_record_query')
+
+
+def route_name(request):
+    """Nom de la route (``project-list``...) : peu de valeurs distinctes, contrairement au chemin."""
+    match = request.resolver_match
+    if match is None:
+        # Réponse rendue avant la résolution (fichiers matérialisés) ou 404
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return 'unresolved'
+    return match.view_name or match.route
+
+
+def server_timing(timings, total):
+    return ', '.join((
+        f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries"',
+        f'serialize;dur={timings.serialize * 1000:.1f}',
+        f'render;dur={timings.render * 1000:.1f}',
+        f'total;dur={total * 1000:.1f}',
+    ))
+
+
+def response_size(response):
+    if response.has_header('Content-Length'):
+        return int(response['Content-Length'])
+    return None if response.streaming else len(response.content)
+
+
+def export():
+    """``(corps, Content-Type)`` au format texte Prometheus, tous workers confondus."""
+    registry = REGISTRY
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """Mesure chaque requête : en-tête ``Server-Timing`` et histogrammes par route."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = Timings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.process_response(request, response, timings, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        timings = Timings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.process_response(request, response, timings, time.perf_counter() - started)
+
+    def process_template_response(self, request, response):
+        # Appelé juste avant ``response.render()`` (réponses DRF)
+        timings = _current.get()
+        if timings is not None:
+            started = time.perf_counter()
+
+            def rendered(response):
+                timings.render += time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def process_response(self, request, response, timings, total):
+        response['Server-Timing'] = server_timing(timings, total)
+        route = route_name(request)
+        REQUESTS.labels(route, request.method, response.status_code).inc()
+        DURATION.labels(route, request.method).observe(total)
+        QUERIES.labels(route).observe(timings.queries)
+        DB.labels(route).observe(timings.db)
+        SERIALIZE.labels(route).observe(timings.serialize)
+        RENDER.labels(route).observe(timings.render)
+        size = response_size(response)
+        if size is not None:
+            SIZE.labels(route).observe(size)
+        return response
@@ -0,0 +1,150 @@
+# Data migration: move inline base64 images and CV to the asset store
+
+import base64
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from urllib.parse import unquote_to_bytes
+
+from django.conf import settings
+from django.db import migrations
+
+
+# Copies figées de api/assets.py : la migration ne doit pas suivre le code de l'application
+ASSET_URL_PREFIX = '/api/assets/'
+
+DATA_URI_RE = re.compile(
+    r'^data:(?P<mime>[\w.+-]+/[\w.+-]+)?(?P<params>(?:;[^;,]*)*?)(?P<base64>;base64)?,',
+    re.IGNORECASE,
+)
+ASSET_NAME_RE = re.compile(r'^(?P<digest>[0-9a-f]{64})(?P<ext>\.[a-z0-9]+)?$')
+
+EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'application/pdf': '.pdf',
+}
+
+CONTENT_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.pdf': 'application/pdf',
+}
+
+
+ASSET_FIELDS = {
+    'Profile': ('avatar', 'cv'),
+    'Project': ('image',),
+    'Certification': ('image',),
+}
+
+BATCH_SIZE = 100
+
+
+def convert(apps, transform):
+    for model_name, fields in ASSET_FIELDS.items():
+        model = apps.get_model('api', model_name)
+        batch = []
+        for obj in model.objects.only('pk', *fields).iterator(chunk_size=BATCH_SIZE):
+            changed = False
+            for field in fields:
+                value = getattr(obj, field)
+                new_value = transform(value)
+                if new_value != value:
+                    setattr(obj, field, new_value)
+                    changed = True
+            if changed:
+                batch.append(obj)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, fields)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, fields)
+
+
+def asset_path(name):
+    return Path(settings.ASSETS_ROOT) / name[:2] / name
+
+
+def parse_data_uri(value):
+    match = DATA_URI_RE.match(value)
+    if not match:
+        raise ValueError('Invalid data URI')
+    mime = (match.group('mime') or 'text/plain').lower()
+    payload = value[match.end():]
+    if not match.group('base64'):
+        return mime, unquote_to_bytes(payload)
+    try:
+        return mime, base64.b64decode(re.sub(r'\s+', '', payload), validate=True)
+    except binascii.Error as exc:
+        raise ValueError('Invalid base64 payload') from exc
+
+
+def store_data_uri(value):
+    mime, content = parse_data_uri(value)
+    if mime not in EXTENSIONS:
+        raise ValueError(f'Unsupported asset type: {mime}')
+    name = hashlib.sha256(content).hexdigest() + EXTENSIONS[mime]
+    path = asset_path(name)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+    return ASSET_URL_PREFIX + name
+
+
+def to_asset(value):
+    if isinstance(value, str) and value[:5].lower() == 'data:':
+        try:
+            return store_data_uri(value)
+        except ValueError:
+            return value
+    return value
+
+
+def to_data_uri(ref):
+    if not isinstance(ref, str) or not ref.startswith(ASSET_URL_PREFIX):
+        return ref
+    name = ref[len(ASSET_URL_PREFIX):]
+    if not ASSET_NAME_RE.match(name):
+        return ref
+    try:
+        content = asset_path(name).read_bytes()
+    except FileNotFoundError:
+        return ref
+    content_type = CONTENT_TYPES.get(os.path.splitext(name)[1], 'application/octet-stream')
+    return f'data:{content_type};base64,' + base64.b64encode(content).decode('ascii')
+
+
+def forwards(apps, schema_editor):
+    convert(apps, to_asset)
+
+
+def backwards(apps, schema_editor):
+    convert(apps, to_data_uri)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_profile_cv'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:19
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def build_aggregate(apps, schema_editor):
+    Project = apps.get_model('api', 'Project')
+    Message = apps.get_model('api', 'Message')
+    technologies = Counter()
+    for names in Project.objects.values_list('technologies', flat=True).iterator():
+        technologies.update(set(names or []))
+    messages = Message.objects.aggregate(total=Count('pk'), unread=Count('pk', filter=Q(read=False)))
+    apps.get_model('api', 'StatsAggregate').objects.create(
+        pk=1,
+        projects=Project.objects.count(),
+        certifications=apps.get_model('api', 'Certification').objects.count(),
+        education=apps.get_model('api', 'Education').objects.count(),
+        messages=messages['total'],
+        unread_messages=messages['unread'],
+        technologies=dict(technologies),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_project_category_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatsAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('projects', models.IntegerField(default=0)),
+                ('certifications', models.IntegerField(default=0)),
+                ('education', models.IntegerField(default=0)),
+                ('messages', models.IntegerField(default=0)),
+                ('unread_messages', models.IntegerField(default=0)),
+                ('technologies', models.JSONField(default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'api_stats_aggregate',
+            },
+        ),
+        migrations.RunPython(build_aggregate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,113 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+# Copies figées de api/search.py : la migration ne doit pas suivre le code de l'application
+FTS_TABLE = 'api_search_fts'
+VECTOR_SQL = "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')"
+
+
+def join_text(*parts):
+    words = []
+    for part in parts:
+        if isinstance(part, (list, tuple)):
+            words.extend(str(item) for item in part if item)
+        elif part:
+            words.append(str(part))
+    return ' · '.join(words)
+
+
+# kind -> (modèle, colonnes lues, valeurs -> (titre, corps))
+SOURCES = {
+    'project': (
+        'Project', ('title', 'description', 'technologies', 'category'),
+        lambda v: (v['title'], join_text(v['description'], v['technologies'], v['category'])),
+    ),
+    'certification': (
+        'Certification', ('title', 'issuer', 'skills', 'description'),
+        lambda v: (v['title'], join_text(v['issuer'], v['skills'], v['description'])),
+    ),
+    'education': (
+        'Education', ('school', 'degree', 'field', 'description'),
+        lambda v: (f"{v['degree']} - {v['school']}", join_text(v['school'], v['field'], v['description'])),
+    ),
+}
+
+SQLITE_FTS = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, body, content='api_search_document', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER api_search_document_ai AFTER INSERT ON api_search_document BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    f"""CREATE TRIGGER api_search_document_ad AFTER DELETE ON api_search_document BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END""",
+    f"""CREATE TRIGGER api_search_document_au AFTER UPDATE ON api_search_document BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+]
+
+SQLITE_FTS_DROP = [
+    'DROP TRIGGER IF EXISTS api_search_document_ai',
+    'DROP TRIGGER IF EXISTS api_search_document_ad',
+    'DROP TRIGGER IF EXISTS api_search_document_au',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+POSTGRES_INDEX = [f'CREATE INDEX api_search_document_fts_idx ON api_search_document USING GIN (({VECTOR_SQL}))']
+
+POSTGRES_INDEX_DROP = ['DROP INDEX IF EXISTS api_search_document_fts_idx']
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+def backfill(apps, schema_editor):
+    SearchDocument = apps.get_model('api', 'SearchDocument')
+    for kind, (model_name, fields, build) in SOURCES.items():
+        model = apps.get_model('api', model_name)
+        documents = []
+        for values in model.objects.order_by().values('pk', *fields).iterator():
+            title, body = build(values)
+            documents.append(SearchDocument(kind=kind, object_id=values['pk'], title=title[:255], body=body))
+        SearchDocument.objects.bulk_create(documents, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_stats_aggregate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+            ],
+            options={
+                'db_table': 'api_search_document',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='searchdocument',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id'), name='api_search_document_object_uniq'),
+        ),
+        migrations.RunPython(
+            run_for_vendor({'sqlite': SQLITE_FTS, 'postgresql': POSTGRES_INDEX}),
+            run_for_vendor({'sqlite': SQLITE_FTS_DROP, 'postgresql': POSTGRES_INDEX_DROP}),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:24
+
+from collections import Counter
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def normalize(name):
+    # Copie figée de api.tags.normalize : la migration ne doit pas suivre le code de l'application
+    return ' '.join(str(name).split()).casefold()[:100]
+
+
+# model -> (JSON list field, through model, owner field, Tag counter)
+TAGGED = {
+    'Project': ('technologies', 'ProjectTechnology', 'project', 'project_count'),
+    'Certification': ('skills', 'CertificationSkill', 'certification', 'certification_count'),
+}
+
+BATCH_SIZE = 500
+
+
+def backfill(apps, schema_editor):
+    Tag = apps.get_model('api', 'Tag')
+    tags = {}
+    for model_name, (field, through_name, owner, counter) in TAGGED.items():
+        model = apps.get_model('api', model_name)
+        through = apps.get_model('api', through_name)
+        counts = Counter()
+        links = []
+        for pk, names in model.objects.order_by().values_list('pk', field).iterator():
+            keys = set()
+            for name in names or []:
+                key = normalize(name)
+                if not key or key in keys:
+                    continue
+                keys.add(key)
+                if key not in tags:
+                    tags[key] = Tag.objects.create(key=key, name=' '.join(str(name).split())[:100])
+                links.append(through(**{f'{owner}_id': pk, 'tag_id': tags[key].pk}))
+                counts[key] += 1
+            if len(links) >= BATCH_SIZE:
+                through.objects.bulk_create(links)
+                links = []
+        through.objects.bulk_create(links)
+        for key, count in counts.items():
+            setattr(tags[key], counter, count)
+    Tag.objects.bulk_update(tags.values(), ['project_count', 'certification_count'], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('project_count', models.IntegerField(default=0)),
+                ('certification_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'api_tag',
+                'ordering': ['key'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CertificationSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('certification', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='skill_tags', to='api.certification')),
+                ('tag', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='certification_links', to='api.tag')),
+            ],
+            options={
+                'db_table': 'api_certification_skill',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectTechnology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='technology_tags', to='api.project')),
+                ('tag', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='project_links', to='api.tag')),
+            ],
+            options={
+                'db_table': 'api_project_technology',
+                'indexes': [models.Index(fields=['project', 'tag'], name='api_project_technology_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='projecttechnology',
+            constraint=models.UniqueConstraint(fields=('tag', 'project'), name='api_project_technology_uniq'),
+        ),
+        migrations.AddIndex(
+            model_name='certificationskill',
+            index=models.Index(fields=['certification', 'tag'], name='api_certification_skill_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='certificationskill',
+            constraint=models.UniqueConstraint(fields=('tag', 'certification'), name='api_certification_skill_uniq'),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
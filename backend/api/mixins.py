@@ -0,0 +1,83 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+def split_param(value):
+    return [name.strip() for name in value.split(',') if name.strip()] if value else []
+
+
+_column_maps = {}
+
+
+def serializer_columns(serializer_class):
+    """
+    Associe chaque champ exposé par le serializer (``githubUrl``...) à la
+    colonne du modèle qu'il lit (``github_url``), ou à ``None`` si le champ
+    ne correspond pas à une colonne concrète.
+    """
+    if serializer_class not in _column_maps:
+        model = serializer_class.Meta.model
+        columns = {}
+        for name, field in serializer_class().fields.items():
+            column = None
+            if field.source != '*':
+                try:
+                    column = model._meta.get_field(field.source.split('.')[0]).attname
+                except FieldDoesNotExist:
+                    pass
+            columns[name] = column
+        _column_maps[serializer_class] = columns
+    return _column_maps[serializer_class]
+
+
+class SparseFieldsetMixin:
+    """
+    Fieldsets partiels : ``?fields=title,category`` ou ``?omit=image``.
+
+    Les noms sont ceux exposés par le serializer. Les colonnes non demandées
+    ne sont pas lues en base (``.only()``) et les champs correspondants sont
+    retirés du serializer. Ne s'applique qu'aux lectures.
+    """
+
+    def get_sparse_fieldset(self, serializer_class=None):
+        """Noms des champs à exposer, ou ``None`` si tous sont demandés."""
+        request = self.request
+        if request is None or request.method not in ('GET', 'HEAD'):
+            return None
+        fields = split_param(request.query_params.get('fields'))
+        omit = split_param(request.query_params.get('omit'))
+        if not fields and not omit:
+            return None
+        available = serializer_columns(serializer_class or self.get_serializer_class())
+        unknown = [name for name in fields + omit if name not in available]
+        if unknown:
+            raise ValidationError({'fields': [f'Unknown field: {name}' for name in unknown]})
+        selected = [name for name in (fields or available) if name not in omit]
+        return set(selected)
+
+    def sparse_queryset(self, queryset, serializer_class=None):
+        serializer_class = serializer_class or self.get_serializer_class()
+        selected = self.get_sparse_fieldset(serializer_class)
+        if selected is None:
+            return queryset
+        columns = serializer_columns(serializer_class)
+        needed = [columns[name] for name in selected]
+        if None in needed:
+            return queryset
+        return queryset.only(queryset.model._meta.pk.attname, *needed)
+
+    def trim_serializer(self, serializer):
+        target = serializer.child if isinstance(serializer, serializers.ListSerializer) else serializer
+        selected = self.get_sparse_fieldset(type(target))
+        if selected is not None:
+            for name in list(target.fields):
+                if name not in selected:
+                    target.fields.pop(name)
+        return serializer
+
+    def filter_queryset(self, queryset):
+        return self.sparse_queryset(super().filter_queryset(queryset))
+
+    def get_serializer(self, *args, **kwargs):
+        return self.trim_serializer(super().get_serializer(*args, **kwargs))
@@ -1,5 +1,4 @@
 from django.db import models
-from django.contrib.postgres.fields import ArrayField
 import json
 
 
@@ -12,10 +11,11 @@ class Profile(models.Model):
     email = models.EmailField()
     phone = models.CharField(max_length=20)
     location = models.CharField(max_length=255)
-    avatar = models.TextField()  # Base64 encoded image
-    cv = models.TextField(blank=True, null=True)  # URL or Base64 encoded PDF
+    avatar = models.TextField()  # Asset reference (/api/assets/...) or URL
+    cv = models.TextField(blank=True, null=True)  # Asset reference or URL
     social_links = models.JSONField(default=list)
     about_content = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         db_table = 'api_profile'
@@ -34,7 +34,7 @@ class Project(models.Model):
     
     title = models.CharField(max_length=255)
     description = models.TextField()
-    image = models.TextField()  # Base64 encoded image
+    image = models.TextField()  # Asset reference (/api/assets/...) or URL
     technologies = models.JSONField(default=list)
     github_url = models.URLField(blank=True, null=True)
     live_url = models.URLField(blank=True, null=True)
@@ -46,6 +46,9 @@ class Project(models.Model):
     class Meta:
         db_table = 'api_project'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['category', '-created_at'], name='api_project_category_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -74,7 +77,7 @@ class Certification(models.Model):
     issuer = models.CharField(max_length=255)
     issue_date = models.CharField(max_length=50, blank=True, null=True)
     expiry_date = models.CharField(max_length=50, blank=True, null=True)
-    image = models.TextField(blank=True, null=True)  # URL or Base64 encoded image
+    image = models.TextField(blank=True, null=True)  # Asset reference or URL
     skills = models.JSONField(default=list, blank=True)  # List of skills
     credential_url = models.URLField(blank=True, null=True)
     description = models.TextField(blank=True, null=True)
@@ -100,12 +103,39 @@ class Message(models.Model):
     
     class Meta:
         db_table = 'api_message'
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='api_message_created_idx'),
+            # Partial index: the unread inbox (?read=false) is the hot filter
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(read=False), name='api_message_unread_idx'),
+        ]
     
     def __str__(self):
         return f"{self.subject} - {self.name}"
 
 
+class ArchivedMessage(models.Model):
+    """Message lu déplacé hors de api_message après MESSAGE_RETENTION_DAYS ; voir api/archive.py."""
+    original_id = models.BigIntegerField(unique=True)  # Message.id before archival
+    name = models.CharField(max_length=255)
+    email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    message = models.TextField()
+    created_at = models.DateTimeField()  # Original submission date
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'api_message_archive'
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='api_message_archive_date_idx'),
+            models.Index(fields=['email'], name='api_message_archive_email_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} - {self.name} (archived)"
+
+
 class Stats(models.Model):
     projects = models.IntegerField(default=0)
     clients = models.IntegerField(default=0)
@@ -118,3 +148,82 @@ class Stats(models.Model):
     
     def __str__(self):
         return f"Stats - Projects: {self.projects}, Clients: {self.clients}"
+
+
+class StatsAggregate(models.Model):
+    """Compteurs maintenus par signaux (une seule ligne, pk=1) ; voir api/stats.py."""
+    projects = models.IntegerField(default=0)
+    certifications = models.IntegerField(default=0)
+    education = models.IntegerField(default=0)
+    messages = models.IntegerField(default=0)
+    unread_messages = models.IntegerField(default=0)
+    technologies = models.JSONField(default=dict)  # {technology: number of projects}
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'api_stats_aggregate'
+    
+    def __str__(self):
+        return f"Stats aggregate - Projects: {self.projects}, Messages: {self.messages}"
+
+
+class SearchDocument(models.Model):
+    """Texte indexé pour /api/search/ (FTS5 ou tsvector) ; voir api/search.py."""
+    kind = models.CharField(max_length=20)  # project, certification, education
+    object_id = models.BigIntegerField()
+    title = models.CharField(max_length=255)
+    body = models.TextField()  # Descriptions, technologies, skills, schools, issuers - never images
+    
+    class Meta:
+        db_table = 'api_search_document'
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='api_search_document_object_uniq'),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} #{self.object_id}: {self.title}"
+
+
+class Tag(models.Model):
+    """Vocabulaire normalisé des technologies et compétences ; voir api/tags.py."""
+    key = models.CharField(max_length=100, unique=True)  # Case-folded, whitespace-collapsed name
+    name = models.CharField(max_length=100)  # Display form (first spelling seen)
+    project_count = models.IntegerField(default=0)
+    certification_count = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = 'api_tag'
+        ordering = ['key']
+    
+    def __str__(self):
+        return self.name
+
+
+class ProjectTechnology(models.Model):
+    # Both lookup directions are covered by the composite indexes below
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='technology_tags', db_index=False)
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='project_links', db_index=False)
+    
+    class Meta:
+        db_table = 'api_project_technology'
+        constraints = [
+            models.UniqueConstraint(fields=['tag', 'project'], name='api_project_technology_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['project', 'tag'], name='api_project_technology_idx'),
+        ]
+
+
+class CertificationSkill(models.Model):
+    # Both lookup directions are covered by the composite indexes below
+    certification = models.ForeignKey(Certification, on_delete=models.CASCADE, related_name='skill_tags', db_index=False)
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='certification_links', db_index=False)
+    
+    class Meta:
+        db_table = 'api_certification_skill'
+        constraints = [
+            models.UniqueConstraint(fields=['tag', 'certification'], name='api_certification_skill_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['certification', 'tag'], name='api_certification_skill_idx'),
+        ]
@@ -0,0 +1,48 @@
+from django.core.paginator import InvalidPage
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+
+class PageNumberPagination(pagination.PageNumberPagination):
+    """Pagination par défaut, avec des variantes asynchrone (mode ASGI) et en flux."""
+
+    def page_queryset(self, queryset, request, count=None):
+        """
+        Page courante sans l'évaluer (``self.page.object_list`` reste un
+        queryset), pour la parcourir en flux ; ``None`` sans pagination.
+        """
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        paginator = self.django_paginator_class(queryset, page_size)
+        if count is not None:
+            # ``Paginator.count`` est un cached_property
+            paginator.count = count
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        self.request = request
+        return self.page.object_list
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        if not self.get_page_size(request):
+            return None
+        # Compté ici en asynchrone
+        object_list = self.page_queryset(queryset, request, count=await queryset.acount())
+        self.page.object_list = [obj async for obj in object_list]
+        return list(self.page)
+
+
+class MessageCursorPagination(CursorPagination):
+    """
+    Pagination par curseur de la boîte de réception : pas de ``COUNT(*)`` ni
+    d'``OFFSET``, chaque page est une lecture de l'index (created_at, id).
+    """
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 500
@@ -0,0 +1,139 @@
+"""
+Lectures par projection ``.values()`` (``FAST_READS``).
+
+Pour un serializer de modèle dont chaque champ lit une colonne, la lecture
+est compilée une fois en une liste ``(clé exposée, colonne, conversion)`` :
+``list``/``retrieve`` lisent alors des dictionnaires via ``.values()`` et
+construisent la réponse sans instance de modèle ni ``get_attribute`` par
+champ. Les champs dont la représentation est l'identité (texte, entiers,
+booléens, JSON) sont recopiés tels quels ; les autres (assets, srcset, dates)
+passent par le ``to_representation`` du champ, comme dans DRF. Un serializer
+qui redéfinit ``to_representation`` ou expose un champ calculé reste sur le
+chemin DRF. Le JSON produit est identique octet pour octet.
+"""
+
+from django.conf import settings
+from django.db import models
+from rest_framework import serializers
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+
+from . import metrics
+from .mixins import serializer_columns
+
+
+# Champ DRF (type exact) -> colonnes dont la valeur lue est déjà sa représentation
+IDENTITY = {
+    serializers.CharField: (models.CharField, models.TextField),
+    serializers.EmailField: (models.CharField,),
+    serializers.URLField: (models.CharField,),
+    # Clés des choix d'un CharField : déjà des chaînes
+    serializers.ChoiceField: (models.CharField,),
+    serializers.IntegerField: (models.IntegerField, models.AutoField),
+    serializers.BooleanField: (models.BooleanField,),
+    serializers.JSONField: (models.JSONField,),
+}
+
+_plans = {}
+
+
+def compile_plan(serializer_class, names):
+    """``[(clé, colonne, identité ?)]`` pour les champs ``names``, ou ``None``."""
+    key = (serializer_class, names)
+    if key not in _plans:
+        plan = None
+        if serializer_class.to_representation is serializers.Serializer.to_representation:
+            columns = serializer_columns(serializer_class)
+            fields = serializer_class().fields
+            model = serializer_class.Meta.model
+            model_fields = {
+                name: model._meta.get_field(fields[name].source)
+                for name in names if columns.get(name) and '.' not in fields[name].source
+            }
+            if len(model_fields) == len(names) and not any(field.is_relation for field in model_fields.values()):
+                plan = [
+                    (name, columns[name], isinstance(model_fields[name], IDENTITY.get(type(fields[name]), ())))
+                    for name in names
+                ]
+        _plans[key] = plan
+    return _plans[key]
+
+
+def converter(field):
+    to_representation = field.to_representation
+    # Comme ``Serializer.to_representation`` : ``None`` reste ``None``
+    return lambda value: None if value is None else to_representation(value)
+
+
+class Projection:
+    def __init__(self, serializer, plan):
+        fields = serializer.fields
+        self.columns = list(dict.fromkeys(column for name, column, identity in plan))
+        self.plan = [(name, column, None if identity else converter(fields[name])) for name, column, identity in plan]
+
+    def project(self, queryset):
+        return queryset.values(*self.columns)
+
+    def represent(self, row):
+        return {name: convert(row[column]) if convert else row[column] for name, column, convert in self.plan}
+
+    def represent_all(self, rows):
+        with metrics.timer('serialize'):
+            return [self.represent(row) for row in rows]
+
+
+def get_projection(serializer):
+    """Projection pour ``serializer`` (champs déjà réduits, contexte lié), ou ``None``."""
+    if not settings.FAST_READS:
+        return None
+    names = tuple(name for name, field in serializer.fields.items() if not field.write_only)
+    plan = compile_plan(type(serializer), names)
+    return Projection(serializer, plan) if plan is not None else None
+
+
+class ProjectionReadMixin:
+    """``list``/``retrieve`` (et variantes ``async``) par projection pour les ``ModelViewSet``."""
+
+    def get_projection(self):
+        return get_projection(self.get_serializer())
+
+    def list(self, request, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is None:
+            return super().list(request, *args, **kwargs)
+        queryset = projection.project(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(projection.represent_all(page))
+        return Response(projection.represent_all(queryset))
+
+    def retrieve(self, request, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is None:
+            return super().retrieve(request, *args, **kwargs)
+        queryset = projection.project(self.filter_queryset(self.get_queryset()))
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(queryset, **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        self.check_object_permissions(request, row)
+        with metrics.timer('serialize'):
+            return Response(projection.represent(row))
+
+    async def alist(self, request, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is None:
+            return await super().alist(request, *args, **kwargs)
+        queryset = projection.project(self.filter_queryset(self.get_queryset()))
+        page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        if page is not None:
+            return self.get_paginated_response(projection.represent_all(page))
+        with metrics.timer('serialize'):
+            return Response([projection.represent(row) async for row in queryset])
+
+    async def aretrieve(self, request, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is None:
+            return await super().aretrieve(request, *args, **kwargs)
+        queryset = projection.project(self.filter_queryset(self.get_queryset()))
+        row = await self.aget_object(queryset)
+        with metrics.timer('serialize'):
+            return Response(projection.represent(row))
@@ -0,0 +1,198 @@
+"""
+Recherche plein texte dans les projets, certifications et formations.
+
+Le texte cherchable (titres, descriptions, technologies, compétences, écoles,
+organismes) est recopié dans ``SearchDocument`` à chaque enregistrement ; les
+colonnes d'images ne sont jamais lues. L'index dépend de la base :
+
+- SQLite : table FTS5 ``api_search_fts`` à contenu externe, tenue à jour par
+  des triggers sur ``api_search_document`` (classement ``bm25``) ;
+- PostgreSQL : index GIN sur l'expression ``tsvector`` ``VECTOR_SQL``
+  (classement ``ts_rank``, extraits ``ts_headline``).
+
+Sur une autre base (ou un SQLite sans FTS5) la recherche retombe sur des
+``icontains`` limités à ``api_search_document``.
+"""
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Callable
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+
+from .models import Certification, Education, Project, SearchDocument
+
+
+FTS_TABLE = 'api_search_fts'
+
+# Doit rester identique à l'expression de l'index GIN (migration 0011)
+VECTOR_SQL = "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')"
+
+MARK = ('<mark>', '</mark>')
+# Délimiteurs posés par la base (caractères d'usage privé), remplacés par ``MARK``
+# après échappement : l'extrait est du HTML sûr, seul ``<mark>`` n'y est pas échappé
+SENTINELS = ('\ue000', '\ue001')
+SNIPPET_WORDS = 24
+MAX_TERMS = 8
+TERM_RE = re.compile(r'\w+')
+
+
+def join_text(*parts):
+    words = []
+    for part in parts:
+        if isinstance(part, (list, tuple)):
+            words.extend(str(item) for item in part if item)
+        elif part:
+            words.append(str(part))
+    return ' · '.join(words)
+
+
+@dataclass(frozen=True)
+class Source:
+    model_name: str
+    # Colonnes lues pour construire le document (jamais les images)
+    fields: tuple
+    build: Callable  # valeurs -> (titre, corps)
+
+
+SOURCES = {
+    'project': Source(
+        'Project', ('title', 'description', 'technologies', 'category'),
+        lambda v: (v['title'], join_text(v['description'], v['technologies'], v['category'])),
+    ),
+    'certification': Source(
+        'Certification', ('title', 'issuer', 'skills', 'description'),
+        lambda v: (v['title'], join_text(v['issuer'], v['skills'], v['description'])),
+    ),
+    'education': Source(
+        'Education', ('school', 'degree', 'field', 'description'),
+        lambda v: (f"{v['degree']} - {v['school']}", join_text(v['school'], v['field'], v['description'])),
+    ),
+}
+
+SEARCH_MODELS = (Project, Certification, Education)
+
+KINDS = {source.model_name: kind for kind, source in SOURCES.items()}
+
+
+def iter_documents(kind, queryset):
+    """``(object_id, titre, corps)`` des lignes de ``queryset`` (modèle de ``kind``)."""
+    source = SOURCES[kind]
+    for values in queryset.values('pk', *source.fields).iterator():
+        title, body = source.build(values)
+        yield values['pk'], title[:255], body
+
+
+def reindex(*models, batch_size=500):
+    """Reconstruit les documents de ``models`` (tous par défaut), par lots."""
+    for model in models or SEARCH_MODELS:
+        kind = KINDS[model.__name__]
+        existing = dict(SearchDocument.objects.filter(kind=kind).values_list('object_id', 'pk'))
+        to_create, to_update = [], []
+        for object_id, title, body in iter_documents(kind, model.objects.order_by()):
+            pk = existing.pop(object_id, None)
+            document = SearchDocument(pk=pk, kind=kind, object_id=object_id, title=title, body=body)
+            (to_create if pk is None else to_update).append(document)
+        SearchDocument.objects.bulk_create(to_create, batch_size=batch_size)
+        SearchDocument.objects.bulk_update(to_update, ['title', 'body'], batch_size=batch_size)
+        if existing:
+            SearchDocument.objects.filter(pk__in=existing.values()).delete()
+
+
+def on_saved(sender, instance, **kwargs):
+    kind = KINDS[sender.__name__]
+    title, body = SOURCES[kind].build({field: getattr(instance, field) for field in SOURCES[kind].fields})
+    SearchDocument.objects.update_or_create(
+        kind=kind, object_id=instance.pk, defaults={'title': title[:255], 'body': body},
+    )
+
+
+def on_deleted(sender, instance, **kwargs):
+    SearchDocument.objects.filter(kind=KINDS[sender.__name__], object_id=instance.pk).delete()
+
+
+def connect():
+    for model in SEARCH_MODELS:
+        post_save.connect(on_saved, sender=model, dispatch_uid=f'search_saved_{model.__name__}')
+        post_delete.connect(on_deleted, sender=model, dispatch_uid=f'search_deleted_{model.__name__}')
+
+
+_fts_tables = {}
+
+
+def engine():
+    """``'fts5'``, ``'tsvector'`` ou ``None`` (repli ``icontains``)."""
+    if connection.vendor == 'postgresql':
+        return 'tsvector'
+    if connection.vendor == 'sqlite':
+        available = _fts_tables.get(connection.alias)
+        # ``False`` mémorisé aussi : pas d'introspection à chaque recherche sans FTS5
+        if available is None:
+            available = _fts_tables[connection.alias] = FTS_TABLE in connection.introspection.table_names()
+        return 'fts5' if available else None
+    return None
+
+
+def terms(query):
+    return TERM_RE.findall(query)[:MAX_TERMS]
+
+
+def highlight(snippet):
+    """Extrait échappé pour HTML, les correspondances entre ``<mark>``."""
+    escaped = html.escape(snippet or '', quote=False)
+    return escaped.replace(SENTINELS[0], MARK[0]).replace(SENTINELS[1], MARK[1])
+
+
+def search(query, kinds=None, limit=20):
+    """
+    Documents correspondant à tous les mots de ``query`` (le dernier en
+    préfixe), du plus pertinent au moins pertinent.
+    """
+    words = terms(query)
+    if not words:
+        return []
+    kinds = list(kinds or SOURCES)
+    kind_sql = ', '.join(['%s'] * len(kinds))
+    backend = engine()
+    if backend == 'fts5':
+        match = ' '.join(f'"{word}"' for word in words[:-1]) + f' "{words[-1]}"*'
+        sql = (
+            f'SELECT d.kind, d.object_id, d.title, '
+            f"snippet({FTS_TABLE}, 1, %s, %s, '…', %s), bm25({FTS_TABLE}, 10.0, 1.0) AS rank "
+            f'FROM {FTS_TABLE} JOIN api_search_document d ON d.id = {FTS_TABLE}.rowid '
+            f'WHERE {FTS_TABLE} MATCH %s AND d.kind IN ({kind_sql}) ORDER BY rank LIMIT %s'
+        )
+        params = [*SENTINELS, SNIPPET_WORDS, match.strip(), *kinds, limit]
+    elif backend == 'tsvector':
+        tsquery = ' & '.join(f'{word}:*' for word in words)
+        options = f'StartSel={SENTINELS[0]}, StopSel={SENTINELS[1]}, MaxWords={SNIPPET_WORDS}, MinWords=8, MaxFragments=1'
+        sql = (
+            f"SELECT kind, object_id, title, ts_headline('simple', body, q, %s), ts_rank({VECTOR_SQL}, q) AS rank "
+            f"FROM api_search_document, to_tsquery('simple', %s) q "
+            f'WHERE ({VECTOR_SQL}) @@ q AND kind IN ({kind_sql}) ORDER BY rank DESC LIMIT %s'
+        )
+        params = [options, tsquery, *kinds, limit]
+    else:
+        return fallback_search(words, kinds, limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return [
+        {'kind': kind, 'id': object_id, 'title': title, 'snippet': highlight(snippet), 'rank': float(f'{abs(rank):.4g}')}
+        for kind, object_id, title, snippet, rank in rows
+    ]
+
+
+def fallback_search(words, kinds, limit):
+    condition = Q(kind__in=kinds)
+    for word in words:
+        condition &= Q(title__icontains=word) | Q(body__icontains=word)
+    documents = SearchDocument.objects.filter(condition).values_list('kind', 'object_id', 'title', 'body')[:limit]
+    return [
+        {'kind': kind, 'id': object_id, 'title': title, 'snippet': highlight(' '.join(body.split()[:SNIPPET_WORDS])), 'rank': 0}
+        for kind, object_id, title, body in documents
+    ]
@@ -0,0 +1,130 @@
+"""
+Jeux de données réalistes pour les tests de performance et les benchmarks.
+
+Les volumes et la taille des images sont paramétrables ; les valeurs par défaut
+reprennent les proportions de ``db.json`` (avatar et images de projet de
+quelques centaines de Ko).
+"""
+
+import base64
+import io
+import random
+from datetime import timedelta
+
+from django.utils import timezone
+
+from . import assets, search, stats, tags
+from .importer import restore_created_at
+from .models import Certification, Education, Message, Profile, Project, Stats
+
+
+TECHNOLOGIES = [
+    'React', 'TypeScript', 'Node.js', 'Django', 'PostgreSQL', 'Python', 'Docker', 'Tailwind',
+    'MongoDB', 'Stripe', 'Redis', 'Vue.js', 'Pandas', 'Flutter', 'Kotlin', 'GraphQL',
+]
+SKILLS = ['React', 'Hooks', 'Context API', 'SQL', 'Machine Learning', 'DevOps', 'Testing', 'Cloud']
+CATEGORIES = [choice for choice, label in Project.CATEGORY_CHOICES]
+
+
+def make_image(size, seed=0):
+    """Image PNG d'environ ``size`` octets (bruit aléatoire, donc peu compressible)."""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    side = max(16, int((size / 3) ** 0.5))
+    image = Image.frombytes('RGB', (side, side), rng.randbytes(side * side * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', compress_level=1)
+    return buffer.getvalue()
+
+
+def store_images(count, size, inline=False):
+    """
+    Prépare ``count`` images distinctes : références d'asset, ou data URIs
+    base64 comme avant le magasin d'assets si ``inline``.
+    """
+    images = [make_image(size, seed) for seed in range(count)]
+    if inline:
+        return ['data:image/png;base64,' + base64.b64encode(image).decode('ascii') for image in images]
+    return [assets.ASSET_URL_PREFIX + assets.store_bytes(image, 'image/png') for image in images]
+
+
+def seed(projects=300, certifications=50, education=20, messages=20000, image_size=200_000,
+         distinct_images=8, inline_images=False, batch_size=1000, rng=None):
+    """Remplit la base ; retourne le nombre de lignes créées par modèle."""
+    rng = rng or random.Random(42)
+    images = store_images(distinct_images, image_size, inline_images) if image_size else ['']
+    now = timezone.now()
+
+    Profile.objects.create(
+        name='Abdoul Salam Diallo',
+        title='Développeur Full Stack',
+        bio='Passionné par la création d\'applications web modernes et performantes.',
+        about_me='Avec plus de 5 ans d\'expérience en développement web...',
+        email='contact@example.com',
+        phone='+33 6 00 00 00 00',
+        location='France',
+        avatar=images[0],
+        social_links=[{'platform': 'github', 'url': 'https://github.com'}],
+        about_content={'whoAmI': '...', 'approach': '...', 'hobby': '...'},
+    )
+    Stats.objects.create(projects=projects, clients=12, experience=5)
+
+    Project.objects.bulk_create([
+        Project(
+            title=f'Projet {i}',
+            description=f'Description détaillée du projet {i}. ' * 8,
+            image=images[i % len(images)],
+            technologies=rng.sample(TECHNOLOGIES, 4),
+            github_url='https://github.com',
+            live_url='https://example.com',
+            category=CATEGORIES[i % len(CATEGORIES)],
+            featured=i % 10 == 0,
+        )
+        for i in range(projects)
+    ], batch_size=batch_size)
+    Certification.objects.bulk_create([
+        Certification(
+            title=f'Certification {i}',
+            issuer=rng.choice(['Udemy', 'Coursera', 'OpenClassrooms', 'AWS']),
+            issue_date='2024-01-15',
+            image=images[i % len(images)],
+            skills=rng.sample(SKILLS, 3),
+            description=f'Certification {i}',
+        )
+        for i in range(certifications)
+    ], batch_size=batch_size)
+    Education.objects.bulk_create([
+        Education(
+            school=f'École {i}',
+            degree='Master Informatique',
+            field='Développement Web',
+            start_date='2020-09-01',
+            end_date='2022-06-30',
+            description='Spécialisation en développement web full stack',
+        )
+        for i in range(education)
+    ], batch_size=batch_size)
+
+    # Dates étalées dans le temps, comme une vraie boîte de réception
+    for start in range(0, messages, batch_size):
+        dates = [now - timedelta(minutes=messages - i) for i in range(start, min(start + batch_size, messages))]
+        created = Message.objects.bulk_create([
+            Message(
+                name=f'Visiteur {i}',
+                email=f'visiteur{i}@example.com',
+                subject=f'Sujet {i}',
+                message='Bonjour, je suis intéressé par une collaboration. ' * 4,
+                read=rng.random() < 0.8,
+            )
+            for i in range(start, start + len(dates))
+        ], batch_size=batch_size)
+        restore_created_at(Message, created, dates, batch_size)
+    stats.rebuild()
+    search.reindex()
+    tags.rebuild()
+
+    return {
+        'profile': 1, 'projects': projects, 'certifications': certifications,
+        'education': education, 'messages': messages, 'stats': 1,
+    }
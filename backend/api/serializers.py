@@ -1,39 +1,106 @@
+from django.conf import settings
 from rest_framework import serializers
-from .models import Profile, Project, Education, Certification, Message, Stats
+from . import assets, images, metrics
+from .models import ArchivedMessage, Profile, Project, Education, Certification, Message, Stats, StatsAggregate
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class AssetField(serializers.CharField):
+    """Champ image/fichier : stocke les data URIs reçus et expose une URL courte."""
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if assets.is_data_uri(value):
+            try:
+                return assets.store_data_uri(value)
+            except ValueError:
+                raise serializers.ValidationError('Invalid data URI.')
+        return value
+
+    def to_representation(self, value):
+        if not assets.is_asset_ref(value):
+            return value
+        if self.inline_requested():
+            return assets.to_data_uri(value)
+        if self.context.get('raw_assets'):
+            # Export : conserver la référence pour un ré-import sur le même magasin
+            return value
+        return assets.public_url(value, self.context.get('request'))
+
+    def inline_requested(self):
+        # Compatibilité avec les anciens clients qui attendent le data URI complet
+        if 'inline_assets' in self.context:
+            return self.context['inline_assets']
+        request = self.context.get('request')
+        if request is not None and request.GET.get('inline') in ('1', 'true'):
+            return True
+        return settings.ASSETS_INLINE_DATA_URIS
+
+
+class SrcsetField(serializers.Field):
+    """Déclinaisons responsive d'une image : ``{"webp": "<url> 320w, ...", "jpeg": ...}``."""
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return images.srcset(value, self.context.get('request'))
+
+
+class TimedListSerializer(serializers.ListSerializer):
+    @property
+    def data(self):
+        with metrics.timer('serialize'):
+            return super().data
+
+
+class TimedModelSerializer(serializers.ModelSerializer):
+    """``ModelSerializer`` dont ``.data`` (seul ou en liste) compte dans la mesure ``serialize``."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = cls.__dict__.get('Meta')
+        if meta is not None and not hasattr(meta, 'list_serializer_class'):
+            meta.list_serializer_class = TimedListSerializer
+
+    @property
+    def data(self):
+        with metrics.timer('serialize'):
+            return super().data
+
+
+class ProfileSerializer(TimedModelSerializer):
     adminPassword = serializers.CharField(source='admin_password', required=False)
     aboutMe = serializers.CharField(source='about_me', required=False, allow_blank=True)
     socialLinks = serializers.JSONField(source='social_links', required=False)
     aboutContent = serializers.JSONField(source='about_content', required=False)
+    avatar = AssetField()
+    avatarSrcset = SrcsetField(source='avatar')
+    cv = AssetField(required=False, allow_blank=True, allow_null=True)
     
     class Meta:
         model = Profile
         fields = [
             'id', 'name', 'title', 'bio', 'adminPassword', 'aboutMe',
-            'email', 'phone', 'location', 'avatar', 'cv', 'socialLinks', 'aboutContent'
+            'email', 'phone', 'location', 'avatar', 'avatarSrcset', 'cv', 'socialLinks', 'aboutContent'
         ]
-    
-    def to_representation(self, instance):
-        data = super().to_representation(instance)
-        # Rename fields to camelCase for frontend compatibility
-        return data
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(TimedModelSerializer):
     githubUrl = serializers.CharField(source='github_url', required=False, allow_blank=True)
     liveUrl = serializers.CharField(source='live_url', required=False, allow_blank=True)
+    image = AssetField()
+    imageSrcset = SrcsetField(source='image')
     
     class Meta:
         model = Project
         fields = [
-            'id', 'title', 'description', 'image', 'technologies',
+            'id', 'title', 'description', 'image', 'imageSrcset', 'technologies',
             'githubUrl', 'liveUrl', 'category', 'featured'
         ]
 
 
-class EducationSerializer(serializers.ModelSerializer):
+class EducationSerializer(TimedModelSerializer):
     startDate = serializers.CharField(source='start_date', required=False, allow_blank=True)
     endDate = serializers.CharField(source='end_date', required=False, allow_blank=True)
     
@@ -44,29 +111,72 @@ class EducationSerializer(serializers.ModelSerializer):
         ]
 
 
-class CertificationSerializer(serializers.ModelSerializer):
+class CertificationSerializer(TimedModelSerializer):
     issueDate = serializers.CharField(source='issue_date', required=False, allow_blank=True)
     expiryDate = serializers.CharField(source='expiry_date', required=False, allow_blank=True)
     credentialUrl = serializers.CharField(source='credential_url', required=False, allow_blank=True)
+    image = AssetField(required=False, allow_blank=True, allow_null=True)
+    imageSrcset = SrcsetField(source='image')
     
     class Meta:
         model = Certification
         fields = [
-            'id', 'title', 'issuer', 'issueDate', 'expiryDate', 'image', 'skills', 'credentialUrl', 'description'
+            'id', 'title', 'issuer', 'issueDate', 'expiryDate', 'image', 'imageSrcset', 'skills', 'credentialUrl', 'description'
         ]
 
 
-class MessageSerializer(serializers.ModelSerializer):
+class MessageSerializer(TimedModelSerializer):
+    createdAt = serializers.DateTimeField(source='created_at', read_only=True)
+    
     class Meta:
         model = Message
         fields = [
-            'id', 'name', 'email', 'subject', 'message', 'read'
+            'id', 'name', 'email', 'subject', 'message', 'read', 'createdAt'
         ]
 
 
-class StatsSerializer(serializers.ModelSerializer):
+class MessageImportSerializer(MessageSerializer):
+    """Import db.json : conserve le ``createdAt`` de la source (fixé par le serveur sur l'API)."""
+    createdAt = serializers.DateTimeField(source='created_at', required=False)
+
+    class Meta(MessageSerializer.Meta):
+        pass
+
+
+class ArchivedMessageSerializer(TimedModelSerializer):
+    originalId = serializers.IntegerField(source='original_id', read_only=True)
+    createdAt = serializers.DateTimeField(source='created_at', read_only=True)
+    archivedAt = serializers.DateTimeField(source='archived_at', read_only=True)
+    
+    class Meta:
+        model = ArchivedMessage
+        fields = [
+            'id', 'originalId', 'name', 'email', 'subject', 'message', 'createdAt', 'archivedAt'
+        ]
+
+
+class StatsSerializer(TimedModelSerializer):
     class Meta:
         model = Stats
         fields = [
             'id', 'projects', 'clients', 'experience'
         ]
+
+
+class StatsAggregateSerializer(TimedModelSerializer):
+    totalProjects = serializers.IntegerField(source='projects')
+    totalCertifications = serializers.IntegerField(source='certifications')
+    totalEducation = serializers.IntegerField(source='education')
+    totalMessages = serializers.IntegerField(source='messages')
+    unreadMessages = serializers.IntegerField(source='unread_messages')
+    technologies = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = StatsAggregate
+        fields = [
+            'totalProjects', 'totalCertifications', 'totalEducation', 'totalMessages', 'unreadMessages', 'technologies'
+        ]
+    
+    def get_technologies(self, obj):
+        ranked = sorted(obj.technologies.items(), key=lambda item: (-item[1], item[0]))
+        return [{'name': name, 'count': count} for name, count in ranked]
@@ -0,0 +1,58 @@
+"""
+Notifications de modification du contenu.
+
+``content_changed`` est émis (après commit) une fois par modèle modifié ; les
+caches et fichiers dérivés s'y abonnent plutôt qu'à ``post_save``/``post_delete``
+afin que les écritures groupées (imports, lots) ne déclenchent qu'une
+invalidation.
+"""
+
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal
+
+from .models import Certification, Education, Message, Profile, Project, Stats
+
+
+CONTENT_MODELS = (Profile, Project, Education, Certification, Message, Stats)
+
+content_changed = Signal()
+
+_state = threading.local()
+
+
+def notify(*models):
+    """Signale que le contenu de ``models`` a changé."""
+    pending = getattr(_state, 'pending', None)
+    if pending is not None:
+        pending.update(models)
+        return
+    for model in models:
+        transaction.on_commit(lambda model=model: content_changed.send(sender=model))
+
+
+@contextmanager
+def batch_changes():
+    """Regroupe les notifications du bloc : une seule par modèle en sortie."""
+    if getattr(_state, 'pending', None) is not None:
+        yield
+        return
+    _state.pending = set()
+    try:
+        yield
+    finally:
+        models, _state.pending = _state.pending, None
+        notify(*models)
+
+
+def on_model_change(sender, **kwargs):
+    notify(sender)
+
+
+def connect():
+    for model in CONTENT_MODELS:
+        post_save.connect(on_model_change, sender=model, dispatch_uid=f'content_changed_save_{model.__name__}')
+        post_delete.connect(on_model_change, sender=model, dispatch_uid=f'content_changed_delete_{model.__name__}')
@@ -0,0 +1,53 @@
+"""
+Instantané public du portfolio servi par ``/api/portfolio/``.
+
+Le document (profil, projets, formations, certifications, stats) est
+sérialisé et encodé en JSON une seule fois par génération des modèles, puis
+mémorisé en mémoire du processus et dans le cache ``api`` partagé. Une lecture
+coûte la lecture des compteurs de génération et une recherche dans un dict.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+from .cache import get_cache, response_key
+from . import stats
+from .models import Certification, Education, Profile, Project
+from .serializers import CertificationSerializer, EducationSerializer, ProfileSerializer, ProjectSerializer
+
+
+SNAPSHOT_MODELS = (Profile, Project, Education, Certification) + stats.STATS_MODELS
+
+MEMO_SIZE = 32
+
+_memo = {}
+
+
+def build_snapshot(request):
+    """Sérialise toutes les collections publiques en un seul document."""
+    context = {'request': request}
+    profile = Profile.objects.first()
+    return {
+        'profile': ProfileSerializer(profile, context=context).data if profile else None,
+        'projects': ProjectSerializer(Project.objects.all(), many=True, context=context).data,
+        'education': EducationSerializer(Education.objects.all(), many=True, context=context).data,
+        'certifications': CertificationSerializer(Certification.objects.all(), many=True, context=context).data,
+        'stats': stats.get_payload(context),
+    }
+
+
+def get_snapshot(request):
+    """Retourne ``(clé, JSON encodé)`` de l'instantané courant."""
+    key = response_key(request, SNAPSHOT_MODELS) + ':snapshot'
+    content = _memo.get(key)
+    if content is None:
+        cache = get_cache()
+        content = cache.get(key)
+        if content is None:
+            content = JSONRenderer().render(build_snapshot(request))
+            cache.set(key, content)
+        # ``key`` contient les générations lues dans le cache partagé : une
+        # écriture traitée par un autre worker rend cette entrée inaccessible
+        if len(_memo) >= MEMO_SIZE:
+            _memo.clear()
+        _memo[key] = content
+    return key, content
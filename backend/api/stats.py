@@ -0,0 +1,207 @@
+"""
+Statistiques publiques maintenues en continu.
+
+``StatsAggregate`` (une seule ligne) contient les compteurs de projets,
+certifications, formations, messages (total et non lus) et l'histogramme des
+technologies des projets. Chaque écriture applique un delta en O(1) via les
+signaux ; ``rebuild()`` (commande ``rebuildstats``) recalcule tout en cas de
+dérive, par exemple après des écritures en masse qui ne déclenchent pas de
+signaux.
+"""
+
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Count, F, Q, Subquery
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from .models import Certification, Education, Message, Project, Stats, StatsAggregate
+
+
+AGGREGATE_PK = 1
+
+# Modèles dont dépend la réponse de /api/stats/
+STATS_MODELS = (Stats, Project, Certification, Education, Message)
+
+
+def rebuild():
+    """Recalcule entièrement l'agrégat à partir des tables."""
+    technologies = Counter()
+    for names in Project.objects.values_list('technologies', flat=True).iterator():
+        technologies.update(set(names or []))
+    messages = Message.objects.aggregate(total=Count('pk'), unread=Count('pk', filter=Q(read=False)))
+    aggregate, _ = StatsAggregate.objects.update_or_create(
+        pk=AGGREGATE_PK,
+        defaults={
+            'projects': Project.objects.count(),
+            'certifications': Certification.objects.count(),
+            'education': Education.objects.count(),
+            'messages': messages['total'],
+            'unread_messages': messages['unread'],
+            'technologies': dict(technologies),
+        },
+    )
+    return aggregate
+
+
+def apply(**deltas):
+    """
+    Applique des deltas aux compteurs en un seul UPDATE. Retourne ``False``
+    si l'agrégat a dû être reconstruit (il inclut alors déjà l'écriture courante).
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return True
+    updated = StatsAggregate.objects.filter(pk=AGGREGATE_PK).update(
+        updated_at=timezone.now(), **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+    if not updated:
+        rebuild()
+        return False
+    return True
+
+
+def apply_technologies(added=(), removed=()):
+    added, removed = set(added or []), set(removed or [])
+    added, removed = added - removed, removed - added
+    if not added and not removed:
+        return
+    with transaction.atomic():
+        aggregate = StatsAggregate.objects.select_for_update().filter(pk=AGGREGATE_PK).first()
+        if aggregate is None:
+            rebuild()
+            return
+        histogram = aggregate.technologies
+        for name in added:
+            histogram[name] = histogram.get(name, 0) + 1
+        for name in removed:
+            histogram[name] = histogram.get(name, 0) - 1
+            if histogram[name] <= 0:
+                del histogram[name]
+        aggregate.save(update_fields=['technologies', 'updated_at'])
+
+
+def capture_previous(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Mémorise l'état avant écriture pour calculer le delta en post_save."""
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    field = 'technologies' if sender is Project else 'read'
+    if update_fields is not None and field not in update_fields:
+        return
+    instance._stats_previous = sender.objects.filter(pk=instance.pk).values_list(field, flat=True).first()
+
+
+def on_project_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        if apply(projects=1):
+            apply_technologies(added=instance.technologies)
+    elif hasattr(instance, '_stats_previous'):
+        apply_technologies(added=instance.technologies, removed=instance._stats_previous)
+        del instance._stats_previous
+
+
+def on_project_deleted(sender, instance, **kwargs):
+    if apply(projects=-1):
+        apply_technologies(removed=instance.technologies)
+
+
+def on_message_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        apply(messages=1, unread_messages=0 if instance.read else 1)
+    elif hasattr(instance, '_stats_previous'):
+        previous = instance._stats_previous
+        del instance._stats_previous
+        if previous is not None and previous != instance.read:
+            apply(unread_messages=-1 if instance.read else 1)
+
+
+def on_message_deleted(sender, instance, **kwargs):
+    apply(messages=-1, unread_messages=0 if instance.read else -1)
+
+
+def counter_handlers(field):
+    def on_saved(sender, instance, created, raw=False, **kwargs):
+        if created and not raw:
+            apply(**{field: 1})
+
+    def on_deleted(sender, instance, **kwargs):
+        apply(**{field: -1})
+
+    return on_saved, on_deleted
+
+
+def connect():
+    pre_save.connect(capture_previous, sender=Project, dispatch_uid='stats_previous_project')
+    pre_save.connect(capture_previous, sender=Message, dispatch_uid='stats_previous_message')
+    post_save.connect(on_project_saved, sender=Project, dispatch_uid='stats_project_saved')
+    post_delete.connect(on_project_deleted, sender=Project, dispatch_uid='stats_project_deleted')
+    post_save.connect(on_message_saved, sender=Message, dispatch_uid='stats_message_saved')
+    post_delete.connect(on_message_deleted, sender=Message, dispatch_uid='stats_message_deleted')
+    for model, field in ((Certification, 'certifications'), (Education, 'education')):
+        on_saved, on_deleted = counter_handlers(field)
+        post_save.connect(on_saved, sender=model, weak=False, dispatch_uid=f'stats_{field}_saved')
+        post_delete.connect(on_deleted, sender=model, weak=False, dispatch_uid=f'stats_{field}_deleted')
+
+
+def manual_value(field):
+    """Sous-requête sur la ligne ``Stats`` saisie à la main (clients, expérience)."""
+    return Subquery(Stats.objects.order_by('pk').values(field)[:1])
+
+
+def validator_values():
+    return StatsAggregate.objects.filter(pk=AGGREGATE_PK).annotate(
+        manual_updated_at=manual_value('updated_at'),
+    ).values('updated_at', 'manual_updated_at')
+
+
+def get_validator():
+    """Validateur ``(last_modified, 1)`` de la réponse, en une seule requête."""
+    aggregate = validator_values().first()
+    if aggregate is None:
+        aggregate = {'updated_at': rebuild().updated_at, 'manual_updated_at': None}
+    return max(filter(None, aggregate.values())), 1
+
+
+async def aget_validator():
+    aggregate = await validator_values().afirst()
+    if aggregate is None:
+        aggregate = {'updated_at': (await sync_to_async(rebuild)()).updated_at, 'manual_updated_at': None}
+    return max(filter(None, aggregate.values())), 1
+
+
+def payload_queryset():
+    return StatsAggregate.objects.filter(pk=AGGREGATE_PK).annotate(
+        clients=manual_value('clients'), experience=manual_value('experience'),
+    )
+
+
+def serialize_payload(aggregate, serializer_context=None):
+    from .serializers import StatsAggregateSerializer
+
+    data = dict(StatsAggregateSerializer(aggregate, context=serializer_context or {}).data)
+    data['clients'] = aggregate.clients or 0
+    data['experience'] = aggregate.experience or 0
+    return data
+
+
+def get_payload(serializer_context=None):
+    """Contenu de ``/api/stats/`` : agrégat + chiffres saisis à la main, en une seule requête."""
+    aggregate = payload_queryset().first()
+    if aggregate is None:
+        rebuild()
+        return get_payload(serializer_context)
+    return serialize_payload(aggregate, serializer_context)
+
+
+async def aget_payload(serializer_context=None):
+    aggregate = await payload_queryset().afirst()
+    if aggregate is None:
+        await sync_to_async(rebuild)()
+        return await aget_payload(serializer_context)
+    return serialize_payload(aggregate, serializer_context)
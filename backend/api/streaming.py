@@ -0,0 +1,116 @@
+"""
+Listes en flux (``?stream=true``).
+
+La liste n'est jamais construite en entier : le queryset (ou la page courante)
+est parcouru avec ``.iterator()`` (projection ``.values()`` quand le
+serializer s'y prête), chaque ligne est sérialisée puis encodée seule dans une
+``StreamingHttpResponse``. Le JSON produit a la même forme que
+la réponse habituelle, enveloppe de pagination comprise ; la mémoire ne
+dépend plus que d'une ligne et d'un lot de ``stream_chunk_size`` objets. Les
+réponses en flux ne passent ni par le cache de réponses ni par la
+compression, mais gardent leur ETag.
+"""
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import json
+
+from .projection import get_projection
+
+
+RESULTS = object()  # Place de la liste dans l'enveloppe de pagination
+
+
+def encode(data, renderer=JSONRenderer()):
+    """Comme ``JSONRenderer.render`` (mêmes options), en ``str``."""
+    separators = (',', ':') if renderer.compact else (', ', ': ')
+    ret = json.dumps(
+        data, cls=renderer.encoder_class, ensure_ascii=renderer.ensure_ascii,
+        allow_nan=not renderer.strict, separators=separators,
+    )
+    return ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+
+def document(envelope):
+    """``(début, fin)`` du document autour des lignes, et leur séparateur."""
+    separator = ',' if api_settings.COMPACT_JSON else ', '
+    if envelope is None:
+        return '[', ']', separator
+    colon = ':' if api_settings.COMPACT_JSON else ': '
+    members = [encode(key) + colon + ('' if value is RESULTS else encode(value)) for key, value in envelope.items()]
+    position = list(envelope.values()).index(RESULTS) + 1
+    head = '{' + separator.join(members[:position]) + '['
+    tail = ']' + ''.join(separator + member for member in members[position:]) + '}'
+    return head, tail, separator
+
+
+def iter_json(envelope, rows, represent):
+    head, tail, separator = document(envelope)
+    yield head.encode('utf-8')
+    prefix = ''
+    for obj in rows:
+        yield (prefix + encode(represent(obj))).encode('utf-8')
+        prefix = separator
+    yield tail.encode('utf-8')
+
+
+async def aiter_json(envelope, rows, represent):
+    head, tail, separator = document(envelope)
+    yield head.encode('utf-8')
+    prefix = ''
+    async for obj in rows:
+        yield (prefix + encode(represent(obj))).encode('utf-8')
+        prefix = separator
+    yield tail.encode('utf-8')
+
+
+class StreamingListMixin:
+    """``list``/``alist`` en flux pour les ``ModelViewSet`` quand ``?stream=true``."""
+
+    stream_chunk_size = 100
+
+    def stream_requested(self, request):
+        return request.query_params.get('stream') in ('1', 'true')
+
+    def stream_rows(self, request, queryset, count=None):
+        """``(enveloppe de pagination ou None, lignes à parcourir)``."""
+        paginator = self.paginator
+        if paginator is None:
+            return None, queryset
+        if hasattr(paginator, 'page_queryset'):
+            page = paginator.page_queryset(queryset, request, count=count)
+        else:
+            # Pagination par curseur : la page est lue pour calculer les curseurs
+            page = paginator.paginate_queryset(queryset, request, view=self)
+        if page is None:
+            return None, queryset
+        return self.get_paginated_response(RESULTS).data, page
+
+    def read_rows(self, rows):
+        """``(lignes, ligne -> données)``, par projection ``.values()`` si possible."""
+        # Un seul serializer (fieldsets partiels appliqués) pour toutes les lignes
+        serializer = self.get_serializer([], many=True).child
+        projection = get_projection(serializer) if isinstance(rows, QuerySet) else None
+        if projection is None:
+            return rows, serializer.to_representation
+        return projection.project(rows), projection.represent
+
+    def list(self, request, *args, **kwargs):
+        if not self.stream_requested(request):
+            return super().list(request, *args, **kwargs)
+        envelope, rows = self.stream_rows(request, self.filter_queryset(self.get_queryset()))
+        rows, represent = self.read_rows(rows)
+        if isinstance(rows, QuerySet):
+            rows = rows.iterator(chunk_size=self.stream_chunk_size)
+        return StreamingHttpResponse(iter_json(envelope, rows, represent), content_type='application/json')
+
+    async def alist(self, request, *args, **kwargs):
+        if not self.stream_requested(request):
+            return await super().alist(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        envelope, rows = self.stream_rows(request, queryset, count=await queryset.acount())
+        rows, represent = self.read_rows(rows)
+        rows = rows.aiterator(chunk_size=self.stream_chunk_size)
+        return StreamingHttpResponse(aiter_json(envelope, rows, represent), content_type='application/json')
@@ -0,0 +1,151 @@
+"""
+Index normalisé des technologies (projets) et compétences (certifications).
+
+Les listes JSON ``Project.technologies`` et ``Certification.skills`` restent la
+source ; chaque nom est rattaché à un ``Tag`` unique par clé normalisée
+(casse repliée, espaces réduits) via les tables de liaison
+``ProjectTechnology`` / ``CertificationSkill``, mises à jour à chaque
+enregistrement. Les filtres ``?technology=`` / ``?skill=`` deviennent des
+jointures indexées et ``Tag.project_count`` / ``certification_count``
+fournissent les facettes sans parcourir les lignes.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, pre_delete
+
+from .models import Certification, CertificationSkill, Project, ProjectTechnology, Tag
+
+
+@dataclass(frozen=True)
+class Tagging:
+    field: str  # Liste JSON source
+    through: type
+    owner: str  # Clé étrangère vers l'objet tagué
+    counter: str  # Compteur sur Tag
+
+
+TAGGINGS = {
+    Project: Tagging('technologies', ProjectTechnology, 'project', 'project_count'),
+    Certification: Tagging('skills', CertificationSkill, 'certification', 'certification_count'),
+}
+
+TAG_MODELS = tuple(TAGGINGS)
+
+
+def normalize(name):
+    """Clé de vocabulaire : ``' React  JS'`` -> ``'react js'``."""
+    return ' '.join(str(name).split()).casefold()[:100]
+
+
+def split_keys(value):
+    """Clés normalisées d'un paramètre ``?technology=react,Node.js``."""
+    return [key for key in (normalize(part) for part in value.split(',')) if key]
+
+
+def get_tags(names):
+    """``{clé: Tag}`` pour ``names``, en créant les tags manquants."""
+    display = {}
+    for name in names:
+        key = normalize(name)
+        if key:
+            display.setdefault(key, ' '.join(str(name).split())[:100])
+    tags = {tag.key: tag for tag in Tag.objects.filter(key__in=display)}
+    missing = [Tag(key=key, name=name) for key, name in display.items() if key not in tags]
+    if missing:
+        Tag.objects.bulk_create(missing, ignore_conflicts=True)
+        tags.update((tag.key, tag) for tag in Tag.objects.filter(key__in=[tag.key for tag in missing]))
+    return tags
+
+
+def apply_counts(counter, deltas):
+    by_delta = {}
+    for tag_id, delta in deltas.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(tag_id)
+    for delta, tag_ids in by_delta.items():
+        Tag.objects.filter(pk__in=tag_ids).update(**{counter: F(counter) + delta})
+
+
+def sync(model, names_by_pk):
+    """Aligne les liaisons de ``{pk: [noms]}`` sur les listes JSON et met à jour les compteurs."""
+    tagging = TAGGINGS[model]
+    owner_id = f'{tagging.owner}_id'
+    tags = get_tags(name for names in names_by_pk.values() for name in names or [])
+    wanted = {
+        pk: {tags[normalize(name)].pk for name in names or [] if normalize(name) in tags}
+        for pk, names in names_by_pk.items()
+    }
+    current = {}
+    for pk, tag_id in tagging.through.objects.filter(**{f'{owner_id}__in': list(wanted)}).values_list(owner_id, 'tag_id'):
+        current.setdefault(pk, set()).add(tag_id)
+
+    deltas, to_create = Counter(), []
+    for pk, tag_ids in wanted.items():
+        existing = current.get(pk, set())
+        for tag_id in tag_ids - existing:
+            to_create.append(tagging.through(**{owner_id: pk, 'tag_id': tag_id}))
+            deltas[tag_id] += 1
+        stale = existing - tag_ids
+        if stale:
+            tagging.through.objects.filter(**{owner_id: pk, 'tag_id__in': stale}).delete()
+            deltas.update({tag_id: -1 for tag_id in stale})
+    if to_create:
+        tagging.through.objects.bulk_create(to_create, batch_size=500)
+    apply_counts(tagging.counter, deltas)
+
+
+def rebuild(*models, batch_size=500):
+    """Resynchronise toutes les liaisons de ``models`` (tous par défaut) puis recompte."""
+    for model in models or TAG_MODELS:
+        tagging = TAGGINGS[model]
+        batch = {}
+        for pk, names in model.objects.order_by().values_list('pk', tagging.field).iterator():
+            batch[pk] = names
+            if len(batch) >= batch_size:
+                sync(model, batch)
+                batch = {}
+        if batch:
+            sync(model, batch)
+        counts = tagging.through.objects.filter(tag=OuterRef('pk')).order_by().values('tag').annotate(n=Count('pk')).values('n')
+        Tag.objects.update(**{tagging.counter: Coalesce(Subquery(counts), 0)})
+
+
+def on_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    field = TAGGINGS[sender].field
+    if update_fields is not None and field not in update_fields:
+        return
+    sync(sender, {instance.pk: getattr(instance, field)})
+
+
+def on_deleted(sender, instance, **kwargs):
+    # Avant la suppression en cascade des liaisons, pour décrémenter les compteurs
+    sync(sender, {instance.pk: []})
+
+
+def connect():
+    for model in TAG_MODELS:
+        post_save.connect(on_saved, sender=model, dispatch_uid=f'tags_saved_{model.__name__}')
+        pre_delete.connect(on_deleted, sender=model, dispatch_uid=f'tags_deleted_{model.__name__}')
+
+
+def facets(kind=None):
+    """Tags utilisés avec leurs nombres de projets et de certifications, du plus fréquent au moins fréquent."""
+    queryset = Tag.objects.all()
+    if kind == 'technology':
+        queryset = queryset.filter(project_count__gt=0).order_by('-project_count', 'key')
+    elif kind == 'skill':
+        queryset = queryset.filter(certification_count__gt=0).order_by('-certification_count', 'key')
+    else:
+        queryset = queryset.exclude(project_count=0, certification_count=0).order_by(
+            (F('project_count') + F('certification_count')).desc(), 'key',
+        )
+    return [
+        {'name': name, 'key': key, 'projects': projects, 'certifications': certifications}
+        for name, key, projects, certifications in queryset.values_list(
+            'name', 'key', 'project_count', 'certification_count',
+        )
+    ]
@@ -0,0 +1,118 @@
+"""
+Socle commun des tests de l'API.
+
+``ApiTestCase`` sème un portfolio (``seeding.seed``, volumes dans ``SEED``)
+une fois par classe et isole tout ce qui s'écrit hors de la base : magasin
+d'assets, spool des messages, seaux de limitation et réponses matérialisées
+vivent dans un dossier temporaire supprimé en fin de classe.
+"""
+
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from api import images, ingest, seeding
+from api.models import Message, Profile
+from portfolio.urls import router
+
+
+# Plus d'une page (PAGE_SIZE = 100) de projets, images minuscules
+SEED = {'projects': 120, 'certifications': 10, 'education': 5, 'messages': 300, 'image_size': 2_000}
+
+
+def explain(sql):
+    """Plan d'exécution de ``sql`` sur la base courante."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+            return '\n'.join(row[-1] for row in cursor.fetchall())
+        if connection.vendor == 'postgresql':
+            # Sans seq scan, un Seq Scan restant signifie qu'aucun index n'est utilisable
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('EXPLAIN ' + sql)
+            return '\n'.join(row[0] for row in cursor.fetchall())
+    return ''
+
+
+def full_scans(plan, table):
+    if connection.vendor == 'sqlite':
+        return [line for line in plan.splitlines() if re.search(rf'\bSCAN {table}\b(?! USING)', line)]
+    return [line for line in plan.splitlines() if f'Seq Scan on {table}' in line]
+
+
+class ApiTestCase(TestCase):
+    SEED = SEED
+
+    @classmethod
+    def setUpClass(cls):
+        cls.var_dir = Path(tempfile.mkdtemp(prefix='portfolio-test-'))
+        cls.var_settings = override_settings(
+            ASSETS_ROOT=cls.var_dir / 'assets',
+            MATERIALIZED_ROOT=cls.var_dir / 'materialized',
+            MESSAGE_SPOOL_DIR=cls.var_dir / 'spool' / 'messages',
+            THROTTLE_DB=cls.var_dir / 'throttle.sqlite3',
+            MATERIALIZE_RESPONSES=False,
+        )
+        cls.var_settings.enable()
+        try:
+            super().setUpClass()
+        except Exception:
+            cls.var_settings.disable()
+            shutil.rmtree(cls.var_dir, ignore_errors=True)
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            super().tearDownClass()
+        finally:
+            cls.var_settings.disable()
+            shutil.rmtree(cls.var_dir, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        seeding.seed(**cls.SEED)
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        cls.detail_pks = {
+            'profile': Profile.objects.values_list('pk', flat=True).first(),
+            'message': Message.objects.values_list('pk', flat=True).first(),
+        }
+
+    def setUp(self):
+        caches['api'].clear()
+        # Le spool n'est pas annulé avec la transaction du test
+        shutil.rmtree(ingest.spool_root(), ignore_errors=True)
+        # État mémorisé par le processus pour un autre dossier temporaire
+        ingest._depth['count'] = None
+        images._manifests.clear()
+        # Déclinaisons générées explicitement par les tests, pas par le pool de workers
+        patcher = mock.patch('api.images.schedule')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, url, admin=False):
+        """``(réponse, requêtes SQL)`` de ``GET url``, cache de réponses vidé."""
+        caches['api'].clear()
+        if admin:
+            self.client.force_login(self.admin)
+        else:
+            self.client.logout()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        return response, context.captured_queries
+
+    def routes(self):
+        """``(basename, liste, détail)`` de chaque route du routeur."""
+        for prefix, viewset, basename in router.registry:
+            model = getattr(viewset, 'queryset', None)
+            model = model.model if model is not None else Profile
+            pk = self.detail_pks.get(basename) or model.objects.values_list('pk', flat=True).first()
+            yield basename, f'/api/{prefix}/', f'/api/{prefix}/{pk}/'
@@ -0,0 +1,66 @@
+"""Rétention des messages : archivage par lots, consultation et restauration."""
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+from api import archive
+from api.models import ArchivedMessage, Message
+from api.tests.base import ApiTestCase
+
+
+class ArchiveTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.old = timezone.now() - timedelta(days=400)
+        pks = list(Message.objects.order_by('pk').values_list('pk', flat=True)[:12])
+        Message.objects.filter(pk__in=pks[:10]).update(read=True, created_at=self.old)
+        # Ancien mais non lu : reste dans la boîte de réception
+        Message.objects.filter(pk__in=pks[10:]).update(read=False, created_at=self.old)
+        self.archived_pks = pks[:10]
+
+    def total_messages(self):
+        return self.get('/api/stats/')[0].json()['totalMessages']
+
+    def test_old_read_messages_are_archived_in_chunks(self):
+        count, total = Message.objects.count(), self.total_messages()
+        self.assertEqual(archive.archive(days=365, dry_run=True), 10)
+        self.assertEqual(Message.objects.count(), count)
+        self.assertEqual(archive.archive(days=365, chunk_size=3), 10)
+        self.assertFalse(Message.objects.filter(pk__in=self.archived_pks).exists())
+        self.assertEqual(Message.objects.count(), count - 10)
+        self.assertEqual(
+            sorted(ArchivedMessage.objects.values_list('original_id', flat=True)), self.archived_pks,
+        )
+        self.assertTrue(all(created_at == self.old for created_at in ArchivedMessage.objects.values_list('created_at', flat=True)))
+        self.assertEqual(self.total_messages(), total - 10)
+        self.assertEqual(archive.archive(days=365), 0)
+
+    def test_archives_are_admin_only_and_searchable(self):
+        archive.archive(days=365)
+        self.assertEqual(self.client.get('/api/archived-messages/').status_code, 403)
+        self.client.force_login(self.admin)
+        self.assertEqual(len(self.client.get('/api/archived-messages/').json()['results']), 10)
+        email = ArchivedMessage.objects.values_list('email', flat=True).first()
+        results = self.client.get(f'/api/archived-messages/?email={email}').json()['results']
+        self.assertEqual([result['email'] for result in results], [email])
+        self.assertEqual(len(self.client.get('/api/archived-messages/?q=visiteur').json()['results']), 10)
+        self.assertEqual(self.client.get('/api/archived-messages/?q=introuvable').json()['results'], [])
+
+    def test_restore_puts_the_message_back(self):
+        archive.archive(days=365)
+        archived = ArchivedMessage.objects.order_by('pk').first()
+        total = self.total_messages()
+        self.client.force_login(self.admin)
+        response = self.client.post(f'/api/archived-messages/{archived.pk}/restore/')
+        self.assertEqual(response.status_code, 201)
+        message = Message.objects.get(pk=response.json()['id'])
+        self.assertEqual((message.email, message.subject, message.read), (archived.email, archived.subject, True))
+        self.assertEqual(message.created_at, self.old)
+        self.assertFalse(ArchivedMessage.objects.filter(pk=archived.pk).exists())
+        self.assertEqual(self.total_messages(), total + 1)
+        self.client.force_login(self.admin)
+        self.assertEqual(self.client.post(f'/api/archived-messages/{archived.pk}/restore/').status_code, 404)
+        self.client.logout()
+        other = ArchivedMessage.objects.values_list('pk', flat=True).first()
+        self.assertEqual(self.client.post(f'/api/archived-messages/{other}/restore/').status_code, 403)
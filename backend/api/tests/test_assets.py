@@ -0,0 +1,73 @@
+"""Magasin d'assets : types acceptés, références courtes, service des fichiers."""
+
+import base64
+import hashlib
+
+from api import assets, seeding
+from api.tests.base import ApiTestCase
+
+
+def data_uri(mime, content):
+    return f'data:{mime};base64,' + base64.b64encode(content).decode('ascii')
+
+
+class AssetTests(ApiTestCase):
+    def project(self, image):
+        return {'title': 'Avec image', 'description': 'Test', 'image': image, 'technologies': [], 'category': 'web'}
+
+    def test_only_raster_images_and_pdf_are_stored(self):
+        for mime in ('text/html', 'image/svg+xml', 'application/javascript', 'text/plain'):
+            with self.subTest(mime=mime):
+                with self.assertRaises(ValueError):
+                    assets.store_data_uri(data_uri(mime, b'<script>alert(1)</script>'))
+        with self.assertRaises(ValueError):
+            assets.store_data_uri('data:image/png;base64')
+        ref = assets.store_data_uri(data_uri('application/pdf', b'%PDF-1.4'))
+        self.assertRegex(ref, r'^/api/assets/[0-9a-f]{64}\.pdf$')
+
+    def test_rejected_types_are_a_validation_error(self):
+        svg = data_uri('image/svg+xml', b'<svg onload="alert(1)"/>')
+        response = self.client.post('/api/projects/', self.project(svg), content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'image': ['Invalid data URI.']})
+        self.assertFalse(list(assets.asset_root().rglob('*.svg')))
+
+    def test_malformed_base64_is_a_validation_error(self):
+        for image in ('data:image/png;base64,@@@@', 'data:image/png;base64,iVBORw0K<script>'):
+            with self.subTest(image=image):
+                response = self.client.post('/api/projects/', self.project(image), content_type='application/json')
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'image': ['Invalid data URI.']})
+        # Retours à la ligne des encodeurs MIME : acceptés
+        png = seeding.make_image(500, seed=98)
+        wrapped = base64.encodebytes(png).decode('ascii')
+        self.assertEqual(assets.parse_data_uri('data:image/png;base64,' + wrapped), ('image/png', png))
+
+    def test_stored_images_are_served_as_immutable_assets(self):
+        png = seeding.make_image(500, seed=99)
+        response = self.client.post('/api/projects/', self.project(data_uri('image/png', png)), content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        name = hashlib.sha256(png).hexdigest() + '.png'
+        self.assertEqual(response.json()['image'], 'http://testserver/api/assets/' + name)
+        self.assertTrue(assets.asset_path(name).exists())
+
+        response = self.client.get('/api/assets/' + name)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['X-Content-Type-Options'], 'nosniff')
+        self.assertEqual(b''.join(response.streaming_content), png)
+        self.assertEqual(self.client.post('/api/assets/' + name).status_code, 405)
+        # Compatibilité : data URI d'origine avec ?inline=true
+        projects = self.client.get('/api/projects/?inline=true&fields=id,image').json()['results']
+        self.assertIn(data_uri('image/png', png), [project['image'] for project in projects])
+
+    def test_unknown_or_disallowed_assets_are_not_found(self):
+        digest = hashlib.sha256(b'<script>alert(1)</script>').hexdigest()
+        # Écrit directement (ancien magasin) : jamais servi
+        path = assets.asset_path(digest + '.html')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'<script>alert(1)</script>')
+        for url in (f'/api/assets/{digest}.html', f'/api/assets/{digest}.png', '/api/assets/../settings.py', f'/api/assets/{digest}/320.svg'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 404)
@@ -0,0 +1,63 @@
+"""Lectures asynchrones (``ASYNC_READS``) : mêmes réponses que les vues synchrones."""
+
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import include, path
+
+from api import materialize, warmup
+from api.async_views import async_urls
+from api.models import Project
+from api.tests.base import ApiTestCase
+from portfolio.urls import router, urlpatterns as root_urlpatterns
+
+
+# URLconf du mode ASGI (ASYNC_READS=True)
+urlpatterns = [path('api/', include(async_urls(router.urls))), *root_urlpatterns]
+
+
+class AsyncReadTests(ApiTestCase):
+    async def test_async_reads_match_sync_views(self):
+        routes = await sync_to_async(lambda: list(self.routes()))()
+        for basename, list_url, detail_url in routes:
+            if basename == 'archived-message':
+                continue
+            for url in (list_url, detail_url, list_url + '?fields=id'):
+                with self.subTest(url=url):
+                    expected, queries = await sync_to_async(self.get)(url)
+                    caches['api'].clear()
+                    with override_settings(ROOT_URLCONF=__name__):
+                        response = await self.async_client.get(url)
+                    self.assertEqual(response.status_code, expected.status_code)
+                    self.assertEqual(response.content, expected.content)
+                    self.assertEqual(response.get('ETag'), expected.get('ETag'))
+
+
+@override_settings(ASYNC_READS=True, ROOT_URLCONF=__name__)
+class AsyncInternalDispatchTests(ApiTestCase):
+    """Appels internes des vues (lots, matérialisation, préchauffage) quand elles sont asynchrones."""
+
+    def test_batch_dispatches_to_async_views(self):
+        self.client.force_login(self.admin)
+        pk = Project.objects.values_list('pk', flat=True).first()
+        operations = [
+            {'method': 'GET', 'resource': 'projects', 'id': pk},
+            {'method': 'PATCH', 'resource': 'projects', 'id': pk, 'data': {'featured': True}},
+            {'method': 'GET', 'resource': 'profile'},
+        ]
+        response = self.client.post('/api/batch/', {'operations': operations}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['status'] for result in response.json()['results']], [200, 200, 200])
+        self.assertEqual(response.json()['results'][0]['data']['id'], pk)
+        self.assertTrue(Project.objects.get(pk=pk).featured)
+
+    def test_materialize_renders_async_views(self):
+        with override_settings(MATERIALIZE_RESPONSES=True):
+            written = materialize.materialize()
+        self.assertEqual(set(written), set(materialize.ENDPOINTS))
+
+    def test_warmup_renders_async_views(self):
+        with override_settings(WARMUP_ON_START=True), mock.patch('api.warmup.connections.close_all'):
+            self.assertEqual(warmup.run(), list(materialize.ENDPOINTS))
@@ -0,0 +1,48 @@
+"""Opérations groupées ``/api/batch/`` : une transaction, rien d'annulé ne reste en file."""
+
+from api import ingest
+from api.models import Message
+from api.tests.base import ApiTestCase
+
+
+class BatchTests(ApiTestCase):
+    def test_batch_rolls_back_on_first_error(self):
+        self.client.force_login(self.admin)
+        pks = list(Message.objects.filter(read=False).values_list('pk', flat=True)[:3])
+        operations = [{'method': 'PATCH', 'resource': 'messages', 'id': pk, 'data': {'read': True}} for pk in pks]
+        missing = {'method': 'PATCH', 'resource': 'projects', 'id': 0, 'data': {}}
+        contact = {'method': 'POST', 'resource': 'messages', 'data': {
+            'name': 'Lot', 'email': 'batch@example.com', 'subject': 'Annulé', 'message': 'Bonjour',
+        }}
+        response = self.client.post(
+            '/api/batch/', {'operations': [contact] + operations[:2] + [missing] + operations[2:]},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([result['status'] for result in response.json()['results']], [201, 200, 200, 404, None])
+        self.assertFalse(Message.objects.filter(pk__in=pks, read=True).exists())
+        self.assertFalse(Message.objects.filter(email='batch@example.com').exists())
+        self.assertEqual(ingest.pending_files(), [])
+        response = self.client.post('/api/batch/', {'operations': operations}, content_type='application/json')
+        self.assertTrue(response.json()['committed'])
+        self.assertEqual(Message.objects.filter(pk__in=pks, read=True).count(), 3)
+
+    def test_non_atomic_batch_keeps_successful_operations(self):
+        self.client.force_login(self.admin)
+        pk = Message.objects.filter(read=False).values_list('pk', flat=True).first()
+        operations = [
+            {'method': 'PATCH', 'resource': 'messages', 'id': pk, 'data': {'read': True}},
+            {'method': 'DELETE', 'resource': 'projects', 'id': 0},
+        ]
+        response = self.client.post(
+            '/api/batch/', {'atomic': False, 'operations': operations}, content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['status'] for result in response.json()['results']], [200, 404])
+        self.assertTrue(Message.objects.get(pk=pk).read)
+
+    def test_invalid_batches_are_rejected(self):
+        for body in ({'operations': []}, {'operations': [{'method': 'GET', 'resource': 'users'}]}, []):
+            with self.subTest(body=body):
+                response = self.client.post('/api/batch/', body, content_type='application/json')
+                self.assertEqual(response.status_code, 400)
@@ -0,0 +1,81 @@
+"""Cache des réponses : invalidation par génération à chaque modification."""
+
+from django.conf import settings
+from django.core.cache.backends.filebased import FileBasedCache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from api.cache import generation_key
+from api.models import Education, Project
+from api.signals import batch_changes
+from api.tests.base import ApiTestCase
+
+
+class CacheTests(ApiTestCase):
+    def test_cache_is_invalidated_on_save_and_delete(self):
+        project = Project.objects.order_by('pk').first()
+        url = f'/api/projects/{project.pk}/'
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+        project.title = 'Titre modifié'
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['title'], 'Titre modifié')
+
+        count = self.client.get('/api/projects/').json()['count']
+        with self.captureOnCommitCallbacks(execute=True):
+            project.delete()
+        self.assertEqual(self.client.get('/api/projects/').json()['count'], count - 1)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_other_models_keep_their_entries(self):
+        self.client.get('/api/education/')
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.update(featured=True)
+            Project.objects.first().save()
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.client.get('/api/education/')['X-Cache'], 'HIT')
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_grouped_changes_notify_once_per_model(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with batch_changes():
+                for education in Education.objects.all():
+                    education.description = 'Modifiée'
+                    education.save()
+        self.assertEqual(len(callbacks), 1)
+
+    def test_stats_endpoint_counts_hits_and_misses(self):
+        self.client.get('/api/education/')
+        self.client.get('/api/education/')
+        stats = self.client.get('/api/cache/stats/').json()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hitRate'], 0.5)
+
+    def test_workers_sharing_a_file_cache_see_each_other_writes(self):
+        location = str(self.var_dir / 'cache')
+        api_cache = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}
+        with override_settings(CACHES={**settings.CACHES, 'api': api_cache}):
+            # Même dossier, autre instance : le cache tel que le voit un autre worker
+            other = FileBasedCache(location, {})
+            self.client.get('/api/education/')
+            snapshot = self.client.get('/api/portfolio/')
+            self.assertEqual(self.client.get('/api/education/')['X-Cache'], 'HIT')
+
+            education = Education.objects.order_by('pk').first()
+            education.school = 'Vue par tous'
+            with self.captureOnCommitCallbacks(execute=True):
+                education.save()
+            self.assertIsNotNone(other.get(generation_key(Education)))
+
+            # Écriture traitée par l'autre worker : seule sa génération change ici
+            Education.objects.filter(pk=education.pk).update(school='Écrit ailleurs')
+            other.incr(generation_key(Education))
+            self.assertEqual(self.client.get('/api/education/')['X-Cache'], 'MISS')
+            response = self.client.get('/api/portfolio/')
+            self.assertNotEqual(response.content, snapshot.content)
+            self.assertIn('Écrit ailleurs', [item['school'] for item in response.json()['education']])
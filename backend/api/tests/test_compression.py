@@ -0,0 +1,42 @@
+"""Compression des réponses : négociation, seuil et cache des corps compressés."""
+
+import gzip
+import warnings
+from unittest import mock
+
+from django.core.cache import CacheKeyWarning
+
+from django.http import HttpResponse
+from django.test import override_settings
+
+from api import compression
+from api.tests.base import ApiTestCase
+
+
+class CompressionTests(ApiTestCase):
+    def test_compressed_bodies_are_cached_by_content(self):
+        identity = self.client.get('/api/projects/')
+        response = self.client.get('/api/projects/', HTTP_ACCEPT_ENCODING='gzip, br;q=0')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), identity.content)
+        self.assertEqual(response['ETag'], identity['ETag'])
+        self.assertIn('Accept-Encoding', response['Vary'])
+        with mock.patch('api.compression.compress', side_effect=AssertionError('recompressed')):
+            self.assertEqual(self.client.get('/api/projects/', HTTP_ACCEPT_ENCODING='gzip').content, response.content)
+        with override_settings(COMPRESSION_MIN_SIZE=len(identity.content) + 1):
+            self.assertFalse(self.client.get('/api/projects/', HTTP_ACCEPT_ENCODING='gzip').has_header('Content-Encoding'))
+        # Même ETag, corps différent (déclinaisons d'images prêtes) : pas de corps périmé
+        stale, fresh = HttpResponse(b'{"imageSrcset": null}'), HttpResponse(b'{"imageSrcset": {}}')
+        stale['ETag'] = fresh['ETag'] = '"same"'
+        compression.compressed_content(stale, 'gzip')
+        self.assertEqual(gzip.decompress(compression.compressed_content(fresh, 'gzip')), fresh.content)
+
+    def test_cache_keys_are_memcached_safe(self):
+        response = HttpResponse(b'{}' * 1024, content_type='application/json; charset=utf-8')
+        key = compression.cache_key(response, 'gzip')
+        self.assertRegex(key, r'^gzip:[0-9a-f]{40}$')
+        html = HttpResponse(response.content, content_type='text/html; charset=utf-8')
+        self.assertNotEqual(compression.cache_key(html, 'gzip'), key)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', CacheKeyWarning)
+            compression.compressed_content(response, 'gzip')
@@ -0,0 +1,61 @@
+"""GET conditionnels : ETag, Last-Modified, 304 et clés invalides."""
+
+from django.utils.http import http_date
+
+from api import images
+from api.models import Project
+from api.tests.base import ApiTestCase
+
+
+class ConditionalGetTests(ApiTestCase):
+    def test_current_validators_get_a_304(self):
+        pk = Project.objects.values_list('pk', flat=True).first()
+        for url in ('/api/projects/', f'/api/projects/{pk}/', '/api/profile/', '/api/stats/', '/api/portfolio/'):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+                self.assertEqual(not_modified.status_code, 304)
+                self.assertEqual(not_modified.content, b'')
+                self.assertEqual(not_modified['ETag'], response['ETag'])
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='W/"other"').status_code, 200)
+        response = self.client.get(f'/api/projects/{pk}/')
+        self.assertIn('Last-Modified', response)
+        self.assertNotIn('Last-Modified', self.client.get('/api/projects/'))
+        self.assertEqual(self.client.get(f'/api/projects/{pk}/', HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 304)
+
+    def test_changes_invalidate_validators(self):
+        project = Project.objects.order_by('pk').first()
+        url = f'/api/projects/{project.pk}/'
+        etag = self.client.get(url)['ETag']
+        collection_etag = self.client.get('/api/projects/')['ETag']
+        project.title = 'Renommé'
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Renommé')
+        self.assertNotEqual(self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=collection_etag).status_code, 304)
+
+    def test_derivatives_change_the_etag(self):
+        project = Project.objects.order_by('pk').first()
+        url = f'/api/projects/{project.pk}/'
+        response = self.client.get(url)
+        self.assertIsNone(response.json()['imageSrcset'])
+        with self.captureOnCommitCallbacks(execute=True):
+            images.generate(project.image)
+            images.mark_changed(Project, [project.image])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.json()['imageSrcset'])
+
+    def test_stale_if_modified_since_is_ignored(self):
+        pk = Project.objects.values_list('pk', flat=True).first()
+        self.assertEqual(self.client.get(f'/api/projects/{pk}/', HTTP_IF_MODIFIED_SINCE=http_date(0)).status_code, 200)
+
+    def test_invalid_pks_are_not_found(self):
+        self.client.force_login(self.admin)
+        for prefix in ('profile', 'projects', 'education', 'certifications', 'messages', 'stats'):
+            for pk in ('abc', '0', '99999999'):
+                with self.subTest(prefix=prefix, pk=pk):
+                    self.assertEqual(self.client.get(f'/api/{prefix}/{pk}/').status_code, 404)
@@ -0,0 +1,34 @@
+"""Export ``/api/export/`` : flux réservé aux administrateurs, références d'assets brutes."""
+
+import json
+
+from api import assets
+from api.models import Certification, Project
+from api.tests.base import ApiTestCase
+
+
+class ExportTests(ApiTestCase):
+    def export(self, query=''):
+        self.client.force_login(self.admin)
+        response = self.client.get('/api/export/' + query)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment', response['Content-Disposition'])
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_export_requires_an_admin(self):
+        self.assertEqual(self.client.get('/api/export/').status_code, 403)
+
+    def test_export_contains_every_collection(self):
+        document = self.export()
+        self.assertEqual(set(document), {'profile', 'projects', 'education', 'certifications', 'messages', 'stats'})
+        self.assertEqual(len(document['projects']), Project.objects.count())
+        self.assertEqual(document['profile']['name'], 'Abdoul Salam Diallo')
+        # Références du magasin telles qu'en base, pour un ré-import
+        self.assertTrue(all(assets.is_asset_ref(project['image']) for project in document['projects']))
+
+    def test_export_selected_collections_with_inline_assets(self):
+        document = self.export('?collections=certifications&assets=true')
+        self.assertEqual(list(document), ['certifications'])
+        self.assertEqual(len(document['certifications']), Certification.objects.count())
+        self.assertTrue(all(item['image'].startswith('data:image/png;base64,') for item in document['certifications']))
@@ -0,0 +1,36 @@
+"""Déclinaisons responsive des images : génération, srcset et sources illisibles."""
+
+from api import assets, images, seeding
+from api.models import Project
+from api.tests.base import ApiTestCase
+
+
+class ImageDerivativeTests(ApiTestCase):
+    def test_srcset_lists_generated_widths(self):
+        project = Project.objects.order_by('pk').first()
+        manifest = images.generate(project.image)
+        self.assertEqual(set(manifest), {'webp', 'jpeg'})
+        digest = assets.asset_digest(project.image)
+        for width in manifest['webp']:
+            self.assertTrue((images.derivatives_dir(digest) / f'{width}.webp').exists())
+        srcset = images.srcset(project.image)
+        self.assertIn(f'/api/assets/{digest}/{manifest["jpeg"][0]}.jpg', srcset['jpeg'])
+        response = self.client.get(f'/api/assets/{digest}/{manifest["webp"][0]}.webp')
+        self.assertEqual(response['Content-Type'], 'image/webp')
+
+    def test_broken_source_does_not_stop_the_others(self):
+        broken = assets.ASSET_URL_PREFIX + assets.store_bytes(b'not a png', 'image/png')
+        valid = assets.ASSET_URL_PREFIX + assets.store_bytes(seeding.make_image(2_000, seed=7), 'image/png')
+        with_broken, with_valid = Project.objects.order_by('pk')[:2]
+        Project.objects.filter(pk=with_broken.pk).update(image=broken)
+        Project.objects.filter(pk=with_valid.pk).update(image=valid)
+        before = Project.objects.get(pk=with_valid.pk).updated_at
+
+        with self.assertLogs('api.images', 'ERROR') as logs, self.captureOnCommitCallbacks(execute=True):
+            images.process(Project, [broken, valid])
+        self.assertIn(broken, logs.output[0])
+        self.assertIsNone(images.get_manifest(assets.asset_digest(broken)))
+        self.assertIsNotNone(images.get_manifest(assets.asset_digest(valid)))
+        # Le srcset de l'image valide a changé : ETag et cache aussi
+        self.assertGreater(Project.objects.get(pk=with_valid.pk).updated_at, before)
+        self.assertIsNotNone(self.client.get(f'/api/projects/{with_valid.pk}/').json()['imageSrcset'])
@@ -0,0 +1,71 @@
+"""Import ``db.json`` : aller-retour avec l'export, idempotence, doublons et dates d'origine."""
+
+import io
+import json
+
+from api.exporter import iter_export
+from api.importer import Importer
+from api.models import Education, Message, Project
+from api.tests.base import ApiTestCase
+
+
+def run_import(document, **kwargs):
+    options = {name: kwargs.pop(name) for name in ('collections', 'dry_run') if name in kwargs}
+    return Importer(**kwargs).run(io.StringIO(json.dumps(document)), **options)
+
+
+class ImporterTests(ApiTestCase):
+    def export(self, *collections):
+        return json.loads(''.join(iter_export(list(collections))))
+
+    def test_export_import_round_trip(self):
+        document = self.export('projects', 'education', 'messages')
+        created_at = dict(Message.objects.values_list('email', 'created_at'))
+        Project.objects.all().delete()
+        Message.objects.all().delete()
+
+        reports = run_import(document, batch_size=50)
+        self.assertEqual(reports['projects'].created, len(document['projects']))
+        self.assertEqual(reports['messages'].created, len(document['messages']))
+        self.assertEqual(reports['education'].unchanged, len(document['education']))
+        self.assertEqual(dict(Message.objects.values_list('email', 'created_at')), created_at)
+        self.assertEqual(self.export('projects', 'education')['education'], document['education'])
+        # Contenu identique hors identifiants (le serializer retire les espaces de bord)
+        strip = lambda items: sorted(
+            (dict(item, id=None, description=item['description'].strip()) for item in items), key=lambda item: item['title'],
+        )
+        self.assertEqual(strip(self.export('projects')['projects']), strip(document['projects']))
+
+        reports = run_import(document)
+        self.assertEqual({name: (report.created, report.updated) for name, report in reports.items()},
+                         {'projects': (0, 0), 'education': (0, 0), 'messages': (0, 0)})
+
+    def test_changed_rows_are_updated(self):
+        document = self.export('education')
+        document['education'][0]['description'] = 'Nouvelle description'
+        report = run_import(document)['education']
+        self.assertEqual((report.updated, report.unchanged), (1, len(document['education']) - 1))
+        self.assertTrue(Education.objects.filter(description='Nouvelle description').exists())
+
+    def test_duplicates_and_invalid_items_are_reported(self):
+        project = {'title': 'Doublon', 'description': 'A', 'image': 'https://example.com/a.png', 'technologies': ['Go'], 'category': 'web'}
+        document = {'projects': [project, dict(project, description='B'), {'title': 'Sans catégorie'}]}
+        report = run_import(document, batch_size=1)['projects']
+        self.assertEqual((report.created, report.duplicates, report.invalid), (1, 1, 1))
+        self.assertEqual(Project.objects.get(title='Doublon').description, 'A')
+        self.assertIn({'duplicate': {'title': 'Doublon'}}, report.errors)
+
+    def test_dry_run_and_prune(self):
+        count = Project.objects.count()
+        document = {'projects': self.export('projects')['projects'][:10]}
+        report = run_import(document, prune=True, dry_run=True)['projects']
+        self.assertEqual(report.pruned, count - 10)
+        self.assertEqual(Project.objects.count(), count)
+        run_import(document, prune=True)
+        self.assertEqual(Project.objects.count(), 10)
+
+    def test_message_dates_from_the_source_are_kept(self):
+        message = {'name': 'Ancien', 'email': 'ancien@example.com', 'subject': 'Archive', 'message': 'Bonjour',
+                   'read': True, 'createdAt': '2020-01-02T03:04:05Z'}
+        run_import({'messages': [message]})
+        self.assertEqual(Message.objects.get(email='ancien@example.com').created_at.isoformat(), '2020-01-02T03:04:05+00:00')
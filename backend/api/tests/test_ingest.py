@@ -0,0 +1,96 @@
+"""Formulaire de contact en write-behind : spool, vidage par lots, contre-pression, rejeu et rebut."""
+
+import json
+import os
+from unittest import mock
+
+from django.test import override_settings
+from django.utils.dateparse import parse_datetime
+
+from api import ingest
+from api.models import Message
+from api.tests.base import ApiTestCase
+
+
+CONTACT = {'name': 'Visiteur', 'email': 'contact@example.org', 'subject': 'Projet', 'message': 'Bonjour'}
+
+
+@override_settings(MESSAGES_WRITE_BEHIND=True, THROTTLE_ENABLED=False)
+class IngestTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        # Vidage appelé par le test, dans sa transaction
+        patcher = mock.patch('api.ingest.ensure_flusher')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post(self, **data):
+        return self.client.post('/api/messages/', dict(CONTACT, **data), content_type='application/json')
+
+    def test_messages_are_spooled_then_flushed(self):
+        count = Message.objects.count()
+        response = self.post(read=True, createdAt='2000-01-01T00:00:00Z')
+        self.assertEqual(response.status_code, 202)
+        # ``read`` et ``createdAt`` sont fixés par le serveur
+        self.assertFalse(response.json()['read'])
+        self.assertNotEqual(response.json()['createdAt'], '2000-01-01T00:00:00Z')
+        self.assertEqual(len(ingest.pending_files()), 1)
+        self.assertEqual(Message.objects.count(), count)
+
+        unread = self.get('/api/stats/')[0].json()['unreadMessages']
+        self.assertEqual(ingest.flush(), 1)
+        self.assertEqual(ingest.pending_files(), [])
+        message = Message.objects.get(email=CONTACT['email'])
+        self.assertFalse(message.read)
+        self.assertEqual(message.created_at, parse_datetime(response.json()['createdAt']))
+        self.assertEqual(self.get('/api/stats/')[0].json()['unreadMessages'], unread + 1)
+
+    def test_invalid_messages_are_not_spooled(self):
+        response = self.post(email='pas-un-email')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.json())
+        self.assertEqual(ingest.pending_files(), [])
+
+    @override_settings(MESSAGE_QUEUE_MAX=2)
+    def test_full_queue_is_a_503(self):
+        self.assertEqual(self.post().status_code, 202)
+        self.assertEqual(self.post().status_code, 202)
+        response = self.post()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '30')
+        self.assertEqual(len(ingest.pending_files()), 2)
+        ingest.flush()
+        ingest._depth['count'] = None
+        self.assertEqual(self.post().status_code, 202)
+
+    def test_claimed_files_of_dead_processes_are_replayed_once(self):
+        self.post()
+        name, = ingest.pending_files()
+        # Réservé par un processus disparu au milieu d'un vidage
+        claimed = ingest.claimed_dir(pid=2 ** 22 + 1)
+        claimed.mkdir(parents=True)
+        os.replace(ingest.pending_dir() / name, claimed / name)
+        self.assertEqual(ingest.flush(), 0)
+        self.assertEqual(ingest.replay(), 1)
+        self.assertEqual(ingest.pending_files(), [name])
+
+        content = (ingest.pending_dir() / name).read_bytes()
+        self.assertEqual(ingest.flush(), 1)
+        # Commit fait mais fichier encore là (arrêt brutal) : pas de doublon au rejeu
+        (ingest.pending_dir() / name).write_bytes(content)
+        self.assertEqual(ingest.flush(), 0)
+        self.assertEqual(Message.objects.filter(email=CONTACT['email']).count(), 1)
+
+    def test_rejected_and_unreadable_files_are_dead_lettered(self):
+        self.post()
+        self.post(email='autre@example.org')
+        first, second = ingest.pending_files()
+        (ingest.pending_dir() / 'corrompu.json').write_bytes(b'{"name": ')
+        path = ingest.pending_dir() / second
+        path.write_text(json.dumps(dict(json.loads(path.read_text()), email=None)))
+
+        self.assertEqual(ingest.flush(), 1)
+        self.assertEqual(ingest.pending_files(), [])
+        self.assertEqual(sorted(os.listdir(ingest.dead_dir())), sorted(['corrompu.json', second]))
+        self.assertTrue(Message.objects.filter(email=CONTACT['email']).exists())
+        self.assertEqual(list(ingest.claimed_dir().iterdir()), [])
@@ -0,0 +1,48 @@
+"""Réponses matérialisées : fichiers servis par le middleware, régénérés à chaque modification."""
+
+import gzip
+import json
+
+from django.test import override_settings
+
+from api import materialize
+from api.models import Education
+from api.tests.base import ApiTestCase
+
+
+@override_settings(MATERIALIZE_RESPONSES=True)
+class MaterializeTests(ApiTestCase):
+    def test_materialized_files_match_the_views(self):
+        written = materialize.materialize()
+        self.assertEqual(set(written), set(materialize.ENDPOINTS))
+        for name, (path, models) in materialize.ENDPOINTS.items():
+            with self.subTest(name=name):
+                with override_settings(MATERIALIZE_RESPONSES=False):
+                    expected = self.client_class().get(path, HTTP_HOST='localhost')
+                response = self.client.get(path)
+                self.assertTrue(response.streaming)
+                content = b''.join(response.streaming_content)
+                self.assertEqual(content, materialize.file_path(name).read_bytes())
+                self.assertEqual(json.loads(content), expected.json())
+
+    def test_encodings_and_conditional_requests(self):
+        materialize.materialize(['projects'])
+        response = self.client.get('/api/projects/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), materialize.file_path('projects').read_bytes())
+        self.assertEqual(self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        # Paramètres de requête ou fichier absent : chemin normal
+        self.assertFalse(self.client.get('/api/projects/?page=2').streaming)
+        self.assertFalse(self.client.get('/api/education/').streaming)
+
+    def test_files_are_refreshed_on_change(self):
+        materialize.materialize(['education'])
+        education = Education.objects.order_by('pk').first()
+        education.school = 'École matérialisée'
+        with self.captureOnCommitCallbacks(execute=True):
+            education.save()
+        content = b''.join(self.client.get('/api/education/').streaming_content)
+        self.assertIn('École matérialisée', content.decode('utf-8'))
+        materialize.discard(['education'])
+        self.assertFalse(self.client.get('/api/education/').streaming)
@@ -0,0 +1,24 @@
+"""En-tête ``Server-Timing`` et endpoint ``/metrics``."""
+
+import re
+
+from django.test import override_settings
+
+from api.tests.base import ApiTestCase
+
+
+class MetricsTests(ApiTestCase):
+    def test_server_timing_and_metrics(self):
+        response, queries = self.get('/api/projects/')
+        timing = dict(re.findall(r'(\w+);dur=([\d.]+)', response['Server-Timing']))
+        self.assertEqual(set(timing), {'db', 'serialize', 'render', 'total'})
+        self.assertIn(f'desc="{len(queries)} queries"', response['Server-Timing'])
+        self.assertGreater(float(timing['serialize']), 0)
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+        with override_settings(METRICS_TOKEN='secret'):
+            metrics = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret').content.decode()
+        self.assertRegex(metrics, r'api_requests_total\{method="GET",route="project-list",status="200"\} [1-9]')
+        self.assertIn('api_response_size_bytes_bucket{le=', metrics)
+        with override_settings(METRICS_TOKEN='secret'):
+            self.assertEqual(self.client.get('/metrics').status_code, 401)
+            self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
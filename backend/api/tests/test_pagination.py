@@ -0,0 +1,24 @@
+"""Boîte de réception : pagination par curseur, du plus récent au plus ancien."""
+
+from api.models import Message
+from api.tests.base import ApiTestCase
+
+
+class MessagePaginationTests(ApiTestCase):
+    def test_cursor_pages_cover_the_inbox_once(self):
+        self.client.force_login(self.admin)
+        seen, url = [], '/api/messages/?page_size=70'
+        while url:
+            page = self.client.get(url).json()
+            self.assertNotIn('count', page)
+            seen += [message['id'] for message in page['results']]
+            url = page['next']
+        expected = list(Message.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_read_filter_and_page_size(self):
+        self.client.force_login(self.admin)
+        page = self.client.get('/api/messages/?read=false&page_size=5').json()
+        self.assertEqual(len(page['results']), 5)
+        self.assertFalse(any(message['read'] for message in page['results']))
+        self.assertEqual(self.client.get('/api/messages/?read=maybe').status_code, 400)
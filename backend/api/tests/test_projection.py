@@ -0,0 +1,19 @@
+"""Lectures projetées (``.values()``) : même JSON que les serializers."""
+
+from django.test import override_settings
+
+from api.tests.base import ApiTestCase
+
+
+class ProjectionTests(ApiTestCase):
+    def test_projected_reads_match_serializers(self):
+        for basename, list_url, detail_url in self.routes():
+            if basename not in ('profile', 'project', 'education', 'certification'):
+                continue
+            for url in (list_url, detail_url, list_url + '?fields=id,title', list_url + '?inline=true', list_url + '?page=2'):
+                with self.subTest(url=url):
+                    with override_settings(FAST_READS=False):
+                        expected, queries = self.get(url)
+                    response, queries = self.get(url)
+                    self.assertEqual(response.status_code, expected.status_code)
+                    self.assertEqual(response.content, expected.content)
@@ -0,0 +1,126 @@
+"""
+Budgets de requêtes et plans d'exécution des endpoints de l'API.
+
+Chaque route enregistrée sur le ``DefaultRouter`` doit avoir un budget de
+requêtes SQL (liste et détail) ; les filtres indexés doivent utiliser leur
+index. Avec ``QUERY_PLAN_DIR=<dossier>``, les plans ``EXPLAIN`` capturés sont
+écrits dans ce dossier. Les tests tournent sur la base configurée : SQLite par
+défaut, PostgreSQL avec ``USE_POSTGRESQL=True``.
+"""
+
+import os
+import re
+from pathlib import Path
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api import archive
+from api.models import Message, Project
+from api.tests.base import ApiTestCase, explain, full_scans
+from portfolio.urls import router
+
+
+# basename -> (liste, détail)
+QUERY_BUDGETS = {
+    'profile': (2, 2),
+    'project': (3, 2),
+    'education': (3, 2),
+    'certification': (3, 2),
+    'message': (1, 1),
+    # Admin : + session et utilisateur
+    'archived-message': (3, 3),
+    'stats': (2, 2),
+}
+
+# Routes réservées aux administrateurs
+ADMIN_ROUTES = {'archived-message'}
+
+# (url, table) : les requêtes sur ``table`` ne doivent pas parcourir toute la table
+INDEXED_FILTERS = [
+    ('/api/projects/?category=web', 'api_project'),
+    ('/api/projects/?technology=react', 'api_project_technology'),
+    ('/api/certifications/?skill=sql', 'api_certification_skill'),
+    ('/api/messages/', 'api_message'),
+    ('/api/messages/?read=false', 'api_message'),
+    ('/api/messages/?read=false&page_size=50', 'api_message'),
+]
+
+
+class QueryBudgetTests(ApiTestCase):
+    SEED = {'projects': 300, 'certifications': 50, 'education': 20, 'messages': 20000, 'image_size': 20_000}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Les messages semés couvrent ~14 jours : archiver la première moitié
+        archive.archive(days=7, chunk_size=2000)
+        cls.detail_pks['message'] = Message.objects.values_list('pk', flat=True).first()
+
+    def get(self, url, admin=False):
+        response, queries = super().get(url, admin)
+        self.record_plans(url, queries)
+        return response, queries
+
+    def record_plans(self, url, queries):
+        directory = os.environ.get('QUERY_PLAN_DIR')
+        if not directory:
+            return
+        path = Path(directory) / (re.sub(r'[^\w]+', '_', url).strip('_') + '.txt')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for query in queries:
+                if query['sql'].lstrip().upper().startswith('SELECT'):
+                    f.write(query['sql'] + '\n' + explain(query['sql']) + '\n\n')
+
+    def test_every_route_has_a_budget(self):
+        missing = [basename for prefix, viewset, basename in router.registry if basename not in QUERY_BUDGETS]
+        self.assertEqual(missing, [], 'Routes sans budget de requêtes')
+
+    def test_query_budgets(self):
+        for basename, list_url, detail_url in self.routes():
+            list_budget, detail_budget = QUERY_BUDGETS[basename]
+            for url, budget in ((list_url, list_budget), (detail_url, detail_budget)):
+                with self.subTest(url=url):
+                    response, queries = self.get(url, admin=basename in ADMIN_ROUTES)
+                    self.assertEqual(response.status_code, 200)
+                    self.assertLessEqual(
+                        len(queries), budget,
+                        f'{url}: {len(queries)} requêtes (budget {budget})\n'
+                        + '\n'.join(query['sql'] for query in queries),
+                    )
+
+    def test_cached_reads_issue_no_query(self):
+        self.client.get('/api/projects/')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/projects/')
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_indexed_filters_use_an_index(self):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.skipTest('EXPLAIN non pris en charge')
+        next_page = self.client.get('/api/messages/?read=false').json()['next']
+        checks = INDEXED_FILTERS + [(next_page, 'api_message')]
+        for url, table in checks:
+            with self.subTest(url=url):
+                response, queries = self.get(url)
+                self.assertEqual(response.status_code, 200)
+                for query in queries:
+                    if table not in query['sql'] or not query['sql'].lstrip().upper().startswith('SELECT'):
+                        continue
+                    plan = explain(query['sql'])
+                    self.assertEqual(full_scans(plan, table), [], f"{url}\n{query['sql']}\n{plan}")
+
+    def test_sparse_fieldset_does_not_read_heavy_columns(self):
+        response, queries = self.get('/api/projects/?fields=title,category,technologies')
+        self.assertEqual(response.status_code, 200)
+        select = [query['sql'] for query in queries if 'FROM "api_project"' in query['sql'] and 'LIMIT' in query['sql']]
+        self.assertTrue(select)
+        self.assertNotIn('"image"', select[-1])
+        self.assertNotIn('"description"', select[-1])
+
+    def test_project_category_filter_matches_rows(self):
+        response, queries = self.get('/api/projects/?category=web')
+        expected = Project.objects.filter(category='web').count()
+        self.assertEqual(response.json()['count'], expected)
@@ -0,0 +1,51 @@
+"""Recherche plein texte : index utilisé, extraits HTML sûrs."""
+
+from unittest import mock
+
+from django.db import connection
+
+from api import search
+from api.models import Project
+from api.tests.base import ApiTestCase, explain, full_scans
+
+
+class SearchTests(ApiTestCase):
+    def test_search_uses_the_full_text_index(self):
+        response, queries = self.get('/api/search/?q=react')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['results'])
+        self.assertLessEqual(len(queries), 2)
+        for query in queries:
+            # Ni les tables de contenu (et leurs images), ni un parcours des documents
+            self.assertNotIn('"api_project"', query['sql'])
+            self.assertNotIn('image', query['sql'])
+            if connection.vendor in ('sqlite', 'postgresql') and 'api_search_document' in query['sql']:
+                plan = explain(query['sql'])
+                self.assertEqual(full_scans(plan, 'api_search_document'), [], f"{query['sql']}\n{plan}")
+
+    def test_snippets_escape_content(self):
+        Project.objects.create(
+            title='Piège', description='Zyxwv <img src=x onerror=alert(1)> & <b>gras</b>',
+            image='', technologies=[], category='web',
+        )
+        response, queries = self.get('/api/search/?q=zyxwv')
+        snippet, = [result['snippet'] for result in response.json()['results']]
+        self.assertNotIn('<img', snippet)
+        self.assertNotIn('<b>', snippet)
+        self.assertIn('&lt;img src=x onerror=alert(1)&gt;', snippet)
+        self.assertIn('&amp;', snippet)
+        if search.engine():
+            self.assertIn('<mark>Zyxwv</mark>', snippet)
+
+    def test_short_or_unknown_queries_are_rejected(self):
+        self.assertEqual(self.get('/api/search/?q=r')[0].status_code, 400)
+        self.assertEqual(self.get('/api/search/?q=react&kind=blog')[0].status_code, 400)
+
+    def test_missing_fts_table_is_remembered(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('FTS5 propre à SQLite')
+        with mock.patch.dict(search._fts_tables, {connection.alias: False}), \
+                mock.patch.object(connection.introspection, 'table_names') as table_names:
+            self.assertIsNone(search.engine())
+            self.assertIsNone(search.engine())
+        table_names.assert_not_called()
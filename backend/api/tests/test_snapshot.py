@@ -0,0 +1,42 @@
+"""Instantané ``/api/portfolio/`` : toutes les collections publiques en un document."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Certification, Education, Project
+from api.tests.base import ApiTestCase
+
+
+class SnapshotTests(ApiTestCase):
+    def test_snapshot_matches_the_collection_endpoints(self):
+        snapshot = self.client.get('/api/portfolio/').json()
+        self.assertEqual(set(snapshot), {'profile', 'projects', 'education', 'certifications', 'stats'})
+        self.assertEqual(snapshot['profile'], self.client.get('/api/profile/').json())
+        self.assertEqual(snapshot['stats'], self.client.get('/api/stats/').json())
+        # Non paginé : toutes les lignes
+        self.assertEqual(len(snapshot['projects']), Project.objects.count())
+        self.assertEqual(len(snapshot['certifications']), Certification.objects.count())
+        self.assertEqual(
+            sorted(snapshot['education'], key=lambda item: item['id']),
+            sorted(self.client.get('/api/education/').json()['results'], key=lambda item: item['id']),
+        )
+
+    def test_snapshot_is_built_once_per_generation(self):
+        first = self.client.get('/api/portfolio/')
+        with CaptureQueriesContext(connection) as context:
+            second = self.client.get('/api/portfolio/')
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(second.content, first.content)
+
+        education = Education.objects.order_by('pk').first()
+        education.school = 'École renommée'
+        with self.captureOnCommitCallbacks(execute=True):
+            education.save()
+        response = self.client.get('/api/portfolio/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        self.assertIn('École renommée', [item['school'] for item in response.json()['education']])
+
+    def test_snapshot_is_read_only(self):
+        self.assertEqual(self.client.head('/api/portfolio/').status_code, 200)
+        self.assertEqual(self.client.post('/api/portfolio/').status_code, 405)
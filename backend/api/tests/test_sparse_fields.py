@@ -0,0 +1,27 @@
+"""Fieldsets partiels ``?fields=`` / ``?omit=`` sur les lectures."""
+
+from api.tests.base import ApiTestCase
+
+
+class SparseFieldsetTests(ApiTestCase):
+    def test_fields_and_omit_select_the_exposed_names(self):
+        project, = self.get('/api/projects/?fields=id,githubUrl')[0].json()['results'][:1]
+        self.assertEqual(set(project), {'id', 'githubUrl'})
+        project = self.get('/api/projects/?omit=image,imageSrcset,description')[0].json()['results'][0]
+        self.assertNotIn('image', project)
+        self.assertNotIn('description', project)
+        self.assertIn('liveUrl', project)
+        profile = self.get('/api/profile/?omit=avatar,avatarSrcset,cv')[0].json()
+        self.assertNotIn('avatar', profile)
+        self.assertEqual(profile['name'], 'Abdoul Salam Diallo')
+
+    def test_unknown_fields_are_rejected(self):
+        response, queries = self.get('/api/projects/?fields=title,github_url')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'fields': ['Unknown field: github_url']})
+
+    def test_writes_return_every_field(self):
+        project = {'title': 'Complet', 'description': 'Test', 'image': 'https://example.com/a.png', 'category': 'web'}
+        response = self.client.post('/api/projects/?fields=id', project, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['title'], 'Complet')
@@ -0,0 +1,44 @@
+"""Statistiques publiques maintenues par les signaux, sans parcours de table."""
+
+from api import stats
+from api.models import Education, Message, Project, Stats, StatsAggregate
+from api.tests.base import ApiTestCase
+
+
+class StatsTests(ApiTestCase):
+    def payload(self):
+        return self.get('/api/stats/')[0].json()
+
+    def test_payload_matches_the_tables(self):
+        payload = self.payload()
+        self.assertEqual(payload['totalProjects'], Project.objects.count())
+        self.assertEqual(payload['totalEducation'], Education.objects.count())
+        self.assertEqual(payload['totalMessages'], Message.objects.count())
+        self.assertEqual(payload['unreadMessages'], Message.objects.filter(read=False).count())
+        self.assertEqual((payload['clients'], payload['experience']), (12, 5))
+        counts = [technology['count'] for technology in payload['technologies']]
+        self.assertEqual(counts, sorted(counts, reverse=True))
+
+    def test_counters_follow_writes(self):
+        before = self.payload()
+        project = Project.objects.create(title='Nouveau', description='.', image='', technologies=['Elixir'], category='web')
+        message = Message.objects.create(name='A', email='a@example.com', subject='S', message='M')
+        Education.objects.order_by('pk').first().delete()
+        message.read = True
+        message.save()
+        Stats.objects.update(clients=20)
+        after = self.payload()
+        self.assertEqual(after['totalProjects'], before['totalProjects'] + 1)
+        self.assertEqual(after['totalMessages'], before['totalMessages'] + 1)
+        self.assertEqual(after['unreadMessages'], before['unreadMessages'])
+        self.assertEqual(after['totalEducation'], before['totalEducation'] - 1)
+        self.assertEqual(after['clients'], 20)
+        self.assertIn({'name': 'Elixir', 'count': 1}, after['technologies'])
+        project.delete()
+        self.assertNotIn('Elixir', [technology['name'] for technology in self.payload()['technologies']])
+
+    def test_rebuild_repairs_drift(self):
+        expected = self.payload()
+        StatsAggregate.objects.update(projects=0, messages=0)
+        stats.rebuild()
+        self.assertEqual(self.payload(), expected)
@@ -0,0 +1,22 @@
+"""Listes en flux (``?stream=true``) : même document que les listes rendues."""
+
+import json
+
+from api.tests.base import SEED, ApiTestCase
+
+
+class StreamingTests(ApiTestCase):
+    # Une page 2 suivie d'une page 3
+    SEED = dict(SEED, projects=250)
+
+    def test_streamed_lists_match_rendered_lists(self):
+        self.client.force_login(self.admin)
+        for url in ('/api/projects/?page=2', '/api/projects/?fields=id,title', '/api/messages/?read=false&page_size=20'):
+            with self.subTest(url=url):
+                expected = self.client.get(url).json()
+                response = self.client.get(url + '&stream=true')
+                self.assertTrue(response.streaming)
+                streamed = json.loads(b''.join(response.streaming_content))
+                self.assertEqual(list(streamed), list(expected))
+                self.assertEqual(streamed['results'], expected['results'])
+                self.assertIn('stream=true', streamed['next'])
@@ -0,0 +1,25 @@
+"""Filtres par technologie et compétence, facettes ``/api/tags/``."""
+
+from api.models import Certification, Project
+from api.tests.base import ApiTestCase
+
+
+class TagTests(ApiTestCase):
+    def test_technology_filter_and_facets_match_json_lists(self):
+        expected = sum('React' in technologies for technologies in Project.objects.values_list('technologies', flat=True))
+        response, queries = self.get('/api/projects/?technology=REACT')
+        self.assertEqual(response.json()['count'], expected)
+        facets = {tag['key']: tag['projects'] for tag in self.get('/api/tags/?kind=technology')[0].json()}
+        self.assertEqual(facets['react'], expected)
+
+    def test_facets_follow_saves_and_deletes(self):
+        before = {tag['key']: tag['certifications'] for tag in self.get('/api/tags/?kind=skill')[0].json()}
+        certification = Certification.objects.create(title='Nouvelle', issuer='AWS', skills=['SQL', 'Rust'])
+        after = {tag['key']: tag['certifications'] for tag in self.get('/api/tags/?kind=skill')[0].json()}
+        self.assertEqual(after['sql'], before.get('sql', 0) + 1)
+        self.assertEqual(after['rust'], 1)
+        self.assertEqual(self.get('/api/certifications/?skill=rust')[0].json()['count'], 1)
+        certification.delete()
+        after = {tag['key']: tag['certifications'] for tag in self.get('/api/tags/?kind=skill')[0].json()}
+        self.assertNotIn('rust', after)
+        self.assertEqual(self.get('/api/tags/?kind=other')[0].status_code, 400)
@@ -0,0 +1,81 @@
+"""Limitation des écritures : seaux par route et par action, IP cliente derrière un proxy."""
+
+from django.conf import settings
+from django.test import override_settings
+
+from api import throttling
+from api.models import Message
+from api.tests.base import ApiTestCase
+
+
+CONTACT = {'name': 'Visiteur', 'email': 'contact@example.org', 'subject': 'Projet', 'message': 'Bonjour'}
+
+
+@override_settings(
+    MESSAGES_WRITE_BEHIND=False,
+    THROTTLE_BUCKETS={'default': '3,3/m', 'messages': '2,1/h'},
+)
+class ThrottlingTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        connection = throttling.get_connection()
+        connection.execute('DELETE FROM buckets')
+        connection.execute('DELETE FROM rejections')
+
+    def contact(self, **extra):
+        return self.client.post('/api/messages/', CONTACT, content_type='application/json', **extra)
+
+    def test_contact_form_has_its_own_bucket(self):
+        self.assertEqual(self.contact().status_code, 201)
+        self.assertEqual(self.contact().status_code, 201)
+        response = self.contact()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '3600')
+        # Les lectures ne sont jamais limitées
+        self.assertEqual(self.client.get('/api/projects/').status_code, 200)
+        self.assertEqual(self.client.get('/api/throttle/stats/').json(), {'rejected': {'POST /api/messages/': 1}, 'total': 1})
+
+    def test_admin_actions_use_the_default_bucket(self):
+        self.client.force_login(self.admin)
+        self.contact()
+        self.contact()
+        self.assertEqual(self.contact().status_code, 429)
+        pk = Message.objects.values_list('pk', flat=True).first()
+        statuses = [
+            self.client.patch(f'/api/messages/{pk}/', {'read': True}, content_type='application/json').status_code
+            for _ in range(4)
+        ]
+        self.assertEqual(statuses, [200, 200, 200, 429])
+        # Autre route, autre seau
+        self.assertEqual(self.client.delete(f'/api/messages/{pk}/').status_code, 204)
+
+    def test_batched_writes_share_the_route_bucket(self):
+        self.client.force_login(self.admin)
+        pks = list(Message.objects.values_list('pk', flat=True)[:4])
+        operations = [{'method': 'PATCH', 'resource': 'messages', 'id': pk, 'data': {'read': True}} for pk in pks]
+        response = self.client.post(
+            '/api/batch/', {'atomic': False, 'operations': operations}, content_type='application/json',
+        )
+        self.assertEqual([result['status'] for result in response.json()['results']], [200, 200, 200, 429])
+        self.assertEqual(throttling.get_stats()['rejected'], {'PATCH /api/messages/(?P<pk>[^/.]+)/': 1})
+
+    def test_forwarded_for_is_ignored_without_a_trusted_proxy(self):
+        for address in ('203.0.113.1', '203.0.113.2', '203.0.113.3'):
+            self.contact(HTTP_X_FORWARDED_FOR=address)
+        self.assertEqual(self.contact(HTTP_X_FORWARDED_FOR='203.0.113.4').status_code, 429)
+
+    def test_client_address_is_the_one_seen_by_the_proxy(self):
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'NUM_PROXIES': 1}):
+            # Entrées ajoutées par le client avant celle du proxy : sans effet
+            self.assertEqual(self.contact(HTTP_X_FORWARDED_FOR='198.51.100.1, 203.0.113.7').status_code, 201)
+            self.assertEqual(self.contact(HTTP_X_FORWARDED_FOR='198.51.100.2, 203.0.113.7').status_code, 201)
+            self.assertEqual(self.contact(HTTP_X_FORWARDED_FOR='198.51.100.3, 203.0.113.7').status_code, 429)
+            self.assertEqual(self.contact(HTTP_X_FORWARDED_FOR='203.0.113.8').status_code, 201)
+
+    def test_bucket_refills_over_time(self):
+        burst, rate = throttling.parse_bucket('2,1/h')
+        self.assertEqual((burst, rate), (2, 1 / 3600))
+        self.assertTrue(throttling.take('client', burst, rate, now=0))
+        self.assertTrue(throttling.take('client', burst, rate, now=0))
+        self.assertFalse(throttling.take('client', burst, rate, now=1800))
+        self.assertTrue(throttling.take('client', burst, rate, now=3600))
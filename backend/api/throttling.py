@@ -0,0 +1,117 @@
+"""
+Limitation des écritures par seau à jetons (token bucket), par IP et par route.
+
+Chaque couple (IP cliente, route) dispose d'un seau de ``burst`` jetons qui se
+remplit au débit configuré ; une requête non sûre (POST, PUT, PATCH, DELETE)
+consomme un jeton ou est rejetée (429). Les seaux vivent dans un petit fichier
+SQLite (``THROTTLE_DB``) partagé par tous les workers gunicorn : la prise
+d'un jeton est une seule instruction ``INSERT ... ON CONFLICT ... RETURNING``,
+atomique, sans passer par l'ORM ni la base principale. Les rejets sont
+comptés par route (``/api/throttle/stats/``).
+
+Débits dans ``THROTTLE_BUCKETS`` (``'<burst>,<jetons>/<s|m|h|d>'``), par
+``throttle_scope`` de la vue, ``default`` sinon. En cas d'erreur du fichier de
+seaux, la requête est acceptée (fail open).
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL) WITHOUT ROWID',
+    'CREATE TABLE IF NOT EXISTS rejections (route TEXT PRIMARY KEY, count INTEGER NOT NULL) WITHOUT ROWID',
+)
+
+# Prend un jeton si le seau (rempli depuis ``updated``) en contient au moins un
+TAKE_SQL = '''
+INSERT INTO buckets (key, tokens, updated) VALUES (:key, :burst - 1, :now)
+ON CONFLICT (key) DO UPDATE SET
+    tokens = min(:burst, tokens + (:now - updated) * :rate) - 1,
+    updated = :now
+WHERE min(:burst, tokens + (:now - updated) * :rate) >= 1
+RETURNING tokens
+'''
+
+# Un seau inutilisé depuis ce délai est plein : inutile de le garder
+PRUNE_AFTER = 86400
+PRUNE_EVERY = 1000
+
+REJECT_SQL = 'INSERT INTO rejections (route, count) VALUES (?, 1) ON CONFLICT (route) DO UPDATE SET count = count + 1'
+
+_local = threading.local()
+
+
+def parse_bucket(spec):
+    """``'5,20/h'`` -> ``(5, 20 / 3600)`` : capacité et jetons par seconde."""
+    burst, rate = spec.split(',')
+    tokens, period = rate.split('/')
+    return int(burst), int(tokens) / PERIODS[period.strip()[0]]
+
+
+def get_connection():
+    path = str(settings.THROTTLE_DB)
+    connection = getattr(_local, 'connection', None)
+    if connection is None or _local.path != path:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, timeout=0.5, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=OFF')
+        for statement in SCHEMA:
+            connection.execute(statement)
+        _local.connection, _local.path = connection, path
+    return connection
+
+
+def take(key, burst, rate, now=None):
+    """Consomme un jeton du seau ``key`` ; ``False`` si le seau est vide."""
+    now = time.time() if now is None else now
+    connection = get_connection()
+    _local.calls = getattr(_local, 'calls', 0) + 1
+    if _local.calls % PRUNE_EVERY == 0:
+        connection.execute('DELETE FROM buckets WHERE updated < ?', (now - PRUNE_AFTER,))
+    row = connection.execute(TAKE_SQL, {'key': key, 'burst': burst, 'rate': rate, 'now': now}).fetchone()
+    return row is not None
+
+
+def record_rejection(route):
+    get_connection().execute(REJECT_SQL, (route,))
+
+
+def get_stats():
+    rows = get_connection().execute('SELECT route, count FROM rejections ORDER BY count DESC').fetchall()
+    return {'rejected': dict(rows), 'total': sum(count for route, count in rows)}
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Throttle DRF des méthodes non sûres ; les lectures ne sont jamais limitées."""
+
+    def allow_request(self, request, view):
+        if request.method in SAFE_METHODS or not settings.THROTTLE_ENABLED:
+            return True
+        scope = getattr(view, 'throttle_scope', None) or 'default'
+        buckets = settings.THROTTLE_BUCKETS
+        self.burst, self.rate = parse_bucket(buckets.get(scope, buckets['default']))
+        match = request.resolver_match
+        route = f'{request.method} /' + re.sub(r'(^|/)\^|\$$', r'\1', match.route if match else request.path.lstrip('/'))
+        try:
+            if take(f'{self.get_ident(request)}|{route}', self.burst, self.rate):
+                return True
+            record_rejection(route)
+        except sqlite3.Error:
+            return True
+        return False
+
+    def wait(self):
+        # Au plus le temps de regagner un jeton
+        return 1 / self.rate if self.rate else None
@@ -1,43 +1,113 @@
+import hmac
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.views.decorators.http import require_safe
 from rest_framework import viewsets, status
-from rest_framework.decorators import action
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
-from .models import Profile, Project, Education, Certification, Message, Stats
-from .serializers import ProfileSerializer, ProjectSerializer, EducationSerializer, CertificationSerializer, MessageSerializer, StatsSerializer
+from . import archive, assets, batch as batch_operations, ingest, metrics as request_metrics, stats, throttling
+from .async_views import AsyncReadMixin
+from .cache import CachedResponseMixin, cache_response, cache_view, get_stats as get_cache_stats
+from .conditional import ConditionalGetMixin, conditional_response
+from .exporter import iter_export
+from .mixins import SparseFieldsetMixin
+from .pagination import MessageCursorPagination
+from .projection import ProjectionReadMixin, get_projection
+from .search import SEARCH_MODELS, SOURCES, search as search_documents
+from .snapshot import get_snapshot
+from .streaming import StreamingListMixin
+from .tags import TAG_MODELS, facets, split_keys
+from .models import ArchivedMessage, Profile, Project, Education, Certification, Message, Stats
+from .serializers import ArchivedMessageSerializer, ProfileSerializer, ProjectSerializer, EducationSerializer, CertificationSerializer, MessageSerializer, StatsSerializer
 
 
-class ProfileViewSet(viewsets.ViewSet):
+class ProfileViewSet(ConditionalGetMixin, SparseFieldsetMixin, AsyncReadMixin, viewsets.ViewSet):
     """ViewSet pour gérer le profil unique"""
+    cache_models = (Profile,)
+    
+    def get_validator_queryset(self):
+        return Profile.objects.all()
+    
+    def get_profile_data(self, request, queryset):
+        """Premier profil de ``queryset`` sérialisé (projection si possible), ou ``None``."""
+        queryset = self.sparse_queryset(queryset, ProfileSerializer)
+        serializer = self.trim_serializer(ProfileSerializer(context={'request': request}))
+        projection = get_projection(serializer)
+        if projection is not None:
+            row = projection.project(queryset).first()
+            with request_metrics.timer('serialize'):
+                return projection.represent(row) if row else None
+        serializer.instance = queryset.first()
+        return serializer.data if serializer.instance else None
+    
+    async def aget_profile_data(self, request, queryset):
+        queryset = self.sparse_queryset(queryset, ProfileSerializer)
+        serializer = self.trim_serializer(ProfileSerializer(context={'request': request}))
+        projection = get_projection(serializer)
+        if projection is not None:
+            row = await projection.project(queryset).afirst()
+            with request_metrics.timer('serialize'):
+                return projection.represent(row) if row else None
+        serializer.instance = await queryset.afirst()
+        return serializer.data if serializer.instance else None
     
+    @conditional_response
+    @cache_response
     def list(self, request):
         """GET /api/profile/ - Retourner le profil courant"""
-        profile = Profile.objects.first()
-        if not profile:
+        data = self.get_profile_data(request, Profile.objects.all())
+        if data is None:
             return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
-        serializer = ProfileSerializer(profile)
-        return Response(serializer.data)
+        return Response(data)
+    
+    @conditional_response
+    @cache_response
+    async def alist(self, request):
+        """GET /api/profile/ (ASGI)"""
+        data = await self.aget_profile_data(request, Profile.objects.all())
+        if data is None:
+            return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(data)
     
     def create(self, request):
         """POST /api/profile/ - Créer un profil"""
-        serializer = ProfileSerializer(data=request.data)
+        serializer = ProfileSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    @conditional_response
+    @cache_response
     def retrieve(self, request, pk=None):
         """GET /api/profile/{id}/ - Récupérer un profil spécifique"""
+        data = self.get_profile_data(request, Profile.objects.filter(pk=pk))
+        if data is None:
+            return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(data)
+    
+    @conditional_response
+    @cache_response
+    async def aretrieve(self, request, pk=None):
+        """GET /api/profile/{id}/ (ASGI)"""
         try:
-            profile = Profile.objects.get(pk=pk)
-            serializer = ProfileSerializer(profile)
-            return Response(serializer.data)
-        except Profile.DoesNotExist:
+            data = await self.aget_profile_data(request, Profile.objects.filter(pk=pk))
+        except ValueError:
+            data = None
+        if data is None:
             return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(data)
     
     def update(self, request, pk=None):
         """PUT /api/profile/{id}/ - Mettre à jour un profil"""
         try:
             profile = Profile.objects.get(pk=pk)
-            serializer = ProfileSerializer(profile, data=request.data, partial=True)
+            serializer = ProfileSerializer(profile, data=request.data, partial=True, context={'request': request})
             if serializer.is_valid():
                 serializer.save()
                 return Response(serializer.data)
@@ -50,34 +120,253 @@ class ProfileViewSet(viewsets.ViewSet):
         return self.update(request, pk)
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(ConditionalGetMixin, StreamingListMixin, CachedResponseMixin, SparseFieldsetMixin, ProjectionReadMixin, AsyncReadMixin, viewsets.ModelViewSet):
+    cache_models = (Project,)
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
     
     def get_queryset(self):
-        """Filter projects by category if provided"""
+        """Filter projects by category and technologies if provided (?technology=react,django)"""
         queryset = Project.objects.all()
         category = self.request.query_params.get('category', None)
         if category:
             queryset = queryset.filter(category=category)
+        for key in split_keys(self.request.query_params.get('technology', '')):
+            queryset = queryset.filter(technology_tags__tag__key=key)
         return queryset
 
 
-class EducationViewSet(viewsets.ModelViewSet):
+class EducationViewSet(ConditionalGetMixin, StreamingListMixin, CachedResponseMixin, SparseFieldsetMixin, ProjectionReadMixin, AsyncReadMixin, viewsets.ModelViewSet):
+    cache_models = (Education,)
     queryset = Education.objects.all()
     serializer_class = EducationSerializer
 
 
-class CertificationViewSet(viewsets.ModelViewSet):
+class CertificationViewSet(ConditionalGetMixin, StreamingListMixin, CachedResponseMixin, SparseFieldsetMixin, ProjectionReadMixin, AsyncReadMixin, viewsets.ModelViewSet):
+    cache_models = (Certification,)
     queryset = Certification.objects.all()
     serializer_class = CertificationSerializer
+    
+    def get_queryset(self):
+        """Filter certifications by skills if provided (?skill=react,sql)"""
+        queryset = Certification.objects.all()
+        for key in split_keys(self.request.query_params.get('skill', '')):
+            queryset = queryset.filter(skill_tags__tag__key=key)
+        return queryset
 
 
-class MessageViewSet(viewsets.ModelViewSet):
+class MessageViewSet(SparseFieldsetMixin, StreamingListMixin, AsyncReadMixin, viewsets.ModelViewSet):
     queryset = Message.objects.all()
     serializer_class = MessageSerializer
+    pagination_class = MessageCursorPagination
+    # La pagination par curseur n'a pas de variante asynchrone
+    async_actions = ('retrieve',)
 
+    @property
+    def throttle_scope(self):
+        # Seau du formulaire de contact pour create seulement : les PATCH/DELETE admin gardent ``default``
+        return 'messages' if self.action == 'create' else None
+    
+    def get_queryset(self):
+        """Filter messages by read status if provided (?read=false)"""
+        queryset = Message.objects.all()
+        read = self.request.query_params.get('read', None)
+        if read is not None:
+            if read.lower() not in ('true', 'false', '1', '0'):
+                raise ValidationError({'read': ['Expected true or false.']})
+            queryset = queryset.filter(read=read.lower() in ('true', '1'))
+        return queryset
+    
+    def perform_create(self, serializer):
+        # Comme la file : un nouveau message est toujours non lu
+        serializer.save(read=False)
+    
+    def create(self, request, *args, **kwargs):
+        """POST /api/messages/ - Valider, mettre en file et répondre 202 (insertion par lots en arrière-plan)"""
+        # Dans un lot, la file ne serait pas annulée avec la transaction
+        if not settings.MESSAGES_WRITE_BEHIND or getattr(request, 'batched', False):
+            return super().create(request, *args, **kwargs)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            values = ingest.enqueue(serializer.validated_data)
+        except ingest.QueueFull:
+            return Response(
+                {'error': 'Too many pending messages, retry later'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '30'},
+            )
+        return Response(self.get_serializer(Message(**values)).data, status=status.HTTP_202_ACCEPTED)
+
+
+class ArchivedMessageViewSet(SparseFieldsetMixin, StreamingListMixin, viewsets.ReadOnlyModelViewSet):
+    """Messages archivés (admin) : recherche et restauration"""
+    queryset = ArchivedMessage.objects.all()
+    serializer_class = ArchivedMessageSerializer
+    pagination_class = MessageCursorPagination
+    permission_classes = [IsAdminUser]
+    
+    def get_queryset(self):
+        """Filter archives by exact email (?email=) or text (?q=)"""
+        queryset = ArchivedMessage.objects.all()
+        email = self.request.query_params.get('email')
+        if email:
+            queryset = queryset.filter(email=email)
+        query = self.request.query_params.get('q', '').strip()
+        if query:
+            queryset = queryset.filter(
+                Q(subject__icontains=query) | Q(name__icontains=query)
+                | Q(email__icontains=query) | Q(message__icontains=query)
+            )
+        return queryset
+    
+    @action(detail=True, methods=['post'])
+    def restore(self, request, pk=None):
+        """POST /api/archived-messages/{id}/restore/ - Remettre le message dans la boîte de réception"""
+        message, = archive.restore([self.get_object()])
+        return Response(MessageSerializer(message).data, status=status.HTTP_201_CREATED)
 
-class StatsViewSet(viewsets.ModelViewSet):
+
+class StatsViewSet(ConditionalGetMixin, CachedResponseMixin, SparseFieldsetMixin, AsyncReadMixin, viewsets.ModelViewSet):
+    """Statistiques publiques ; la ligne ``Stats`` ne garde que les chiffres saisis à la main"""
+    cache_models = stats.STATS_MODELS
     queryset = Stats.objects.all()
     serializer_class = StatsSerializer
+    
+    def get_validator(self, request, pk=None):
+        if pk is None:
+            return stats.get_validator()
+        return super().get_validator(request, pk)
+    
+    async def aget_validator(self, request, pk=None):
+        if pk is None:
+            return await stats.aget_validator()
+        return await super().aget_validator(request, pk)
+    
+    @conditional_response
+    @cache_response
+    def list(self, request):
+        """GET /api/stats/ - Compteurs maintenus en continu (aucun parcours de table)"""
+        return Response(stats.get_payload({'request': request}))
+    
+    @conditional_response
+    @cache_response
+    async def alist(self, request):
+        """GET /api/stats/ (ASGI)"""
+        return Response(await stats.aget_payload({'request': request}))
+
+
+@api_view(['GET'])
+def cache_stats(request):
+    """GET /api/cache/stats/ - Compteurs hit/miss du cache de réponses"""
+    return Response(get_cache_stats())
+
+
+@api_view(['GET'])
+def throttle_stats(request):
+    """GET /api/throttle/stats/ - Requêtes d'écriture rejetées par route"""
+    return Response(throttling.get_stats())
+
+
+@api_view(['POST'])
+def batch(request):
+    """POST /api/batch/ - Plusieurs opérations sur les ressources en une requête et une transaction"""
+    if not isinstance(request.data, dict):
+        raise ValidationError({'operations': ['Expected an object with an operations list.']})
+    atomic = request.data.get('atomic', True)
+    if not isinstance(atomic, bool):
+        raise ValidationError({'atomic': ['Expected true or false.']})
+    try:
+        committed, results = batch_operations.run(request, request.data.get('operations'), atomic)
+    except batch_operations.BatchError as e:
+        field, _, message = str(e).partition(': ')
+        raise ValidationError({field: [message[:1].upper() + message[1:] + '.']})
+    return Response(
+        {'committed': committed, 'results': results},
+        status=status.HTTP_200_OK if committed else status.HTTP_400_BAD_REQUEST,
+    )
+
+
+@api_view(['GET'])
+@cache_view(*SEARCH_MODELS)
+def search(request):
+    """GET /api/search/?q=react&kind=project,certification&limit=20 - Recherche plein texte classée"""
+    query = request.query_params.get('q', '').strip()
+    if len(query) < 2:
+        raise ValidationError({'q': ['At least 2 characters.']})
+    kinds = [kind for kind in request.query_params.get('kind', '').split(',') if kind]
+    unknown = sorted(set(kinds) - set(SOURCES))
+    if unknown:
+        raise ValidationError({'kind': [f"Unknown kinds: {', '.join(unknown)}."]})
+    try:
+        limit = min(max(int(request.query_params.get('limit', 20)), 1), 50)
+    except ValueError:
+        raise ValidationError({'limit': ['Expected an integer.']})
+    return Response({'query': query, 'results': search_documents(query, kinds, limit)})
+
+
+@api_view(['GET'])
+@cache_view(*TAG_MODELS)
+def tags(request):
+    """GET /api/tags/?kind=technology|skill - Facettes : nombre de projets et de certifications par tag"""
+    kind = request.query_params.get('kind') or None
+    if kind not in (None, 'technology', 'skill'):
+        raise ValidationError({'kind': ['Expected technology or skill.']})
+    return Response(facets(kind))
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def export(request):
+    """GET /api/export/ - Export db.json en flux (admin) ; ?collections=projects,education&assets=true"""
+    collections = [name for name in request.query_params.get('collections', '').split(',') if name]
+    include_assets = request.query_params.get('assets') in ('1', 'true')
+    chunks = (chunk.encode('utf-8') for chunk in iter_export(collections, include_assets))
+    response = StreamingHttpResponse(chunks, content_type='application/json')
+    response['Content-Disposition'] = 'attachment; filename="db.json"'
+    return response
+
+
+@require_safe
+def portfolio(request):
+    """GET /api/portfolio/ - Toutes les collections publiques en une requête"""
+    key, content = get_snapshot(request)
+    etag = '"%s"' % key.split(':')[2]
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+    response = HttpResponse(content, content_type='application/json')
+    response['ETag'] = etag
+    return response
+
+
+@require_safe
+def asset(request, name, variant=None):
+    """GET /api/assets/{sha256}.{ext} ou /api/assets/{sha256}/{largeur}.{ext} - Servir un asset immuable"""
+    try:
+        path = assets.variant_path(name, variant) if variant else assets.asset_path(name)
+        content_type = assets.content_type(path.name)
+        if content_type is None:
+            raise ValueError(path.name)
+        f = open(path, 'rb')
+    except (ValueError, FileNotFoundError):
+        raise Http404('Asset not found')
+    response = FileResponse(f, content_type=content_type)
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    # Le navigateur s'en tient au type déclaré : pas de reniflage en HTML ou en script
+    response['X-Content-Type-Options'] = 'nosniff'
+    response['ETag'] = '"%s"' % (f'{name}/{variant}' if variant else name.split('.', 1)[0])
+    return response
+
+
+@require_safe
+def metrics(request):
+    """GET /metrics - Métriques Prometheus de tous les workers (jeton Bearer METRICS_TOKEN obligatoire)"""
+    token = settings.METRICS_TOKEN
+    # Sans jeton configuré, jamais servi : trafic et statuts par route ne sont pas publics
+    if not settings.METRICS_ENABLED or not token:
+        raise Http404('Metrics disabled')
+    if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponse(status=401, headers={'WWW-Authenticate': 'Bearer'})
+    content, content_type = request_metrics.export()
+    return HttpResponse(content, content_type=content_type)
@@ -0,0 +1,31 @@
+"""
+Préchauffage au chargement de l'application (``WARMUP_ON_START``).
+
+Rend une fois chaque endpoint public par sa vue : le résolveur d'URL, les
+serializers, les connexions et surtout le cache de réponses et de validateurs
+sont prêts avant la première vraie requête. Sous gunicorn avec
+``preload_app`` (``gunicorn.conf.py``), cela se fait une seule fois dans le
+maître et les workers forkés héritent des caches en mémoire.
+"""
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+
+def run():
+    """Rend les endpoints publics ; retourne les noms servis en 200."""
+    if not settings.WARMUP_ON_START:
+        return []
+    from .materialize import ENDPOINTS, render_endpoint
+
+    warmed = []
+    try:
+        for name in ENDPOINTS:
+            if render_endpoint(name) is not None:
+                warmed.append(name)
+    except DatabaseError:
+        pass  # Base indisponible : démarrer quand même, à froid
+    finally:
+        # Aucune connexion ne doit être partagée avec des workers forkés
+        connections.close_all()
+    return warmed
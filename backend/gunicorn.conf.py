@@ -0,0 +1,66 @@
+"""
+Configuration gunicorn (``gunicorn -c gunicorn.conf.py portfolio.wsgi:application``).
+
+Settings complets par défaut (admin, export et restauration des archives
+restent disponibles) ; ``DJANGO_SETTINGS_MODULE=portfolio.settings_api`` active
+le profil allégé « api », sans authentification. Avec ``preload_app``,
+Django, les URL, les serializers et les caches préchauffés (``api/warmup.py``)
+sont chargés une seule fois dans le maître : les workers forkés démarrent
+chauds et partagent ces pages mémoire.
+
+Avec plusieurs workers, le cache de réponses ``api`` est un cache fichier
+(``API_CACHE_BACKEND=file``) sauf choix explicite : un worker qui invalide une
+génération est vu par tous les autres.
+
+Les métriques Prometheus (``api/metrics.py``) de chaque worker sont écrites
+dans ``PROMETHEUS_MULTIPROC_DIR``, vidé au démarrage du maître : ``/metrics``
+les agrège quel que soit le worker qui répond.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+from decouple import config
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio.settings')
+
+# Avant tout import de prometheus_client (preload_app) : le mode multiprocessus est choisi à l'import
+metrics_dir = Path(os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR',
+    str(Path(config('VAR_DIR', default=str(Path(__file__).resolve().parent / 'var'))) / 'prometheus'),
+))
+shutil.rmtree(metrics_dir, ignore_errors=True)
+metrics_dir.mkdir(parents=True)
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+# Lu par les settings au préchargement : générations, validateurs et instantané
+# du cache « api » doivent être communs à tous les workers
+if workers > 1:
+    os.environ.setdefault('API_CACHE_BACKEND', 'file')
+preload_app = True
+timeout = 60
+
+
+def when_ready(server):
+    # Avant le premier fork : ni thread ni connexion à partager avec les workers
+    from django.db import connections
+
+    from api import ingest
+
+    ingest.stop()
+    connections.close_all()
+
+
+def post_fork(server, worker):
+    # Flusher du spool des messages dans chaque worker
+    from api import ingest
+
+    ingest.start()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
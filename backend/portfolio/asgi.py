@@ -0,0 +1,13 @@
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio.settings')
+# Lectures publiques servies par les vues asynchrones (api/async_views.py)
+os.environ.setdefault('ASYNC_READS', 'True')
+application = get_asgi_application()
+
+# Préchauffe les caches, rejoue les messages restés dans le spool et démarre
+# leur flusher
+from api import ingest, warmup  # noqa: E402
+warmup.run()
+ingest.start()
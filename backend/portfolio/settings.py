@@ -22,8 +22,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'api.compression.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'api.materialize.MaterializedResponseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -51,6 +54,18 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'portfolio.wsgi.application'
+ASGI_APPLICATION = 'portfolio.asgi.application'
+
+# Render the public endpoints once when the app loads (api/warmup.py); on by
+# default in the lean "api" profile (portfolio/settings_api.py)
+WARMUP_ON_START = config('WARMUP_ON_START', default='False') == 'True'
+
+# Read list/retrieve through a .values() projection compiled from the
+# serializers instead of model instances (api/projection.py)
+FAST_READS = config('FAST_READS', default='True') == 'True'
+
+# Async read views (api/async_views.py), enabled by portfolio/asgi.py
+ASYNC_READS = config('ASYNC_READS', default='False') == 'True'
 
 # Database Configuration
 # Use SQLite for development, PostgreSQL for production
@@ -65,7 +80,8 @@ if USE_POSTGRESQL:
             'PASSWORD': config('DB_PASSWORD', default=''),
             'HOST': config('DB_HOST', default='postgresql-abdoul-salam-diallo.alwaysdata.net'),
             'PORT': config('DB_PORT', default='5432'),
-            'CONN_MAX_AGE': 600,
+            # Persistent connections are per thread: not reusable under ASGI
+            'CONN_MAX_AGE': 0 if ASYNC_READS else 600,
         }
     }
 else:
@@ -89,6 +105,93 @@ USE_I18N = True
 USE_TZ = True
 
 STATIC_URL = '/static/'
+
+# Runtime data (assets, caches, files générés)
+VAR_DIR = Path(config('VAR_DIR', default=str(BASE_DIR / 'var')))
+
+# Asset storage: images and CV decoded from data URIs, stored by content hash
+ASSETS_ROOT = VAR_DIR / 'assets'
+# Public base URL of the API, used to build absolute asset URLs (e.g. https://api.example.com)
+API_PUBLIC_URL = config('API_PUBLIC_URL', default='')
+# Compatibility: keep returning inline data URIs to old clients
+ASSETS_INLINE_DATA_URIS = config('ASSETS_INLINE_DATA_URIS', default='False') == 'True'
+# Responsive image derivatives (WebP + JPEG) generated off the request thread
+IMAGE_DERIVATIVE_WIDTHS = config(
+    'IMAGE_DERIVATIVE_WIDTHS', default='320,640,960,1280',
+    cast=lambda value: tuple(int(width) for width in value.split(',')),
+)
+IMAGE_WORKERS = config('IMAGE_WORKERS', default=2, cast=int)
+
+# Materialized responses: public endpoints pre-rendered to JSON (+ gzip/brotli)
+# files and served without Django/DRF. Set API_PUBLIC_URL so asset URLs are right.
+MATERIALIZE_RESPONSES = config('MATERIALIZE_RESPONSES', default='False') == 'True'
+MATERIALIZED_ROOT = VAR_DIR / 'materialized'
+
+# Negotiated brotli/gzip compression of JSON responses (api/compression.py).
+# Brotli is used when the optional 'brotli' package is installed.
+COMPRESS_RESPONSES = config('COMPRESS_RESPONSES', default='True') == 'True'
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)  # bytes
+COMPRESSION_GZIP_LEVEL = config('COMPRESSION_GZIP_LEVEL', default=6, cast=int)
+COMPRESSION_BROTLI_QUALITY = config('COMPRESSION_BROTLI_QUALITY', default=5, cast=int)
+
+# Per-request instrumentation (api/metrics.py): Server-Timing header and
+# Prometheus histograms on /metrics, shared by gunicorn workers through
+# PROMETHEUS_MULTIPROC_DIR. /metrics is only served with METRICS_TOKEN set, and
+# then requires "Authorization: Bearer <token>".
+METRICS_ENABLED = config('METRICS_ENABLED', default='True') == 'True'
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+# Contact messages: validated, spooled to disk and acknowledged (202), then
+# inserted in batches by a background flusher (see api/ingest.py)
+MESSAGES_WRITE_BEHIND = config('MESSAGES_WRITE_BEHIND', default='True') == 'True'
+MESSAGE_SPOOL_DIR = VAR_DIR / 'spool' / 'messages'
+MESSAGE_QUEUE_MAX = config('MESSAGE_QUEUE_MAX', default=10000, cast=int)  # 503 beyond this
+MESSAGE_FLUSH_BATCH = config('MESSAGE_FLUSH_BATCH', default=500, cast=int)
+MESSAGE_FLUSH_INTERVAL = config('MESSAGE_FLUSH_INTERVAL', default=1.0, cast=float)  # seconds
+# Read messages older than this move to the archive table (archivemessages command)
+MESSAGE_RETENTION_DAYS = config('MESSAGE_RETENTION_DAYS', default=365, cast=int)
+
+# Cache Configuration
+# The 'api' alias holds the public read responses and the generation counters
+# that invalidate them. It must be shared by every worker: locmem is only right
+# for a single process (runserver, tests). gunicorn.conf.py defaults to 'file'
+# when it starts more than one worker.
+API_CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+}
+API_CACHE_BACKEND = config('API_CACHE_BACKEND', default='locmem')
+
+API_CACHE = {
+    'BACKEND': API_CACHE_BACKENDS[API_CACHE_BACKEND],
+    'TIMEOUT': config('API_CACHE_TIMEOUT', default=86400, cast=int),
+}
+if API_CACHE_BACKEND in ('locmem', 'file'):
+    API_CACHE['LOCATION'] = config(
+        'API_CACHE_LOCATION',
+        default=str(VAR_DIR / 'cache') if API_CACHE_BACKEND == 'file' else 'api',
+    )
+    # MAX_ENTRIES only exists for locmem/file; redis and memcached clients reject it
+    API_CACHE['OPTIONS'] = {'MAX_ENTRIES': 1000}
+else:
+    # Server address(es), e.g. redis://localhost:6379/1 or 127.0.0.1:11211: no usable default
+    API_CACHE['LOCATION'] = config('API_CACHE_LOCATION')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'api': API_CACHE,
+    # Compressed response bodies, keyed by encoding and body digest (per process)
+    'compressed': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'compressed',
+        'TIMEOUT': None,
+        'OPTIONS': {'MAX_ENTRIES': config('COMPRESSION_CACHE_ENTRIES', default=256, cast=int)},
+    },
+}
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Keep APPEND_SLASH enabled for proper routing
@@ -109,6 +212,23 @@ CORS_ALLOW_CREDENTIALS = True
 
 # REST Framework Configuration
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.PageNumberPagination',
     'PAGE_SIZE': 100,
+    'DEFAULT_THROTTLE_CLASSES': ['api.throttling.TokenBucketThrottle'],
+    # Trusted reverse proxies in front of the app (1 on Render). Client IP for
+    # throttling = the X-Forwarded-For entry added by the nearest trusted proxy;
+    # 0 uses REMOTE_ADDR and ignores the header, which clients can forge.
+    'NUM_PROXIES': config('NUM_PROXIES', default=0, cast=int),
 }
+
+# Write throttling (api/throttling.py): token buckets per client IP and route,
+# shared by all workers through a SQLite file. Format: '<burst>,<tokens>/<s|m|h|d>'
+THROTTLE_ENABLED = config('THROTTLE_ENABLED', default='True') == 'True'
+THROTTLE_DB = VAR_DIR / 'throttle.sqlite3'
+THROTTLE_BUCKETS = {
+    'default': config('THROTTLE_WRITES', default='30,30/m'),
+    'messages': config('THROTTLE_MESSAGES', default='5,20/h'),  # Contact form
+}
+
+# Batch endpoint (api/batch.py): operations per POST /api/batch/ request
+BATCH_MAX_OPERATIONS = config('BATCH_MAX_OPERATIONS', default=100, cast=int)
@@ -0,0 +1,42 @@
+"""
+Lean "api" settings profile for the public JSON server (see gunicorn.conf.py).
+
+No admin, sessions, messages, CSRF or templates: the public routes are anonymous
+JSON reads and AllowAny writes, so none of them is needed. Admin-only routes
+(/admin/, /api/archived-messages/, /api/export/) are unavailable in this
+profile; use portfolio.settings for them, and for migrations.
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import REST_FRAMEWORK, config
+
+INSTALLED_APPS = [
+    'rest_framework',
+    'corsheaders',
+    'api',
+]
+
+MIDDLEWARE = [
+    'api.metrics.MetricsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'api.compression.CompressionMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'api.materialize.MaterializedResponseMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+TEMPLATES = []
+
+# English-only API: skip loading the translation catalogs on the first request
+USE_I18N = False
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': ['rest_framework.renderers.JSONRenderer'],
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    # Without django.contrib.auth: request.user is None (IsAdminUser denies)
+    'UNAUTHENTICATED_USER': None,
+}
+
+# Render the public endpoints once at startup (api/warmup.py)
+WARMUP_ON_START = config('WARMUP_ON_START', default='True') == 'True'
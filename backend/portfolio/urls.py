@@ -1,7 +1,10 @@
-from django.contrib import admin
+from django.apps import apps
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from api.views import ProfileViewSet, ProjectViewSet, EducationViewSet, CertificationViewSet, MessageViewSet, StatsViewSet
+from api import views as api_views
+from api.async_views import async_urls
+from api.views import ProfileViewSet, ProjectViewSet, EducationViewSet, CertificationViewSet, MessageViewSet, ArchivedMessageViewSet, StatsViewSet
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 
@@ -11,14 +14,33 @@ router.register(r'projects', ProjectViewSet, basename='project')
 router.register(r'education', EducationViewSet, basename='education')
 router.register(r'certifications', CertificationViewSet, basename='certification')
 router.register(r'messages', MessageViewSet, basename='message')
+router.register(r'archived-messages', ArchivedMessageViewSet, basename='archived-message')
 router.register(r'stats', StatsViewSet, basename='stats')
 
+# Mode ASGI : lectures publiques servies par les variantes asynchrones
+api_urls = async_urls(router.urls) if settings.ASYNC_READS else router.urls
+
 @api_view(['GET'])
 def api_root(request):
     return Response({'message': 'Portfolio API is running'})
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('api/', include(router.urls)),
+    path('api/assets/<str:name>', api_views.asset, name='asset'),
+    path('api/assets/<str:name>/<str:variant>', api_views.asset, name='asset-variant'),
+    path('api/cache/stats/', api_views.cache_stats, name='cache-stats'),
+    path('api/throttle/stats/', api_views.throttle_stats, name='throttle-stats'),
+    path('api/portfolio/', api_views.portfolio, name='portfolio'),
+    path('api/batch/', api_views.batch, name='batch'),
+    path('api/search/', api_views.search, name='search'),
+    path('api/tags/', api_views.tags, name='tags'),
+    path('api/export/', api_views.export, name='export'),
+    path('api/', include(api_urls)),
+    path('metrics', api_views.metrics, name='metrics'),
     path('', api_root, name='api-root'),
 ]
+
+# Absent du profil « api » (portfolio/settings_api.py)
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
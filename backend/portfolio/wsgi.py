@@ -3,3 +3,9 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio.settings')
 application = get_wsgi_application()
+
+# Préchauffe les caches, rejoue les messages restés dans le spool et démarre
+# leur flusher
+from api import ingest, warmup  # noqa: E402
+warmup.run()
+ingest.start()
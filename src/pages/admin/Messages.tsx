@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { Trash2, ArrowLeft, Mail, MailOpen } from 'lucide-react';
 import { Button } from '@components/ui/Button';
 import { Card, CardContent } from '@components/ui/Card';
-import { messagesAPI } from '@services/api';
+import { batchAPI, messagesAPI } from '@services/api';
 import type { Message } from '@/types';
 import Swal from 'sweetalert2';
 
@@ -72,6 +72,18 @@ export function AdminMessages() {
     }
   };
 
+  const handleMarkAllAsRead = async () => {
+    const unread = messages.filter(m => !m.read);
+    if (unread.length === 0) return;
+    try {
+      await batchAPI.run(unread.map(m => ({ method: 'PATCH', resource: 'messages', id: m.id, data: { read: true } })));
+      setMessages(messages.map(m => ({ ...m, read: true })));
+      if (selectedMessage) setSelectedMessage({ ...selectedMessage, read: true });
+    } catch (error) {
+      await Swal.fire('Erreur', 'Impossible de mettre à jour les messages', 'error');
+    }
+  };
+
   if (loading) {
     return (
       <div className="min-h-screen bg-gray-100 flex items-center justify-center">
@@ -92,7 +104,16 @@ export function AdminMessages() {
             <ArrowLeft size={18} />
           </Button>
           <h1 className="text-3xl font-bold">Messages Reçus</h1>
-          <span className="ml-auto bg-primary-700 text-white px-3 py-1 rounded-full text-sm">
+          <Button
+            variant="outline"
+            className="ml-auto"
+            onClick={handleMarkAllAsRead}
+            disabled={!messages.some(m => !m.read)}
+          >
+            <MailOpen size={18} className="mr-2" />
+            Tout marquer comme lu
+          </Button>
+          <span className="bg-primary-700 text-white px-3 py-1 rounded-full text-sm">
             {messages.length} message{messages.length > 1 ? 's' : ''}
           </span>
         </div>
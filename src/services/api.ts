@@ -1,5 +1,5 @@
 import axios from 'axios';
-import type { Project, Certification, Education, Message, Profile, Stats } from '../types';
+import type { Project, Certification, Education, Message, Profile, Stats, PortfolioSnapshot, SearchResponse, TagFacet, BatchOperation, BatchResponse } from '../types';
 
 const API_BASE_URL = 'https://portfolio-abdoul-salam-diallo.onrender.com/api';
 
@@ -67,6 +67,27 @@ export const statsAPI = {
   get: () => api.get<Stats>('/stats/'),
 };
 
+// Portfolio (profil, projets, formations, certifications et stats en une requête)
+export const portfolioAPI = {
+  get: () => api.get<PortfolioSnapshot>('/portfolio/'),
+};
+
+// Recherche plein texte (projets, certifications, formations)
+export const searchAPI = {
+  search: (q: string, kind?: string) => api.get<SearchResponse>('/search/', { params: { q, kind } }),
+};
+
+// Tags (facettes technologies / compétences)
+export const tagsAPI = {
+  getAll: (kind?: 'technology' | 'skill') => api.get<TagFacet[]>('/tags/', { params: { kind } }),
+};
+
+// Plusieurs opérations en une requête et une transaction
+export const batchAPI = {
+  run: (operations: BatchOperation[], atomic = true) =>
+    api.post<BatchResponse>('/batch/', { atomic, operations }),
+};
+
 // Image Upload
 export const uploadAPI = {
   uploadImage: (file: File) => {
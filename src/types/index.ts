@@ -1,8 +1,14 @@
+export interface ImageSrcset {
+  webp: string;
+  jpeg: string;
+}
+
 export interface Project {
   id: string;
   title: string;
   description: string;
   image: string;
+  imageSrcset?: ImageSrcset | null;
   technologies: string[];
   githubUrl?: string;
   liveUrl?: string;
@@ -18,6 +24,7 @@ export interface Certification {
   issueDate: string;
   expiryDate?: string;
   image: string;
+  imageSrcset?: ImageSrcset | null;
   credentialUrl?: string;
   skills: string[];
 }
@@ -53,6 +60,7 @@ export interface Profile {
   phone: string;
   location: string;
   avatar: string;
+  avatarSrcset?: ImageSrcset | null;
   cv?: string;
   socialLinks: Array<{
     platform: string;
@@ -85,12 +93,61 @@ export interface Stats {
   totalCertifications: number;
   totalEducation: number;
   totalMessages: number;
+  unreadMessages: number;
+  clients: number;
+  experience: number;
   technologies: Array<{
     name: string;
     count: number;
   }>;
 }
 
+export interface PortfolioSnapshot {
+  profile: Profile | null;
+  projects: Project[];
+  education: Education[];
+  certifications: Certification[];
+  stats: Stats | null;
+}
+
+export interface TagFacet {
+  name: string;
+  key: string;
+  projects: number;
+  certifications: number;
+}
+
+export interface SearchResult {
+  kind: 'project' | 'certification' | 'education';
+  id: number;
+  title: string;
+  snippet: string;
+  rank: number;
+}
+
+export interface SearchResponse {
+  query: string;
+  results: SearchResult[];
+}
+
+export interface BatchOperation {
+  method: 'GET' | 'POST' | 'PUT' | 'PATCH' | 'DELETE';
+  resource: 'profile' | 'projects' | 'education' | 'certifications' | 'messages' | 'stats';
+  id?: string | number;
+  data?: unknown;
+}
+
+export interface BatchResult {
+  status: number | null;
+  data: any;
+  skipped?: boolean;
+}
+
+export interface BatchResponse {
+  committed: boolean;
+  results: BatchResult[];
+}
+
 export interface AuthState {
   isAuthenticated: boolean;
   user: null | { id: string; email: string };